@@ -0,0 +1,68 @@
+"""
+Compares the greedy approximation of the Chamberlin-Courant rule (see
+:py:func:`~trivoting.rules.chamberlin_courant.chamberlin_courant_greedy`), with and without lazy evaluation, to the
+upper bound given by the linear relaxation of its ILP, in terms of number of covered voters and running time.
+
+Run from the root of the repository with:
+
+    python -m benchmarks.chamberlin_courant_greedy
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from prefsampling.approval import urn, resampling
+
+from trivoting.election.generate import generate_random_profile
+from trivoting.election.trichotomous_ballot import TrichotomousBallot
+from trivoting.election.trichotomous_profile import TrichotomousProfile
+from trivoting.rules.chamberlin_courant import (
+    chamberlin_courant_greedy,
+    chamberlin_courant_lp_bound,
+)
+
+
+def benchmark(num_alternatives: int, num_voters: int, max_size_selection: int):
+    profile = generate_random_profile(
+        num_alternatives,
+        num_voters,
+        lambda num_voters, num_candidates: urn(
+            num_voters, num_candidates, p=0.05, alpha=0.1
+        ),
+        lambda num_voters, num_candidates: resampling(
+            num_voters, num_candidates, phi=0.5, rel_size_central_vote=0.05
+        ),
+        lambda num_voters, num_candidates: resampling(
+            num_voters, num_candidates, phi=0.5, rel_size_central_vote=0.03
+        ),
+    )
+    approval_profile = TrichotomousProfile(
+        [TrichotomousBallot(approved=ballot.approved) for ballot in profile],
+        alternatives=profile.alternatives,
+    )
+    print(
+        f"{num_alternatives} alternatives, {num_voters} voters, "
+        f"max_size_selection={max_size_selection}"
+    )
+    print(f"{'Profile':<15}{'Method':<15}{'Covered':>10}{'Time (s)':>10}")
+    for name, p in (("trichotomous", profile), ("approval only", approval_profile)):
+        for method, lazy in (("greedy", False), ("lazy greedy", True)):
+            start = time.perf_counter()
+            selection = chamberlin_courant_greedy(p, max_size_selection, lazy=lazy)
+            duration = time.perf_counter() - start
+            print(
+                f"{name:<15}{method:<15}{p.num_covered_ballots(selection):>10}{duration:>10.2f}"
+            )
+        start = time.perf_counter()
+        bound = chamberlin_courant_lp_bound(p, max_size_selection)
+        duration = time.perf_counter() - start
+        print(f"{name:<15}{'LP bound':<15}{bound:>10.1f}{duration:>10.2f}")
+    print()
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    benchmark(100, 5000, 10)
+    benchmark(250, 30000, 20)
@@ -0,0 +1,82 @@
+"""
+Compares the formulations of the ILPs of the rules (see :py:class:`~trivoting.rules.ilp_schemes.ILPFormulation`) in
+terms of number of variables, number of constraints and solving time.
+
+Run from the root of the repository with:
+
+    python -m benchmarks.ilp_formulations
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from prefsampling.approval import urn, resampling
+
+from trivoting.election.generate import generate_random_profile
+from trivoting.rules.chamberlin_courant import ChamberlinCourantILPBuilder
+from trivoting.rules.ilp_schemes import ILPFormulation
+from trivoting.rules.max_net_support import MaxNetSupportILPBuilder
+from trivoting.rules.thiele import (
+    PAVScoreKraiczy2025,
+    PAVScoreTalmonPaige2021,
+    PAVScoreHervouin2025,
+    ApprovalThieleScore,
+    NetSupportThieleScore,
+)
+
+BUILDERS = {
+    "PAV (Kraiczy et al.)": PAVScoreKraiczy2025.ilp_builder,
+    "PAV (Talmon and Paige)": PAVScoreTalmonPaige2021.ilp_builder,
+    "PAV (Hervouin)": PAVScoreHervouin2025.ilp_builder,
+    "Approval Thiele": ApprovalThieleScore.ilp_builder,
+    "Net support Thiele": NetSupportThieleScore.ilp_builder,
+    "Max net support": MaxNetSupportILPBuilder,
+    "Chamberlin-Courant": ChamberlinCourantILPBuilder,
+}
+
+
+def benchmark(num_alternatives: int, num_voters: int, max_size_selection: int):
+    profile = generate_random_profile(
+        num_alternatives,
+        num_voters,
+        lambda num_voters, num_candidates: urn(
+            num_voters, num_candidates, p=0.5, alpha=0.1
+        ),
+        lambda num_voters, num_candidates: resampling(
+            num_voters, num_candidates, phi=0.5, rel_size_central_vote=0.5
+        ),
+        lambda num_voters, num_candidates: resampling(
+            num_voters, num_candidates, phi=0.5, rel_size_central_vote=0.3
+        ),
+    )
+    print(
+        f"{num_alternatives} alternatives, {num_voters} voters, "
+        f"max_size_selection={max_size_selection}"
+    )
+    print(
+        f"{'Rule':<25}{'Formulation':<12}{'Variables':>10}{'Constraints':>13}{'Time (s)':>10}"
+    )
+    for name, builder_class in BUILDERS.items():
+        for formulation in ILPFormulation:
+            builder = builder_class(
+                profile, max_size_selection, formulation=formulation
+            )
+            builder.init_vars()
+            builder.apply_constraints()
+            builder.set_objective()
+            start = time.perf_counter()
+            builder.solve()
+            duration = time.perf_counter() - start
+            print(
+                f"{name:<25}{formulation.value:<12}{builder.model.numVariables():>10}"
+                f"{builder.model.numConstraints():>13}{duration:>10.2f}"
+            )
+    print()
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    benchmark(20, 200, 5)
+    benchmark(30, 500, 8)
@@ -1,6 +1,8 @@
 from unittest import TestCase
 
-from trivoting.election.alternative import Alternative
+from trivoting.election.alternative import Alternative, AlternativeRegistry
+from trivoting.election.trichotomous_ballot import TrichotomousBallot
+from trivoting.election.trichotomous_profile import TrichotomousProfile
 
 
 class TestAlternative(TestCase):
@@ -11,3 +13,59 @@ class TestAlternative(TestCase):
 
         self.assertNotEqual(a, b)
         self.assertEqual(a, a2)
+        self.assertEqual(hash(a), hash(a2))
+        self.assertEqual(a, "a")
+
+        a2.name = "b"
+        self.assertEqual(a2, b)
+        self.assertEqual(hash(a2), hash(b))
+
+    def test_registry(self):
+        alternatives = [Alternative(str(i)) for i in range(5)]
+        registry = AlternativeRegistry(alternatives)
+
+        self.assertEqual(len(registry), 5)
+        self.assertEqual(list(registry), alternatives)
+        for i, alt in enumerate(alternatives):
+            self.assertEqual(registry.index(alt), i)
+            self.assertIs(registry.alternative(i), alt)
+            self.assertIs(registry.get_by_name(alt.name), alt)
+            self.assertIs(registry.intern(Alternative(alt.name)), alt)
+        self.assertIsNone(registry.get_index(Alternative("x")))
+        self.assertIsNone(registry.get_by_name("x"))
+        self.assertRaises(KeyError, registry.index, Alternative("x"))
+
+        new_alt = registry.intern_name("x")
+        self.assertEqual(registry.index(new_alt), 5)
+        self.assertIs(registry.intern_name("x"), new_alt)
+        self.assertEqual(registry.register(Alternative("x")), 5)
+
+        mask = registry.mask([alternatives[1], new_alt, Alternative("y")])
+        self.assertEqual(mask, 0b100010)
+        self.assertEqual(
+            list(registry.alternatives_from_mask(mask)), [alternatives[1], new_alt]
+        )
+
+    def test_profile_registry(self):
+        alternatives = [Alternative(name) for name in "dcab"]
+        profile = TrichotomousProfile(
+            [TrichotomousBallot(approved=alternatives[:2])], alternatives=alternatives
+        )
+        self.assertEqual(list(profile.registry), sorted(alternatives))
+        self.assertIs(profile.get_alternative_by_name("c"), alternatives[1])
+        self.assertIsNone(profile.get_alternative_by_name("e"))
+
+        new_alt = Alternative("0")
+        profile.alternatives.add(new_alt)
+        self.assertEqual(profile.registry.index(new_alt), 4)
+        self.assertIs(profile.get_alternative_by_name("0"), new_alt)
+
+        other_alts = [Alternative("1"), Alternative("2"), Alternative("3")]
+        profile.alternatives.update(other_alts[:1])
+        profile.alternatives |= {other_alts[1]}
+        self.assertIs(profile.get_alternative_by_name("1"), other_alts[0])
+        self.assertIs(profile.get_alternative_by_name("2"), other_alts[1])
+        profile.alternatives = alternatives + [other_alts[2]]
+        self.assertEqual(profile.registry.index(other_alts[2]), 7)
+        self.assertIs(profile.get_alternative_by_name("3"), other_alts[2])
+        self.assertIsNone(profile.get_alternative_by_name("1"))
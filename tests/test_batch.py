@@ -0,0 +1,56 @@
+import random
+from unittest import TestCase
+
+from tests.random_instances import get_random_profile
+from trivoting.election import Selection
+from trivoting.election.batch import BallotTypeMatrices, score_selections
+
+
+class TestBatchScoring(TestCase):
+    def test_score_selections(self):
+        for _ in range(20):
+            profile = get_random_profile(8, 30)
+            alternatives = sorted(profile.alternatives)
+            selections = []
+            for _ in range(50):
+                selected = random.sample(alternatives, random.randint(0, 5))
+                if random.random() < 0.5:
+                    selections.append(Selection(selected, implicit_reject=True))
+                else:
+                    others = [a for a in alternatives if a not in selected]
+                    rejected = random.sample(others, random.randint(0, len(others)))
+                    selections.append(
+                        Selection(selected, rejected, implicit_reject=False)
+                    )
+            for p in [profile, profile.as_multiprofile()]:
+                matrices = BallotTypeMatrices(p)
+                self.assertEqual(int(matrices.weights.sum()), p.num_ballots())
+                scores = score_selections(matrices, selections)
+                self.assertEqual(
+                    list(scores.selection_support()),
+                    [p.selection_support(s) for s in selections],
+                )
+                self.assertEqual(
+                    list(scores.num_covered_ballots()),
+                    [p.num_covered_ballots(s) for s in selections],
+                )
+                for s, selection in enumerate(selections):
+                    for b, ballot in enumerate(scores.ballots):
+                        self.assertEqual(
+                            scores.approved_rejected[s, b],
+                            sum(1 for a in ballot.approved if selection.is_rejected(a)),
+                        )
+                        self.assertEqual(
+                            scores.disapproved_rejected[s, b],
+                            sum(
+                                1
+                                for a in ballot.disapproved
+                                if selection.is_rejected(a)
+                            ),
+                        )
+
+    def test_score_no_selection(self):
+        profile = get_random_profile(5, 10)
+        scores = score_selections(profile, [])
+        self.assertEqual(len(scores.selection_support()), 0)
+        self.assertEqual(len(scores.num_covered_ballots()), 0)
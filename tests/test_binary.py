@@ -0,0 +1,81 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from trivoting.election import (
+    TrichotomousProfile,
+    TrichotomousSparseProfile,
+    Alternative,
+    TrichotomousBallot,
+)
+from trivoting.election.binary import write_binary_profile, parse_binary_profile
+from trivoting.election.pabulib import parse_pabulib
+from trivoting.election.preflib import parse_preflib
+
+
+class TestBinaryProfile(TestCase):
+    def write_and_parse(self, profile):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "profile.tvp")
+            write_binary_profile(profile, file_path)
+            return parse_binary_profile(file_path)
+
+    def test_round_trip(self):
+        alternatives = [Alternative(f"a{i}") for i in range(5)]
+        profile = TrichotomousProfile(
+            [
+                TrichotomousBallot(
+                    approved=alternatives[:2], disapproved=[alternatives[4]]
+                ),
+                TrichotomousBallot(
+                    approved=alternatives[:2], disapproved=[alternatives[4]]
+                ),
+                TrichotomousBallot(disapproved=alternatives[1:3]),
+                TrichotomousBallot(),
+            ],
+            alternatives=alternatives,
+            max_size_selection=3,
+        )
+        binary_profile = self.write_and_parse(profile)
+        self.assertIsInstance(binary_profile, TrichotomousSparseProfile)
+        self.assertEqual(binary_profile.alternatives, profile.alternatives)
+        self.assertEqual(binary_profile.max_size_selection, 3)
+        self.assertEqual(binary_profile.num_ballots(), 4)
+        self.assertEqual(
+            binary_profile.approval_disapproval_score_dict(),
+            profile.approval_disapproval_score_dict(),
+        )
+        multiprofile = profile.as_multiprofile()
+        for ballot in multiprofile:
+            self.assertEqual(
+                binary_profile.multiplicity(ballot), multiprofile.multiplicity(ballot)
+            )
+        self.assertFalse(binary_profile.weights.flags.writeable)
+
+        empty_profile = self.write_and_parse(TrichotomousProfile())
+        self.assertEqual(empty_profile.num_ballots(), 0)
+        self.assertIsNone(empty_profile.max_size_selection)
+        self.assertEqual(empty_profile.alternatives, set())
+
+    def test_round_trip_parsed_files(self):
+        current_file_path = os.path.dirname(os.path.realpath(__file__))
+        data_path = os.path.join(current_file_path, "data")
+        for profile in [
+            parse_pabulib(os.path.join(data_path, "pabulib_approval.pb"), sparse=True),
+            parse_preflib(os.path.join(data_path, "preflib_cat_instance.cat")),
+        ]:
+            binary_profile = self.write_and_parse(profile)
+            self.assertEqual(binary_profile.num_ballots(), profile.num_ballots())
+            self.assertEqual(binary_profile.alternatives, profile.alternatives)
+            self.assertEqual(
+                binary_profile.max_size_selection, profile.max_size_selection
+            )
+            self.assertEqual(binary_profile.support_dict(), profile.support_dict())
+
+    def test_invalid_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "profile.tvp")
+            with open(file_path, "wb") as f:
+                f.write(b"not a profile" * 10)
+            with self.assertRaises(ValueError):
+                parse_binary_profile(file_path)
@@ -16,3 +16,21 @@ class TestPabulib(TestCase):
         for ballot in profile:
             self.assertEqual(ballot.disapproved, set())
             self.assertGreater(len(ballot.approved), 0)
+
+    def test_pabulib_read_sparse(self):
+        current_file_path = os.path.dirname(os.path.realpath(__file__))
+        pabulib_file_path = os.path.join(
+            current_file_path, "data", "pabulib_approval.pb"
+        )
+
+        profile = parse_pabulib(pabulib_file_path)
+        sparse_profile = parse_pabulib(pabulib_file_path, sparse=True)
+        self.assertEqual(sparse_profile.num_ballots(), 2066)
+        self.assertEqual(sparse_profile.max_size_selection, profile.max_size_selection)
+        self.assertEqual(
+            sparse_profile.approval_score_dict(), profile.approval_score_dict()
+        )
+        self.assertEqual(sparse_profile.disapproval_score_dict(), {})
+        self.assertEqual(
+            len(sparse_profile.approved_indices), sum(len(b) for b in profile)
+        )
@@ -13,3 +13,22 @@ class TestPreflib(TestCase):
 
         profile = parse_preflib(preflib_file_path)
         self.assertEqual(profile.num_ballots(), 100)
+
+    def test_preflib_read_sparse(self):
+        current_file_path = os.path.dirname(os.path.realpath(__file__))
+        preflib_file_path = os.path.join(
+            current_file_path, "data", "preflib_cat_instance.cat"
+        )
+
+        profile = parse_preflib(preflib_file_path)
+        sparse_profile = parse_preflib(preflib_file_path, sparse=True)
+        self.assertEqual(sparse_profile.num_ballots(), 100)
+        self.assertEqual(sparse_profile.alternatives, profile.alternatives)
+        self.assertEqual(
+            sparse_profile.approval_disapproval_score_dict(),
+            profile.approval_disapproval_score_dict(),
+        )
+        for ballot in profile:
+            self.assertEqual(
+                sparse_profile.multiplicity(ballot), profile.multiplicity(ballot)
+            )
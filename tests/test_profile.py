@@ -2,8 +2,15 @@ from unittest import TestCase
 
 from tests.random_instances import get_random_profile
 from trivoting.election.alternative import Alternative
-from trivoting.election.trichotomous_ballot import TrichotomousBallot
-from trivoting.election.trichotomous_profile import TrichotomousProfile
+from trivoting.election.trichotomous_ballot import TrichotomousBallot, FrozenTrichotomousBallot
+from trivoting.election.selection import Selection
+from trivoting.election.trichotomous_profile import (
+    TrichotomousProfile,
+    TrichotomousMultiProfile,
+    TrichotomousMatrixProfile,
+    TrichotomousSparseProfile,
+    ProfileAggregates,
+)
 
 
 class TestProfile(TestCase):
@@ -39,7 +46,13 @@ class TestProfile(TestCase):
     def test_scores(self):
         for _ in range(50):
             raw_profile = get_random_profile(5, 3)
-            for profile in [raw_profile, raw_profile.as_multiprofile()]:
+            for profile in [
+                raw_profile,
+                raw_profile.as_multiprofile(),
+                raw_profile.as_matrix_profile(),
+                raw_profile.as_sparse_profile(),
+                raw_profile.as_bitmask_multiprofile(),
+            ]:
                 for alt in profile.alternatives:
                     app_score = profile.approval_score(alt)
                     disapp_score = profile.disapproval_score(alt)
@@ -91,3 +104,260 @@ class TestProfile(TestCase):
                     profile.approval_disapproval_score_dict(),
                     reconstructed_app_disapp_dict,
                 )
+
+    def test_matrix_profile(self):
+        for _ in range(50):
+            profile = get_random_profile(6, 8)
+            multiprofile = profile.as_multiprofile()
+            for matrix_profile in [
+                profile.as_matrix_profile(),
+                multiprofile.as_matrix_profile(),
+                profile.as_sparse_profile(),
+                multiprofile.as_sparse_profile(),
+            ]:
+                self.assertEqual(matrix_profile.num_ballots(), profile.num_ballots())
+                self.assertEqual(matrix_profile.alternatives, profile.alternatives)
+                self.assertEqual(len(matrix_profile), len(multiprofile))
+                for ballot in profile:
+                    self.assertEqual(
+                        matrix_profile.multiplicity(ballot),
+                        multiprofile.multiplicity(ballot.freeze()),
+                    )
+                self.assertEqual(
+                    matrix_profile.commonly_approved_alternatives(),
+                    profile.commonly_approved_alternatives(),
+                )
+                self.assertEqual(
+                    matrix_profile.commonly_disapproved_alternatives(),
+                    profile.commonly_disapproved_alternatives(),
+                )
+                for selection in profile.all_feasible_selections(3):
+                    self.assertEqual(
+                        matrix_profile.selection_support(selection),
+                        profile.selection_support(selection),
+                    )
+                    self.assertEqual(
+                        matrix_profile.num_covered_ballots(selection),
+                        profile.num_covered_ballots(selection),
+                    )
+                converted = matrix_profile.as_multiprofile()
+                self.assertEqual(converted.num_ballots(), profile.num_ballots())
+                self.assertEqual(converted.support_dict(), profile.support_dict())
+                for ballot in converted:
+                    self.assertEqual(
+                        converted.multiplicity(ballot),
+                        matrix_profile.multiplicity(ballot),
+                    )
+                self.assertEqual(
+                    matrix_profile.as_profile().num_ballots(), profile.num_ballots()
+                )
+            self.assertEqual(
+                list(profile.as_matrix_profile().as_profile()), list(profile)
+            )
+            self.assertEqual(
+                list(profile.as_sparse_profile().as_profile()), list(profile)
+            )
+
+    def test_matrix_profile_add_ballot(self):
+        for profile_class in [TrichotomousMatrixProfile, TrichotomousSparseProfile]:
+            self.check_array_profile_add_ballot(profile_class)
+
+    def check_array_profile_add_ballot(self, profile_class):
+        alternatives = [Alternative(str(i)) for i in range(4)]
+        profile = profile_class(alternatives=alternatives[:2])
+        self.assertEqual(profile.num_ballots(), 0)
+        self.assertEqual(profile.commonly_approved_alternatives(), set())
+        profile.add_ballot(TrichotomousBallot(approved=alternatives[:2]))
+        profile.add_ballot(
+            TrichotomousBallot(approved=alternatives[:1], disapproved=alternatives[3:])
+        )
+        profile.add_ballot(TrichotomousBallot(approved=alternatives[:2]), weight=2)
+        self.assertEqual(profile.num_ballots(), 4)
+        self.assertEqual(len(profile), 2)
+        self.assertEqual(
+            profile.multiplicity(TrichotomousBallot(approved=alternatives[:2])), 3
+        )
+        self.assertEqual(profile.support(alternatives[3]), -1)
+        self.assertEqual(profile.support(alternatives[2]), 0)
+        self.assertEqual(profile.commonly_approved_alternatives(), {alternatives[0]})
+        selection = Selection(selected=[alternatives[1], alternatives[3]])
+        self.assertEqual(profile.selection_support(selection), 2)
+        self.assertEqual(profile.num_covered_ballots(selection), 3)
+
+    def test_bitmask_multiprofile(self):
+        for _ in range(50):
+            profile = get_random_profile(6, 8)
+            bitmask_profile = profile.as_bitmask_multiprofile()
+            self.assertEqual(bitmask_profile.num_ballots(), profile.num_ballots())
+            self.assertEqual(bitmask_profile.alternatives, profile.alternatives)
+            self.assertEqual(len(bitmask_profile), len(profile.as_multiprofile()))
+            self.assertEqual(
+                bitmask_profile.commonly_approved_alternatives(),
+                profile.commonly_approved_alternatives(),
+            )
+            self.assertEqual(
+                bitmask_profile.commonly_disapproved_alternatives(),
+                profile.commonly_disapproved_alternatives(),
+            )
+            for selection in profile.all_feasible_selections(3):
+                self.assertEqual(
+                    bitmask_profile.selection_support(selection),
+                    profile.selection_support(selection),
+                )
+                self.assertEqual(
+                    bitmask_profile.num_covered_ballots(selection),
+                    profile.num_covered_ballots(selection),
+                )
+
+    def test_cached_scores(self):
+        def check_scores(profile):
+            expected = ProfileAggregates.from_profile(profile)
+            self.assertEqual(profile.num_ballots(), expected.num_ballots)
+            self.assertEqual(profile.approval_score_dict(), expected.approval_scores)
+            self.assertEqual(
+                profile.disapproval_score_dict(), expected.disapproval_scores
+            )
+            self.assertEqual(profile.support_dict(), expected.support_dict())
+            for alt in profile.alternatives:
+                self.assertEqual(profile.support(alt), expected.support(alt))
+
+        alternatives = [Alternative(str(i)) for i in range(5)]
+        ballots = [
+            TrichotomousBallot(approved=alternatives[:2], disapproved=alternatives[3:]),
+            TrichotomousBallot(approved=alternatives[2:4]),
+            TrichotomousBallot(disapproved=alternatives[:3]),
+        ]
+        frozen_ballots = [ballot.freeze() for ballot in ballots]
+        profile = TrichotomousProfile(ballots[:1], alternatives=alternatives)
+        check_scores(profile)
+        profile.append(ballots[1])
+        check_scores(profile)
+        profile.extend(ballots)
+        check_scores(profile)
+        profile.insert(1, ballots[2])
+        check_scores(profile)
+        profile[0] = ballots[1]
+        check_scores(profile)
+        profile[1:3] = [ballots[0]]
+        check_scores(profile)
+        del profile[0]
+        check_scores(profile)
+        del profile[:1]
+        check_scores(profile)
+        profile.remove(ballots[1])
+        check_scores(profile)
+        profile.pop()
+        check_scores(profile)
+        profile += ballots
+        check_scores(profile)
+        profile *= 2
+        check_scores(profile)
+        profile[0].add_approved(alternatives[4])
+        check_scores(profile)
+        profile[1].disapproved = alternatives[:1]
+        check_scores(profile)
+        profile[2].approved.add(alternatives[0])
+        check_scores(profile)
+        profile[1].disapproved.discard(alternatives[0])
+        check_scores(profile)
+        profile[0].approved |= set(alternatives[2:4])
+        check_scores(profile)
+        profile[0].disapproved.clear()
+        check_scores(profile)
+        profile[2].approved.update(alternatives[3:])
+        check_scores(profile)
+
+        # Modifying a ballot only invalidates the cache of the profiles containing it
+        other_profile = TrichotomousProfile(
+            [TrichotomousBallot(approved=alternatives[:1])], alternatives=alternatives
+        )
+        other_aggregates = other_profile._get_aggregates()
+        profile[0].approved.pop()
+        self.assertIs(other_profile._get_aggregates(), other_aggregates)
+        check_scores(profile)
+        profile.clear()
+        check_scores(profile)
+
+        # The ballots have been modified in place above, the multiprofile uses their initial version
+        multiprofile = TrichotomousMultiProfile(frozen_ballots, alternatives=alternatives)
+        check_scores(multiprofile)
+        multiprofile.add_ballot(frozen_ballots[0])
+        check_scores(multiprofile)
+        multiprofile[frozen_ballots[1]] = 4
+        check_scores(multiprofile)
+        multiprofile[frozen_ballots[2]] = 0
+        check_scores(multiprofile)
+        multiprofile.update([frozen_ballots[0], frozen_ballots[2]])
+        check_scores(multiprofile)
+        multiprofile.update({frozen_ballots[1]: 3})
+        check_scores(multiprofile)
+        multiprofile.subtract({frozen_ballots[1]: 2})
+        check_scores(multiprofile)
+        del multiprofile[frozen_ballots[0]]
+        check_scores(multiprofile)
+        multiprofile.pop(frozen_ballots[1])
+        check_scores(multiprofile)
+        multiprofile += TrichotomousMultiProfile(frozen_ballots)
+        check_scores(multiprofile)
+        copied = multiprofile.copy()
+        copied.add_ballot(frozen_ballots[2])
+        check_scores(copied)
+        check_scores(multiprofile)
+        multiprofile.clear()
+        check_scores(multiprofile)
+
+    def test_sparse_profile_slicing(self):
+        for _ in range(20):
+            profile = get_random_profile(6, 10)
+            sparse_profile = profile.as_sparse_profile()
+            self.assertEqual(sparse_profile.num_rows, 10)
+            for i, ballot in enumerate(profile):
+                self.assertEqual(set(sparse_profile[i].approved), ballot.approved)
+                self.assertEqual(set(sparse_profile[i].disapproved), ballot.disapproved)
+            for rows in [slice(2, 7), slice(None, None, 3), [0, 4, 9], slice(3, 3)]:
+                sub_profile = sparse_profile[rows]
+                expected = TrichotomousProfile(
+                    [profile[i] for i in range(10)[rows]]
+                    if isinstance(rows, slice)
+                    else [profile[i] for i in rows]
+                )
+                self.assertEqual(sub_profile.num_ballots(), expected.num_ballots())
+                self.assertEqual(sub_profile.support_dict(), expected.support_dict())
+                self.assertEqual(list(sub_profile.as_profile()), list(expected))
+
+    def test_as_multiprofile_merges_ballots(self):
+        alternatives = [Alternative(str(i)) for i in range(10)]
+        profile = TrichotomousProfile(alternatives=alternatives)
+        for i in range(100):
+            approved = alternatives[: i % 4 + 1]
+            if i % 2:
+                approved = reversed(approved)
+            profile.append(
+                TrichotomousBallot(approved=approved, disapproved=alternatives[8:])
+            )
+        multiprofile = profile.as_multiprofile()
+        self.assertEqual(len(multiprofile), 4)
+        self.assertEqual(multiprofile.num_ballots(), 100)
+        self.assertEqual(multiprofile.support_dict(), profile.support_dict())
+        for ballot in multiprofile:
+            self.assertEqual(multiprofile.multiplicity(ballot), 25)
+
+    def test_multiplicity_of_unknown_alternatives(self):
+        alternatives = [Alternative(str(i)) for i in range(3)]
+        unknown = Alternative("unknown")
+        profile = TrichotomousProfile(
+            [TrichotomousBallot(approved=alternatives[:1]) for _ in range(2)],
+            alternatives=alternatives,
+        )
+        for other_profile in (
+            profile.as_multiprofile(),
+            TrichotomousMatrixProfile(profile),
+            TrichotomousSparseProfile(profile),
+        ):
+            self.assertEqual(other_profile.multiplicity(FrozenTrichotomousBallot(approved=alternatives[:1])), 2)
+            for ballot in (
+                FrozenTrichotomousBallot(approved=[alternatives[0], unknown]),
+                FrozenTrichotomousBallot(approved=alternatives[:1], disapproved=[unknown]),
+            ):
+                self.assertEqual(other_profile.multiplicity(ballot), 0)
+                self.assertNotIn(ballot, other_profile)
@@ -3,7 +3,15 @@ from unittest import TestCase
 
 from tests.random_instances import get_random_profile
 from trivoting.election import TrichotomousProfile, Selection, Alternative, TrichotomousBallot
-from trivoting.rules.chamberlin_courant import chamberlin_courant, chamberlin_courant_brute_force
+from trivoting.rules.chamberlin_courant import (
+    chamberlin_courant,
+    chamberlin_courant_brute_force,
+    chamberlin_courant_size_sweep,
+    ChamberlinCourantILPBuilder,
+    chamberlin_courant_greedy,
+    chamberlin_courant_lp_bound,
+)
+from trivoting.rules.ilp_schemes import ILPFormulation, ILPSolver, ilp_optimiser_rule
 
 
 class TestChamberlinCourant(TestCase):
@@ -59,4 +67,125 @@ class TestChamberlinCourant(TestCase):
                 res1_coverage = profile.num_covered_ballots(res1)
                 res2 = chamberlin_courant_brute_force(profile, max_size, resoluteness=True)
                 res2_coverage = profile.num_covered_ballots(res1)
-                self.assertEqual(res1_coverage, res2_coverage, f"Failure CC comparing to brute-force: {profile}, k={max_size}, bf={res2} (c={res1_coverage}), ilp={res1} (c={res2_coverage})")
\ No newline at end of file
+                self.assertEqual(res1_coverage, res2_coverage, f"Failure CC comparing to brute-force: {profile}, k={max_size}, bf={res2} (c={res1_coverage}), ilp={res1} (c={res2_coverage})")
+
+    def test_cc_on_multiprofile(self):
+        a = Alternative("a")
+        b = Alternative("b")
+        profile = TrichotomousProfile(
+            [TrichotomousBallot(approved=[b]) for _ in range(2)]
+            + [TrichotomousBallot(approved=[a]) for _ in range(3)],
+            alternatives=[a, b],
+        )
+        for p in [profile, profile.as_multiprofile()]:
+            builder = ChamberlinCourantILPBuilder(p, 1)
+            builder.init_vars()
+            self.assertEqual(len(builder.ballot_types), 2)
+            self.assertEqual(sorted(m for _, m in builder.ballot_types), [2, 3])
+            self.assertEqual(chamberlin_courant(p, 1), Selection([a], implicit_reject=True))
+            self.assertEqual(
+                chamberlin_courant(p, 1, resoluteness=False),
+                [Selection([a], implicit_reject=True)],
+            )
+
+    def test_cc_formulations_with_brute_force(self):
+        for _ in range(20):
+            profile = get_random_profile(5, 8)
+            max_size = random.randint(1, len(profile.alternatives))
+            brute_force = chamberlin_courant_brute_force(profile, max_size)
+            for formulation in ILPFormulation:
+                builder = ChamberlinCourantILPBuilder(
+                    profile, max_size, formulation=formulation
+                )
+                res = ilp_optimiser_rule(builder)
+                self.assertEqual(
+                    profile.num_covered_ballots(res),
+                    profile.num_covered_ballots(brute_force),
+                    f"Failure with {formulation} on: {profile}, k={max_size}",
+                )
+
+    def test_cc_warm_start(self):
+        for _ in range(20):
+            profile = get_random_profile(6, 30)
+            max_size = random.randint(1, len(profile.alternatives))
+            greedy = chamberlin_courant_greedy(profile, max_size)
+            self.assertLessEqual(len(greedy), max_size)
+            res = chamberlin_courant(profile, max_size, warm_start=True)
+            self.assertLessEqual(profile.num_covered_ballots(greedy), profile.num_covered_ballots(res))
+            self.assertEqual(
+                profile.num_covered_ballots(res),
+                profile.num_covered_ballots(chamberlin_courant_brute_force(profile, max_size)),
+                f"Failure with warm-started CC on: {profile}, k={max_size}",
+            )
+
+    def test_cc_greedy(self):
+        for _ in range(20):
+            profile = get_random_profile(6, 30)
+            max_size = random.randint(1, len(profile.alternatives))
+            greedy = chamberlin_courant_greedy(profile, max_size)
+            self.assertLessEqual(len(greedy), max_size)
+            self.assertEqual(greedy, chamberlin_courant_greedy(profile, max_size, lazy=True))
+            optimum = profile.num_covered_ballots(chamberlin_courant_brute_force(profile, max_size))
+            self.assertLessEqual(profile.num_covered_ballots(greedy), optimum)
+            self.assertLessEqual(optimum, chamberlin_courant_lp_bound(profile, max_size) + 1e-6)
+
+            # Without disapprovals, the lazy evaluation is used
+            approval_profile = TrichotomousProfile(
+                [TrichotomousBallot(approved=ballot.approved) for ballot in profile],
+                alternatives=profile.alternatives,
+            )
+            self.assertEqual(
+                chamberlin_courant_greedy(approval_profile, max_size),
+                chamberlin_courant_greedy(approval_profile, max_size, lazy=True),
+            )
+
+        # Ties are broken lexicographically, and the greedy selection is not optimal
+        alternatives = [Alternative(str(i)) for i in range(3)]
+        profile = TrichotomousProfile(
+            [TrichotomousBallot(approved=[alternatives[0], alternatives[1]])] * 2
+            + [TrichotomousBallot(approved=[alternatives[1]])]
+            + [TrichotomousBallot(approved=[alternatives[0], alternatives[2]])] * 2
+            + [TrichotomousBallot(approved=[alternatives[2]])],
+            alternatives=alternatives,
+        )
+        for lazy in (False, True):
+            greedy = chamberlin_courant_greedy(profile, 2, lazy=lazy)
+            self.assertEqual(greedy.selected, [alternatives[0], alternatives[1]])
+            self.assertEqual(profile.num_covered_ballots(greedy), 5)
+        self.assertEqual(profile.num_covered_ballots(chamberlin_courant(profile, 2)), 6)
+
+    def test_cc_solvers(self):
+        for _ in range(10):
+            profile = get_random_profile(5, 20)
+            max_size = random.randint(1, len(profile.alternatives))
+            brute_force = chamberlin_courant_brute_force(profile, max_size, resoluteness=False)
+            for solver_name in ILPSolver:
+                for warm_start in [None, chamberlin_courant_greedy(profile, max_size)]:
+                    builder = ChamberlinCourantILPBuilder(
+                        profile, max_size, solver_name=solver_name, warm_start=warm_start
+                    )
+                    res = ilp_optimiser_rule(builder, resoluteness=False)
+                    self.assertEqual(
+                        {frozenset(s.selected) for s in res},
+                        {frozenset(s.selected) for s in brute_force},
+                        f"Failure with {solver_name} on: {profile}, k={max_size}",
+                    )
+
+    def test_cc_size_sweep(self):
+        for _ in range(10):
+            profile = get_random_profile(6, 20)
+            max_size = random.randint(1, len(profile.alternatives))
+            sweep = chamberlin_courant_size_sweep(profile, max_size)
+            irresolute_sweep = chamberlin_courant_size_sweep(profile, max_size, resoluteness=False)
+            self.assertEqual(sorted(sweep), list(range(1, max_size + 1)))
+            for size in range(1, max_size + 1):
+                self.assertEqual(
+                    profile.num_covered_ballots(sweep[size]),
+                    profile.num_covered_ballots(chamberlin_courant(profile, size)),
+                    f"Failure with CC size sweep on: {profile}, k={size}",
+                )
+                self.assertEqual(
+                    {frozenset(s.selected) for s in irresolute_sweep[size]},
+                    {frozenset(s.selected) for s in chamberlin_courant(profile, size, resoluteness=False)},
+                    f"Failure with irresolute CC size sweep on: {profile}, k={size}",
+                )
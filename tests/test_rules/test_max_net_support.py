@@ -4,7 +4,7 @@ from unittest import TestCase
 from tests.random_instances import get_random_profile
 from trivoting.election import TrichotomousProfile, Selection, Alternative, TrichotomousBallot
 from trivoting.rules import max_net_support, thiele_method
-from trivoting.rules.max_net_support import max_net_support_ilp
+from trivoting.rules.max_net_support import max_net_support_ilp, max_net_support_selections
 from trivoting.rules.thiele import NetSupportThieleScore
 
 
@@ -51,5 +51,51 @@ class TestMaxNetSupport(TestCase):
                 )
                 self.assertLessEqual(len(res3), max_size, f"Failure with Max net support[Direct] on: {profile}, k={max_size}")
 
+                res4 = max_net_support_ilp(
+                    profile, max_size, resoluteness=True, warm_start=True
+                )
+                self.assertEqual(profile.selection_support(res3), profile.selection_support(res4), f"Failure with Max net support[Direct] and Max net support[ILP, warm start] on: {profile}, k={max_size}: r3={res3}, r4={res4}")
+
                 self.assertEqual(profile.selection_support(res1), profile.selection_support(res2), f"Failure with Max net support[Thiele] and Max net support[ILP] on: {profile}, k={max_size}: r1={res1}, r2={res2}")
                 self.assertEqual(profile.selection_support(res1), profile.selection_support(res3), f"Failure with Max net support[Thiele] and Max net support[Direct] on: {profile}, k={max_size}: r1={res1}, r3={res3}")
+
+    def test_max_net_support_irresolute(self):
+        for _ in range(30):
+            profile = get_random_profile(random.randint(2, 6), 10)
+            max_size = random.randint(1, len(profile.alternatives))
+            initial_selection = Selection(implicit_reject=False)
+            if random.random() < 0.5:
+                alternatives = list(profile.alternatives)
+                initial_selection.add_selected(alternatives[0])
+                initial_selection.add_rejected(alternatives[-1])
+            res = max_net_support(
+                profile, max_size, initial_selection=initial_selection.copy(), resoluteness=False
+            )
+            res_ilp = max_net_support_ilp(
+                profile, max_size, initial_selection=initial_selection.copy(), resoluteness=False
+            )
+            self.assertEqual(len(res), len(set(frozenset(s.selected) for s in res)))
+            self.assertEqual(
+                set(frozenset(s.selected) for s in res),
+                set(frozenset(s.selected) for s in res_ilp),
+                f"Failure with irresolute Max net support on: {profile}, k={max_size}",
+            )
+            self.assertEqual(
+                res[0], max_net_support(profile, max_size, initial_selection=initial_selection.copy())
+            )
+
+        # Tied alternatives at the cut-off
+        alternatives = [Alternative(str(i)) for i in range(12)]
+        profile = TrichotomousProfile(
+            [TrichotomousBallot(approved=alternatives[:2]) for _ in range(3)]
+            + [TrichotomousBallot(approved=alternatives[2:10])],
+            alternatives=alternatives,
+        )
+        res = max_net_support(profile, 5, resoluteness=False)
+        self.assertEqual(len(res), 56)
+        for selection in res:
+            self.assertIn(alternatives[0], selection)
+            self.assertIn(alternatives[1], selection)
+        self.assertEqual(len(max_net_support(profile, 5, resoluteness=False, max_num_selections=10)), 10)
+        selections = max_net_support_selections(profile, 5)
+        self.assertEqual(next(selections), res[0])
@@ -2,12 +2,20 @@ import random
 
 from unittest import TestCase
 
+import trivoting.fractions
+
 from tests.random_instances import get_random_profile
 from trivoting.election.alternative import Alternative
 from trivoting.election.trichotomous_ballot import TrichotomousBallot
 from trivoting.election.trichotomous_profile import TrichotomousProfile
-from trivoting.rules.phragmen import sequential_phragmen
+from trivoting.rules.phragmen import (
+    sequential_phragmen,
+    sequential_phragmen_size_sweep,
+    PhragmenLoadTracker,
+    PhragmenVoter,
+)
 from trivoting.election.selection import Selection
+from trivoting.fractions import frac
 
 
 class TestPhragmen(TestCase):
@@ -19,6 +27,165 @@ class TestPhragmen(TestCase):
             res = sequential_phragmen(profile, max_size, resoluteness=True)
             self.assertLessEqual(len(res), max_size, f"Failure with Phragmén on: {profile}, k={max_size}")
 
+    def test_phragmen_on_multiprofile(self):
+        for _ in range(20):
+            profile = get_random_profile(10, 30)
+            max_size = random.randint(1, len(profile.alternatives))
+            self.assertEqual(
+                sequential_phragmen(profile, max_size, resoluteness=False),
+                sequential_phragmen(
+                    profile.as_multiprofile(), max_size, resoluteness=False
+                ),
+            )
+
+    def test_phragmen_load_tracker(self):
+        for _ in range(20):
+            profile = get_random_profile(10, 30)
+            voters = [PhragmenVoter(b, 0, profile.multiplicity(b)) for b in profile]
+            supporters = {}
+            opponents = {}
+            for alt in profile.alternatives:
+                supps = [i for i, v in enumerate(voters) if alt in v.ballot.approved]
+                opps = [i for i, v in enumerate(voters) if alt in v.ballot.disapproved]
+                if supps or opps:
+                    supporters[alt] = supps
+                    opponents[alt] = opps
+            tracker = PhragmenLoadTracker(voters, supporters, opponents)
+            alternatives = set(supporters)
+            while alternatives:
+                expected = {}
+                for alt in alternatives:
+                    for considered_voters, veto in (
+                        (supporters[alt], False),
+                        (opponents[alt], True),
+                    ):
+                        if considered_voters:
+                            expected[(alt, veto)] = frac(
+                                sum(voters[i].total_load() for i in considered_voters)
+                                + 1,
+                                len(considered_voters),
+                            )
+                min_maxload, argmin = tracker.min_new_maxload(alternatives)
+                self.assertEqual(min_maxload, min(expected.values()))
+                self.assertEqual(
+                    set(argmin),
+                    {c for c, v in expected.items() if v == min_maxload},
+                )
+                alt, veto = random.choice(argmin)
+                tracker_copy = tracker.copy()
+                record = tracker.choose(alt, veto, min_maxload)
+                # Undoing the choice restores the loads
+                loads = [v.load for v in voters]
+                tracker.undo(record)
+                self.assertEqual(
+                    [v.load for v in voters], [v.load for v in tracker_copy.voters]
+                )
+                self.assertEqual(tracker.min_new_maxload(alternatives)[0], min_maxload)
+                tracker.choose(alt, veto, min_maxload)
+                self.assertEqual([v.load for v in voters], loads)
+                alternatives.remove(alt)
+                # The copy is not affected by the choice
+                self.assertEqual(
+                    tracker_copy.min_new_maxload(alternatives | {alt})[0], min_maxload
+                )
+
+    def test_phragmen_irresolute_on_clones(self):
+        alternatives = [Alternative(str(i)) for i in range(12)]
+        profile = TrichotomousProfile(
+            [
+                TrichotomousBallot(approved=alternatives[:6]),
+                TrichotomousBallot(approved=alternatives[6:]),
+            ],
+            alternatives=alternatives,
+        )
+        res = sequential_phragmen(profile, 4, resoluteness=False)
+        # Two alternatives from each half of the alternatives
+        self.assertEqual(len(res), 15 * 15)
+        self.assertEqual(len(set(tuple(s.selected) for s in res)), len(res))
+        for selection in res:
+            self.assertEqual(len([a for a in selection.selected if a in alternatives[:6]]), 2)
+
+    def test_phragmen_float_fractions(self):
+        alternatives = [Alternative(str(i)) for i in range(6)]
+
+        def ballot(approved, disapproved=()):
+            return TrichotomousBallot(
+                approved=[alternatives[i] for i in approved],
+                disapproved=[alternatives[i] for i in disapproved],
+            )
+
+        profile = TrichotomousProfile(
+            [
+                ballot([0, 4], [2]),
+                ballot([3]),
+                ballot([4], [3]),
+                ballot([1, 4], [2, 5]),
+                ballot([3, 5], [0, 2]),
+                ballot([1], [4]),
+            ],
+            alternatives=alternatives,
+        )
+        # Three tied outcomes, two of them were lost in float mode when comparing the loads exactly
+        self.assertEqual(len(sequential_phragmen(profile, 4, resoluteness=False)), 3)
+        instances = [(profile, 4)]
+        for _ in range(10):
+            profile = get_random_profile(8, 20)
+            instances.append((profile, random.randint(1, 5)))
+        for profile, max_size in instances:
+            expected = [
+                sequential_phragmen(profile, max_size, resoluteness=resoluteness)
+                for resoluteness in (True, False)
+            ]
+            trivoting.fractions.FRACTION = trivoting.fractions.FLOAT_FRAC
+            try:
+                res = [
+                    sequential_phragmen(profile, max_size, resoluteness=resoluteness)
+                    for resoluteness in (True, False)
+                ]
+            finally:
+                trivoting.fractions.FRACTION = trivoting.fractions.GMPY_FRAC
+            self.assertEqual(res, expected, f"Failure with Phragmén in float mode on: {profile}, k={max_size}")
+
+    def test_phragmen_parallel(self):
+        for _ in range(3):
+            profile = get_random_profile(10, 20)
+            max_size = random.randint(1, len(profile.alternatives))
+            self.assertEqual(
+                sequential_phragmen(profile, max_size, resoluteness=False, n_jobs=2),
+                sequential_phragmen(profile, max_size, resoluteness=False),
+            )
+        alternatives = [Alternative(str(i)) for i in range(8)]
+        profile = TrichotomousProfile(
+            [
+                TrichotomousBallot(approved=alternatives[:4]),
+                TrichotomousBallot(approved=alternatives[4:]),
+            ],
+            alternatives=alternatives,
+        )
+        self.assertEqual(
+            sequential_phragmen(profile, 4, resoluteness=False, n_jobs=3),
+            sequential_phragmen(profile, 4, resoluteness=False),
+        )
+
+    def test_phragmen_size_sweep(self):
+        for _ in range(10):
+            profile = get_random_profile(10, 30)
+            max_size = random.randint(1, len(profile.alternatives) + 1)
+            initial_selection = Selection(implicit_reject=True)
+            if random.random() < 0.5:
+                initial_selection.add_selected(random.choice(list(profile.alternatives)))
+            res = sequential_phragmen_size_sweep(
+                profile, max_size, initial_selection=initial_selection
+            )
+            self.assertEqual(list(res), list(range(1, max_size + 1)))
+            for size, selection in res.items():
+                self.assertEqual(
+                    selection,
+                    sequential_phragmen(
+                        profile, size, initial_selection=initial_selection.copy()
+                    ),
+                )
+
     def test_phragmen_on_trivial_instances(self):
         # Empty profile
         profile = TrichotomousProfile()
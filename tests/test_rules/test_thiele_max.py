@@ -6,13 +6,23 @@ from tests.random_instances import get_random_profile
 from trivoting.election.alternative import Alternative
 from trivoting.election.trichotomous_ballot import TrichotomousBallot
 from trivoting.election.trichotomous_profile import TrichotomousProfile
+from trivoting.rules.ilp_schemes import (
+    ILPFormulation,
+    ILPSolver,
+    ilp_optimiser_rule,
+    ilp_optimiser_size_sweep,
+)
 from trivoting.rules.thiele import (
     thiele_method,
+    thiele_method_size_sweep,
     PAVScoreKraiczy2025,
     PAVScoreHervouin2025,
     PAVScoreTalmonPaige2021,
+    ApprovalThieleScore,
+    NetSupportThieleScore,
 )
 from trivoting.election.selection import Selection
+from trivoting.utils import generate_subsets
 
 
 class TestPAV(TestCase):
@@ -31,6 +41,114 @@ class TestPAV(TestCase):
                 )
                 self.assertLessEqual(len(res), max_size, f"Failure with PAV[{thiele_score.__name__}] on: {profile}")
 
+    def test_thiele_formulations_with_brute_force(self):
+        for _ in range(10):
+            profile = get_random_profile(5, 8)
+            max_size = random.randint(1, len(profile.alternatives))
+            selections = [
+                Selection(s, implicit_reject=True)
+                for s in generate_subsets(profile.alternatives, max_size=max_size)
+            ]
+            for thiele_score in [
+                PAVScoreKraiczy2025,
+                PAVScoreTalmonPaige2021,
+                PAVScoreHervouin2025,
+                ApprovalThieleScore,
+                NetSupportThieleScore,
+            ]:
+                score = thiele_score(max_size)
+                best_score = max(score.score_selection(profile, s) for s in selections)
+                for formulation in ILPFormulation:
+                    builder = thiele_score.ilp_builder(
+                        profile, max_size, formulation=formulation
+                    )
+                    res = ilp_optimiser_rule(builder)
+                    self.assertEqual(
+                        score.score_selection(profile, res),
+                        best_score,
+                        f"Failure with {thiele_score.__name__} and {formulation}",
+                    )
+
+    def test_thiele_warm_start(self):
+        for _ in range(10):
+            profile = get_random_profile(8, 30)
+            max_size = random.randint(1, len(profile.alternatives))
+            initial_selection = Selection(
+                [random.choice(list(profile.alternatives))], implicit_reject=True
+            )
+            initial_selection_copy = initial_selection.copy()
+            for thiele_score in [
+                PAVScoreKraiczy2025,
+                PAVScoreTalmonPaige2021,
+                PAVScoreHervouin2025,
+            ]:
+                for initial in [None, initial_selection]:
+                    score = thiele_score(max_size)
+                    res = thiele_method(profile, max_size, thiele_score, initial_selection=initial)
+                    res_warm = thiele_method(
+                        profile, max_size, thiele_score, initial_selection=initial, warm_start=True
+                    )
+                    self.assertEqual(
+                        score.score_selection(profile, res),
+                        score.score_selection(profile, res_warm),
+                        f"Failure with warm-started {thiele_score.__name__} on: {profile}, k={max_size}",
+                    )
+                    if initial is not None:
+                        self.assertEqual(initial, initial_selection_copy)
+                        self.assertIn(initial.selected[0], res_warm.selected)
+
+    def test_thiele_irresolute_enumeration(self):
+        alternatives = [Alternative(str(i)) for i in range(6)]
+        profile = TrichotomousProfile(
+            [TrichotomousBallot(approved=[a]) for a in alternatives for _ in range(3)],
+            alternatives=alternatives,
+        )
+        all_subsets = {
+            frozenset(s) for s in generate_subsets(alternatives, min_size=2, max_size=2)
+        }
+        for thiele_score in [PAVScoreKraiczy2025, PAVScoreHervouin2025]:
+            for solver_name in ILPSolver:
+                builder = thiele_score.ilp_builder(profile, 2, solver_name=solver_name)
+                res = ilp_optimiser_rule(builder, resoluteness=False)
+                self.assertEqual({frozenset(s.selected) for s in res}, all_subsets)
+                self.assertEqual(len(res), len(all_subsets))
+            res = thiele_method(profile, 2, thiele_score, resoluteness=False, max_num_selections=4)
+            self.assertEqual(len(res), 4)
+            for selection in res:
+                self.assertIn(frozenset(selection.selected), all_subsets)
+
+    def test_thiele_size_sweep(self):
+        for _ in range(5):
+            profile = get_random_profile(6, 20)
+            max_size = random.randint(1, len(profile.alternatives))
+            for thiele_score in [
+                PAVScoreKraiczy2025,
+                PAVScoreTalmonPaige2021,
+                PAVScoreHervouin2025,
+            ]:
+                for solver_name in ILPSolver:
+                    builder = thiele_score.ilp_builder(profile, max_size, solver_name=solver_name)
+                    sweep = ilp_optimiser_size_sweep(builder)
+                    self.assertEqual(sorted(sweep), list(range(1, max_size + 1)))
+                    for size, res in sweep.items():
+                        score = thiele_score(size)
+                        self.assertLessEqual(len(res), size)
+                        self.assertAlmostEqual(
+                            score.score_selection(profile, res),
+                            score.score_selection(profile, thiele_method(profile, size, thiele_score)),
+                            msg=f"Failure with {thiele_score.__name__} and {solver_name} on: {profile}, k={size}",
+                        )
+                irresolute_sweep = thiele_method_size_sweep(profile, max_size, thiele_score, resoluteness=False)
+                for size, res in irresolute_sweep.items():
+                    self.assertEqual(
+                        {frozenset(s.selected) for s in res},
+                        {
+                            frozenset(s.selected)
+                            for s in thiele_method(profile, size, thiele_score, resoluteness=False)
+                        },
+                        f"Failure with irresolute {thiele_score.__name__} on: {profile}, k={size}",
+                    )
+
     def test_pav_on_trivial_instances(self):
         for thiele_score in [
                 PAVScoreKraiczy2025,
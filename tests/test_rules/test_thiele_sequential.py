@@ -2,15 +2,21 @@ import random
 
 from unittest import TestCase
 
+import trivoting.fractions
+
 from tests.random_instances import get_random_profile
 from trivoting.election.alternative import Alternative
 from trivoting.election.trichotomous_ballot import TrichotomousBallot
 from trivoting.election.trichotomous_profile import TrichotomousProfile
 from trivoting.rules.thiele import (
     sequential_thiele,
+    sequential_thiele_size_sweep,
     PAVScoreKraiczy2025,
     PAVScoreTalmonPaige2021,
     PAVScoreHervouin2025,
+    ApprovalThieleScore,
+    NetSupportThieleScore,
+    ThieleScoreTracker,
 )
 from trivoting.election.selection import Selection
 
@@ -29,6 +35,256 @@ class TestSequentialPAV(TestCase):
                 res = sequential_thiele(profile, max_size, score, resoluteness=True)
                 self.assertLessEqual(len(res), max_size, f"Failure with Sequential PAV[{score.__name__}] on: {profile}, k={max_size}")
 
+    def test_thiele_score_tracker(self):
+        for _ in range(10):
+            for score_class in [
+                PAVScoreKraiczy2025,
+                PAVScoreTalmonPaige2021,
+                PAVScoreHervouin2025,
+            ]:
+                profile = get_random_profile(8, 20)
+                alternatives = sorted(profile.alternatives)
+                thiele_score = score_class(4)
+                for implicit_reject in [True, False]:
+                    selection = Selection(
+                        alternatives[:2],
+                        [] if implicit_reject else alternatives[-2:],
+                        implicit_reject=implicit_reject,
+                    )
+                    tracker = ThieleScoreTracker(thiele_score, profile, selection)
+                    for alt in alternatives[2:5]:
+                        score = thiele_score.score_selection(profile, selection)
+                        self.assertEqual(tracker.total_score(), score)
+                        self.assertEqual(
+                            tracker.marginal_contribution_of_selecting(alt),
+                            thiele_score.score_selection(
+                                profile, selection, extra_accept=[alt]
+                            )
+                            - score,
+                        )
+                        for selected_alt in selection.selected:
+                            self.assertEqual(
+                                tracker.marginal_contribution_of_selected(
+                                    selected_alt
+                                ),
+                                score
+                                - thiele_score.score_selection(
+                                    profile, selection, extra_reject=[selected_alt]
+                                ),
+                            )
+                        selection.add_selected(alt)
+                        tracker.update(alt, selection)
+                    selection.remove_selected(alternatives[0])
+                    tracker.update(alternatives[0], selection)
+                    self.assertEqual(
+                        tracker.total_score(),
+                        thiele_score.score_selection(profile, selection),
+                    )
+
+    def test_thiele_score_table(self):
+        for score_class in [
+            PAVScoreKraiczy2025,
+            PAVScoreTalmonPaige2021,
+            PAVScoreHervouin2025,
+            ApprovalThieleScore,
+        ]:
+            thiele_score = score_class(3)
+            thiele_score.tabulate(4, 3)
+            for counts in [(0, 0, 0, 0), (2, 1, 1, 2), (4, 3, 0, 0), (7, 0, 0, 5)]:
+                self.assertEqual(
+                    thiele_score.score_counts(*counts),
+                    thiele_score.score_function(*counts),
+                )
+            thiele_score.max_size_selection = 5
+            self.assertEqual(
+                thiele_score.score_counts(1, 2, 0, 0),
+                score_class(5).score_function(1, 2, 0, 0),
+            )
+            trivoting.fractions.FRACTION = trivoting.fractions.FLOAT_FRAC
+            try:
+                self.assertEqual(
+                    thiele_score.score_counts(2, 1, 1, 2),
+                    thiele_score.score_function(2, 1, 1, 2),
+                )
+                self.assertIs(
+                    type(thiele_score.score_counts(2, 0, 0, 0)),
+                    type(thiele_score.score_function(2, 0, 0, 0)),
+                )
+            finally:
+                trivoting.fractions.FRACTION = trivoting.fractions.GMPY_FRAC
+            self.assertIs(
+                type(thiele_score.score_counts(2, 0, 0, 0)),
+                type(thiele_score.score_function(2, 0, 0, 0)),
+            )
+
+    def test_seq_thiele_float_fractions(self):
+        alternatives = [Alternative(str(i)) for i in range(6)]
+        profile = TrichotomousProfile(
+            [
+                TrichotomousBallot(approved=alternatives[:1]),
+                TrichotomousBallot(
+                    approved=[alternatives[0], alternatives[2]],
+                    disapproved=[alternatives[4]],
+                ),
+                TrichotomousBallot(
+                    approved=[alternatives[0], alternatives[2], alternatives[4]]
+                ),
+            ],
+            alternatives=alternatives,
+        )
+        instances = [(profile, 3)]
+        for _ in range(10):
+            profile = get_random_profile(8, 20)
+            instances.append((profile, random.randint(1, 5)))
+        for score in [PAVScoreTalmonPaige2021, PAVScoreHervouin2025]:
+            for profile, max_size in instances:
+                expected = [
+                    sequential_thiele(profile, max_size, score, resoluteness=resoluteness)
+                    for resoluteness in (True, False)
+                ]
+                trivoting.fractions.FRACTION = trivoting.fractions.FLOAT_FRAC
+                try:
+                    for lazy in (False, True):
+                        res = [
+                            sequential_thiele(
+                                profile, max_size, score, resoluteness=resoluteness, lazy=lazy
+                            )
+                            for resoluteness in (True, False)
+                        ]
+                        self.assertEqual(res, expected, f"Failure with Sequential Thiele[{score.__name__}] in float mode on: {profile}, k={max_size}")
+                finally:
+                    trivoting.fractions.FRACTION = trivoting.fractions.GMPY_FRAC
+
+    def test_seq_thiele_large_selection(self):
+        # More steps than the default recursion limit
+        alternatives = [Alternative(str(i)) for i in range(1100)]
+        profile = TrichotomousProfile(
+            [
+                TrichotomousBallot(
+                    approved=alternatives[:1050], disapproved=alternatives[1050:]
+                )
+            ],
+            alternatives=alternatives,
+        )
+        res = sequential_thiele(profile, 1100, ApprovalThieleScore)
+        self.assertEqual(len(res), 1050)
+
+    def test_seq_thiele_lazy(self):
+        for score in [
+            PAVScoreKraiczy2025,
+            PAVScoreTalmonPaige2021,
+            PAVScoreHervouin2025,
+            ApprovalThieleScore,
+            NetSupportThieleScore,
+        ]:
+            for _ in range(10):
+                profile = get_random_profile(10, 30)
+                max_size = random.randint(1, len(profile.alternatives))
+                self.assertEqual(
+                    sequential_thiele(profile, max_size, score, lazy=True),
+                    sequential_thiele(profile, max_size, score),
+                )
+                self.assertEqual(
+                    sequential_thiele(
+                        profile, max_size, score, resoluteness=False, lazy=True
+                    ),
+                    sequential_thiele(profile, max_size, score, resoluteness=False),
+                )
+
+        # Ties are broken in the same order
+        alternatives = [Alternative(str(i)) for i in range(6)]
+        profile = TrichotomousProfile(
+            [
+                TrichotomousBallot(approved=alternatives[:3]),
+                TrichotomousBallot(approved=alternatives[3:]),
+            ],
+            alternatives=alternatives,
+        )
+        self.assertEqual(
+            sequential_thiele(profile, 3, PAVScoreHervouin2025, lazy=True),
+            sequential_thiele(profile, 3, PAVScoreHervouin2025),
+        )
+
+    def test_seq_thiele_irresolute_on_clones(self):
+        alternatives = [Alternative(str(i)) for i in range(14)]
+        profile = TrichotomousProfile(
+            [
+                TrichotomousBallot(approved=alternatives[:7]),
+                TrichotomousBallot(approved=alternatives[7:]),
+            ],
+            alternatives=alternatives,
+        )
+        initial_selection = Selection(implicit_reject=True)
+        res = sequential_thiele(
+            profile,
+            4,
+            PAVScoreHervouin2025,
+            initial_selection=initial_selection,
+            resoluteness=False,
+        )
+        # Two alternatives from each half of the alternatives
+        self.assertEqual(len(res), 21 * 21)
+        self.assertEqual(len(set(tuple(s.selected) for s in res)), len(res))
+        for selection in res:
+            self.assertEqual(
+                len([a for a in selection.selected if a in alternatives[:7]]), 2
+            )
+        # The initial selection is left unchanged
+        self.assertEqual(initial_selection, Selection(implicit_reject=True))
+
+    def test_seq_thiele_parallel(self):
+        for score in [PAVScoreKraiczy2025, PAVScoreHervouin2025]:
+            profile = get_random_profile(10, 20)
+            max_size = random.randint(1, len(profile.alternatives))
+            self.assertEqual(
+                sequential_thiele(
+                    profile, max_size, score, resoluteness=False, n_jobs=2
+                ),
+                sequential_thiele(profile, max_size, score, resoluteness=False),
+            )
+        alternatives = [Alternative(str(i)) for i in range(8)]
+        profile = TrichotomousProfile(
+            [
+                TrichotomousBallot(approved=alternatives[:4]),
+                TrichotomousBallot(approved=alternatives[4:]),
+            ],
+            alternatives=alternatives,
+        )
+        self.assertEqual(
+            sequential_thiele(
+                profile, 4, PAVScoreHervouin2025, resoluteness=False, n_jobs=3
+            ),
+            sequential_thiele(profile, 4, PAVScoreHervouin2025, resoluteness=False),
+        )
+
+    def test_seq_thiele_size_sweep(self):
+        for score in [
+            PAVScoreKraiczy2025,
+            PAVScoreTalmonPaige2021,
+            PAVScoreHervouin2025,
+            ApprovalThieleScore,
+            NetSupportThieleScore,
+        ]:
+            for _ in range(5):
+                profile = get_random_profile(8, 20)
+                max_size = random.randint(1, len(profile.alternatives) + 1)
+                initial_selection = Selection(implicit_reject=True)
+                if random.random() < 0.5:
+                    initial_selection.add_selected(random.choice(list(profile.alternatives)))
+                for lazy in (False, True):
+                    res = sequential_thiele_size_sweep(
+                        profile, max_size, score, initial_selection=initial_selection, lazy=lazy
+                    )
+                    self.assertEqual(list(res), list(range(1, max_size + 1)))
+                    for size, selection in res.items():
+                        self.assertEqual(
+                            selection,
+                            sequential_thiele(
+                                profile, size, score, initial_selection=initial_selection.copy(), lazy=lazy
+                            ),
+                            f"Failure with Sequential Thiele[{score.__name__}] on: {profile}, k={size}",
+                        )
+
     def test_seq_pav_on_trivial_instances(self):
         for score in [
             PAVScoreKraiczy2025,
@@ -0,0 +1,66 @@
+import pickle
+from copy import deepcopy
+from unittest import TestCase
+
+from trivoting.election.alternative import Alternative
+from trivoting.election.selection import Selection
+
+
+class TestSelection(TestCase):
+    def test_selection_membership(self):
+        alts = [Alternative(str(i)) for i in range(10)]
+        selection = Selection(
+            selected=alts[:3], rejected=alts[8:], implicit_reject=False
+        )
+        for alt in alts[:3]:
+            self.assertTrue(selection.is_selected(alt))
+            self.assertIn(alt, selection)
+        for alt in alts[8:]:
+            self.assertTrue(selection.is_rejected(alt))
+            self.assertIn(alt, selection)
+        for alt in alts[3:8]:
+            self.assertFalse(selection.is_selected(alt))
+            self.assertFalse(selection.is_rejected(alt))
+            self.assertNotIn(alt, selection)
+
+        selection.add_selected(alts[5])
+        self.assertIn(alts[5], selection.selected)
+        selection.remove_selected(alts[0])
+        self.assertNotIn(alts[0], selection.selected)
+        self.assertEqual(selection.selected, [alts[1], alts[2], alts[5]])
+
+        # The lists can also be modified directly
+        selection.selected.append(alts[0])
+        selection.selected.append(alts[0])
+        selection.selected.remove(alts[0])
+        self.assertIn(alts[0], selection)
+        selection.selected.pop()
+        self.assertNotIn(alts[0], selection)
+        selection.selected[0] = alts[6]
+        self.assertNotIn(alts[1], selection)
+        self.assertIn(alts[6], selection)
+        del selection.selected[:2]
+        self.assertEqual(selection.selected, [alts[5]])
+        self.assertNotIn(alts[6], selection)
+        selection.rejected.clear()
+        self.assertNotIn(alts[9], selection)
+
+        selection.selected = [alts[3], alts[4]]
+        self.assertIn(alts[3], selection)
+        self.assertNotIn(alts[5], selection)
+
+    def test_selection_copy(self):
+        alts = [Alternative(str(i)) for i in range(5)]
+        selection = Selection(selected=alts[:3])
+        for other in [
+            selection.copy(),
+            deepcopy(selection),
+            pickle.loads(pickle.dumps(selection)),
+        ]:
+            self.assertEqual(other, selection)
+            other.add_selected(alts[4])
+            self.assertIn(alts[4], other)
+            self.assertNotIn(alts[4], selection)
+            other.remove_selected(alts[0])
+            self.assertNotIn(alts[0], other)
+            self.assertNotEqual(other, selection)
@@ -0,0 +1,88 @@
+import os
+import tempfile
+from collections import Counter
+from unittest import TestCase
+
+from trivoting.election import TrichotomousMultiProfile
+from trivoting.election.binary import write_binary_profile
+from trivoting.election.pabulib import parse_pabulib
+from trivoting.election.preflib import parse_preflib
+from trivoting.election.stream import (
+    stream_ballots,
+    summarise_file,
+    ProfileSummary,
+    PrefLibBallotStream,
+    PabulibBallotStream,
+    BinaryBallotStream,
+)
+from trivoting.rules import max_net_support, TaxKraiczy2025
+
+
+class TestStream(TestCase):
+    def setUp(self):
+        current_file_path = os.path.dirname(os.path.realpath(__file__))
+        self.preflib_file_path = os.path.join(
+            current_file_path, "data", "preflib_cat_instance.cat"
+        )
+        self.pabulib_file_path = os.path.join(
+            current_file_path, "data", "pabulib_approval.pb"
+        )
+
+    def check_summary(self, summary, profile):
+        self.assertEqual(summary.num_ballots(), profile.num_ballots())
+        self.assertEqual(summary.support_dict(), profile.support_dict())
+        self.assertEqual(
+            summary.approval_disapproval_score_dict(),
+            profile.approval_disapproval_score_dict(),
+        )
+        histogram = Counter()
+        for ballot in profile:
+            histogram[
+                (len(ballot.approved), len(ballot.disapproved))
+            ] += profile.multiplicity(ballot)
+        self.assertEqual(summary.ballot_size_histogram, histogram)
+
+    def test_preflib_stream(self):
+        profile = parse_preflib(self.preflib_file_path)
+        stream = stream_ballots(self.preflib_file_path)
+        self.assertIsInstance(stream, PrefLibBallotStream)
+        self.assertEqual(stream.alternatives, profile.alternatives)
+
+        streamed_profile = TrichotomousMultiProfile()
+        for ballot, multiplicity in stream:
+            streamed_profile[ballot] += multiplicity
+        for ballot in profile:
+            self.assertEqual(
+                streamed_profile.multiplicity(ballot), profile.multiplicity(ballot)
+            )
+        self.check_summary(summarise_file(self.preflib_file_path), profile)
+
+    def test_pabulib_stream(self):
+        profile = parse_pabulib(self.pabulib_file_path)
+        stream = stream_ballots(self.pabulib_file_path)
+        self.assertIsInstance(stream, PabulibBallotStream)
+        self.assertEqual(stream.max_size_selection, profile.max_size_selection)
+        self.assertEqual(len(stream.alternatives), 15)
+        self.check_summary(ProfileSummary.from_stream(stream), profile)
+
+    def test_binary_stream(self):
+        profile = parse_preflib(self.preflib_file_path)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "profile.tvp")
+            write_binary_profile(profile, file_path)
+            stream = stream_ballots(file_path)
+            self.assertIsInstance(stream, BinaryBallotStream)
+            self.check_summary(ProfileSummary.from_stream(stream), profile)
+            del stream
+
+    def test_summary_as_profile(self):
+        profile = parse_preflib(self.preflib_file_path)
+        summary = summarise_file(self.preflib_file_path)
+        for k in range(1, 5):
+            self.assertEqual(max_net_support(summary, k), max_net_support(profile, k))
+        tax_function = TaxKraiczy2025(summary, 3)
+        reference = TaxKraiczy2025(profile, 3)
+        for alt in profile.alternatives:
+            self.assertEqual(
+                tax_function.tax_alternative(alt), reference.tax_alternative(alt)
+            )
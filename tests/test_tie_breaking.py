@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from tests.random_instances import get_random_profile
@@ -29,3 +30,16 @@ class TestTieBreaking(unittest.TestCase):
             refuse_tie_breaking.order(profile, alts)
         with self.assertRaises(TieBreakingException):
             refuse_tie_breaking.untie(profile, alts)
+
+    def test_tie_breaking_pickle(self):
+        profile = get_random_profile(50, 50)
+        alts = list(profile.alternatives)[:20]
+        for tie_breaking in (
+            lexico_tie_breaking,
+            support_tie_breaking,
+            app_score_tie_breaking,
+        ):
+            unpickled = pickle.loads(pickle.dumps(tie_breaking))
+            self.assertEqual(
+                unpickled.order(profile, alts), tie_breaking.order(profile, alts)
+            )
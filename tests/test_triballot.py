@@ -1,7 +1,11 @@
 from unittest import TestCase
 
-from trivoting.election.alternative import Alternative
-from trivoting.election.trichotomous_ballot import TrichotomousBallot
+from trivoting.election.alternative import Alternative, AlternativeRegistry
+from trivoting.election.trichotomous_ballot import (
+    TrichotomousBallot,
+    FrozenTrichotomousBallot,
+    BitmaskTrichotomousBallot,
+)
 
 
 class TestTriBallot(TestCase):
@@ -28,3 +32,58 @@ class TestTriBallot(TestCase):
         self.assertIn(alts[11], ballot)
         self.assertIn(alts[11], ballot.disapproved)
         self.assertEqual(len(ballot), 12)
+
+    def test_bitmask_ballot(self):
+        alts = [Alternative(str(i)) for i in range(20)]
+        registry = AlternativeRegistry(alts[:15])
+
+        ballot = BitmaskTrichotomousBallot(
+            approved=alts[:5], disapproved=alts[15:18], registry=registry
+        )
+        self.assertEqual(len(registry), 18)
+        for a in alts[:5] + alts[15:18]:
+            self.assertIn(a, ballot)
+        for a in alts[5:15] + alts[18:]:
+            self.assertNotIn(a, ballot)
+        self.assertIn(alts[0], ballot.approved)
+        self.assertNotIn(alts[0], ballot.disapproved)
+        self.assertNotIn(alts[19], ballot.approved)
+        self.assertEqual(list(ballot.approved), alts[:5])
+        self.assertEqual(ballot.disapproved, set(alts[15:18]))
+        self.assertEqual(len(ballot), 8)
+
+        selection_mask = registry.mask(alts[3:16] + alts[19:])
+        self.assertEqual(ballot.num_approved_in(selection_mask), 2)
+        self.assertEqual(ballot.num_disapproved_in(selection_mask), 1)
+
+        same_ballot = BitmaskTrichotomousBallot.from_ballot(
+            TrichotomousBallot(approved=alts[:5], disapproved=alts[15:18]), registry
+        )
+        self.assertEqual(ballot, same_ballot)
+        self.assertEqual(hash(ballot), hash(same_ballot))
+        self.assertEqual(len({ballot, same_ballot}), 1)
+        self.assertNotEqual(
+            ballot,
+            BitmaskTrichotomousBallot(
+                approved=alts[:5],
+                disapproved=alts[15:18],
+                registry=AlternativeRegistry(alts),
+            ),
+        )
+        self.assertEqual(ballot.freeze().approved, tuple(alts[:5]))
+
+    def test_frozen_ballot_canonical(self):
+        alts = [Alternative(str(i)) for i in range(10)]
+        ballot = FrozenTrichotomousBallot(
+            approved=[alts[3], alts[1], alts[2], alts[1]],
+            disapproved=[alts[7], alts[5]],
+        )
+        self.assertEqual(ballot.approved, (alts[1], alts[2], alts[3]))
+        self.assertEqual(ballot.disapproved, (alts[5], alts[7]))
+        other = TrichotomousBallot(
+            approved={alts[2], alts[3], alts[1]}, disapproved={alts[5], alts[7]}
+        ).freeze()
+        self.assertEqual(ballot, other)
+        self.assertEqual(hash(ballot), hash(other))
+        self.assertEqual(len({ballot, other}), 1)
+        self.assertNotEqual(ballot, FrozenTrichotomousBallot(approved=alts[1:4]))
@@ -1,6 +1,7 @@
 import string
 from unittest import TestCase
 
+import trivoting.fractions
 from trivoting.fractions import frac
 from trivoting.utils import generate_two_list_partitions, harmonic_sum
 
@@ -29,3 +30,14 @@ class TestUtils(TestCase):
         self.assertEqual(harmonic_sum(3), frac(11, 6))
         self.assertEqual(harmonic_sum(-1), 0)
         self.assertEqual(harmonic_sum(-2), 0)
+
+        self.assertEqual(harmonic_sum(20), sum(frac(1, i) for i in range(1, 21)))
+        self.assertEqual(harmonic_sum(10), sum(frac(1, i) for i in range(1, 11)))
+
+        trivoting.fractions.FRACTION = trivoting.fractions.FLOAT_FRAC
+        try:
+            self.assertIsInstance(harmonic_sum(5), float)
+            self.assertEqual(harmonic_sum(5), sum(1 / i for i in range(1, 6)))
+        finally:
+            trivoting.fractions.FRACTION = trivoting.fractions.GMPY_FRAC
+        self.assertEqual(harmonic_sum(5), frac(137, 60))
@@ -403,7 +403,7 @@ def is_negatively_cohesive_for_l_t(
 
     num_disapprovers = 0
     for ballot in profile:
-        if len(set(ballot.disapproved).intersection(alt_set)) > 0:
+        if any(alt in ballot.disapproved for alt in alt_set):
             num_disapprovers += profile.multiplicity(ballot)
 
     return group.num_ballots() >= num_disapprovers - l * frac(
@@ -1,32 +1,70 @@
-from trivoting.election.alternative import Alternative
+from trivoting.election.alternative import Alternative, AlternativeRegistry
 from trivoting.election.trichotomous_ballot import (
     AbstractTrichotomousBallot,
     TrichotomousBallot,
     FrozenTrichotomousBallot,
+    BitmaskTrichotomousBallot,
+    BitmaskAlternativeSet,
 )
 from trivoting.election.trichotomous_profile import (
     TrichotomousProfile,
     AbstractTrichotomousProfile,
     TrichotomousMultiProfile,
+    TrichotomousMatrixProfile,
+    TrichotomousSparseProfile,
+    ProfileAggregates,
 )
 from trivoting.election.generate import generate_random_profile, generate_random_ballot
 from trivoting.election.preflib import parse_preflib
 from trivoting.election.pabulib import parse_pabulib
 from trivoting.election.abcvoting import parse_abcvoting_yaml
+from trivoting.election.binary import parse_binary_profile, write_binary_profile
+from trivoting.election.stream import (
+    AbstractBallotStream,
+    PrefLibBallotStream,
+    PabulibBallotStream,
+    BinaryBallotStream,
+    ProfileSummary,
+    stream_ballots,
+    summarise_file,
+)
 from trivoting.election.selection import Selection
+from trivoting.election.batch import (
+    BallotTypeMatrices,
+    SelectionBatchScores,
+    score_selections,
+)
 
 __all__ = [
     "Alternative",
+    "AlternativeRegistry",
     "Selection",
     "AbstractTrichotomousBallot",
     "TrichotomousBallot",
     "FrozenTrichotomousBallot",
+    "BitmaskTrichotomousBallot",
+    "BitmaskAlternativeSet",
     "TrichotomousProfile",
     "AbstractTrichotomousProfile",
     "TrichotomousMultiProfile",
+    "TrichotomousMatrixProfile",
+    "TrichotomousSparseProfile",
+    "ProfileAggregates",
     "generate_random_profile",
     "generate_random_ballot",
     "parse_preflib",
     "parse_pabulib",
     "parse_abcvoting_yaml",
+    "parse_binary_profile",
+    "write_binary_profile",
+    "AbstractBallotStream",
+    "PrefLibBallotStream",
+    "PabulibBallotStream",
+    "BinaryBallotStream",
+    "ProfileSummary",
+    "stream_ballots",
+    "summarise_file",
+    "BallotTypeMatrices",
+    "SelectionBatchScores",
+    "score_selections",
 ]
@@ -7,7 +7,7 @@ preference files generated by the abcvoting package.
 from abcvoting.fileio import read_abcvoting_yaml_file
 from abcvoting.preferences import Profile
 
-from trivoting.election.alternative import Alternative
+from trivoting.election.alternative import AlternativeRegistry
 from trivoting.election.trichotomous_ballot import TrichotomousBallot
 from trivoting.election.trichotomous_profile import TrichotomousProfile
 
@@ -26,8 +26,12 @@ def abcvoting_to_trichotomous_profile(abc_profile: Profile) -> TrichotomousProfi
     TrichotomousProfile
         A trichotomous profile where each ballot has only approved alternatives and the rest are left unspecified.
     """
-    alternatives_map = {i: Alternative(a) for i, a in enumerate(abc_profile.cand_names)}
+    registry = AlternativeRegistry()
+    alternatives_map = {
+        i: registry.intern_name(a) for i, a in enumerate(abc_profile.cand_names)
+    }
     profile = TrichotomousProfile(alternatives=alternatives_map.values())
+    profile.registry = registry
     for abc_ballot in abc_profile:
         ballot = TrichotomousBallot(
             approved=[alternatives_map[a] for a in abc_ballot.approved]
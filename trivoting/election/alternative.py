@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+
 
 class Alternative:
     """
     Represents an alternative, i.e., one of the potential outcomes of the election.
 
-    An alternative is represented by its name. Equality, hash, and other tests are based on the name.
+    An alternative is represented by its name. Equality, hash, and other tests are based on the name. The hash is
+    computed once and cached.
 
     Parameters
     ----------
@@ -18,35 +21,269 @@ class Alternative:
         The identifier or label for the alternative.
     """
 
+    __slots__ = ("_name", "_hash")
+
     def __init__(self, name):
-        self.name = name
+        self._name = name
+        self._hash = hash(name)
+
+    @property
+    def name(self):
+        """The identifier or label for the alternative."""
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._hash = hash(value)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, Alternative):
-            return self.name == other.name
+            return self._name == other._name
         elif isinstance(other, str):
-            return self.name == other
+            return self._name == other
         return NotImplemented
 
     def __lt__(self, other):
         if isinstance(other, Alternative):
-            return self.name < other.name
+            return self._name < other._name
         elif isinstance(other, str):
-            return self.name < other
+            return self._name < other
         return NotImplemented
 
     def __le__(self, other):
         if isinstance(other, Alternative):
-            return self.name <= other.name
+            return self._name <= other._name
         elif isinstance(other, str):
-            return self.name <= other
+            return self._name <= other
         return NotImplemented
 
     def __hash__(self):
-        return hash(self.name)
+        return self._hash
+
+    def __reduce__(self):
+        # The cached hash is not pickled as string hashes differ across interpreters
+        return self.__class__, (self._name,)
 
     def __str__(self):
         return str(self.name)
 
     def __repr__(self):
         return self.__str__()
+
+
+class AlternativeRegistry:
+    """
+    Registry of alternatives assigning them dense integer indices, starting from 0 in order of registration.
+
+    The registry also interns the alternatives: a single `Alternative` object is kept per name, and lookups by name or
+    by index take constant time. Registries are used to encode sets of alternatives as integer bitmasks (the
+    alternative of index `i` corresponding to the bit `1 << i`), as columns of matrices, or to name the variables of
+    ILP models.
+
+    Parameters
+    ----------
+    alternatives : Iterable[Alternative], optional
+        Alternatives to register, in order.
+    """
+
+    def __init__(self, alternatives: Iterable[Alternative] = None):
+        self._alternatives = []
+        self._index = dict()
+        self._by_name = dict()
+        if alternatives is not None:
+            for alt in alternatives:
+                self.register(alt)
+
+    def register(self, alternative: Alternative) -> int:
+        """
+        Registers an alternative, if it was not registered before, and returns its index.
+
+        Parameters
+        ----------
+        alternative : Alternative
+            The alternative.
+
+        Returns
+        -------
+        int
+            The index of the alternative.
+        """
+        index = self._index.get(alternative)
+        if index is None:
+            index = len(self._alternatives)
+            self._alternatives.append(alternative)
+            self._index[alternative] = index
+            self._by_name[alternative.name] = alternative
+        return index
+
+    def intern(self, alternative: Alternative) -> Alternative:
+        """
+        Returns the registered alternative equal to the one given, registering it if needed. Interning all the
+        alternatives of a profile ensures that a single object is used per alternative.
+
+        Parameters
+        ----------
+        alternative : Alternative
+            The alternative.
+
+        Returns
+        -------
+        Alternative
+            The registered alternative.
+        """
+        return self._alternatives[self.register(alternative)]
+
+    def intern_name(self, name) -> Alternative:
+        """
+        Returns the registered alternative with the given name, creating and registering it if needed.
+
+        Parameters
+        ----------
+        name : str
+            The name of the alternative.
+
+        Returns
+        -------
+        Alternative
+            The registered alternative.
+        """
+        alternative = self._by_name.get(name)
+        if alternative is None:
+            alternative = Alternative(name)
+            self.register(alternative)
+        return alternative
+
+    def get_by_name(self, name, default: Alternative = None) -> Alternative | None:
+        """
+        Returns the registered alternative with the given name, or `default` if there is none.
+
+        Parameters
+        ----------
+        name : str
+            The name of the alternative.
+        default : Alternative, optional
+            The value returned if no registered alternative has this name. Defaults to None.
+
+        Returns
+        -------
+        Alternative | None
+            The alternative.
+        """
+        return self._by_name.get(name, default)
+
+    def index(self, alternative: Alternative) -> int:
+        """
+        Returns the index of a registered alternative.
+
+        Parameters
+        ----------
+        alternative : Alternative
+            The alternative.
+
+        Returns
+        -------
+        int
+            The index of the alternative.
+
+        Raises
+        ------
+        KeyError
+            If the alternative is not registered.
+        """
+        return self._index[alternative]
+
+    def get_index(self, alternative: Alternative, default: int = None) -> int | None:
+        """
+        Returns the index of an alternative, or `default` if it is not registered.
+
+        Parameters
+        ----------
+        alternative : Alternative
+            The alternative.
+        default : int, optional
+            The value returned for unregistered alternatives. Defaults to None.
+
+        Returns
+        -------
+        int | None
+            The index of the alternative.
+        """
+        return self._index.get(alternative, default)
+
+    def alternative(self, index: int) -> Alternative:
+        """
+        Returns the alternative with the given index.
+
+        Parameters
+        ----------
+        index : int
+            The index.
+
+        Returns
+        -------
+        Alternative
+            The alternative.
+        """
+        return self._alternatives[index]
+
+    def mask(self, alternatives: Iterable[Alternative]) -> int:
+        """
+        Returns the bitmask encoding a collection of alternatives. Alternatives that are not registered are ignored.
+
+        Parameters
+        ----------
+        alternatives : Iterable[Alternative]
+            The alternatives.
+
+        Returns
+        -------
+        int
+            The bitmask.
+        """
+        res = 0
+        for alt in alternatives:
+            index = self._index.get(alt)
+            if index is not None:
+                res |= 1 << index
+        return res
+
+    def alternatives_from_mask(self, mask: int) -> Iterator[Alternative]:
+        """
+        Iterates over the alternatives encoded in a bitmask, by increasing index.
+
+        Parameters
+        ----------
+        mask : int
+            The bitmask.
+
+        Yields
+        ------
+        Alternative
+            The alternatives whose bit is set in the mask.
+        """
+        while mask:
+            lowest_bit = mask & -mask
+            yield self._alternatives[lowest_bit.bit_length() - 1]
+            mask ^= lowest_bit
+
+    def __contains__(self, item):
+        return item in self._index
+
+    def __iter__(self):
+        return iter(self._alternatives)
+
+    def __len__(self):
+        return len(self._alternatives)
+
+    def __eq__(self, other):
+        if isinstance(other, AlternativeRegistry):
+            return self._alternatives == other._alternatives
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"AlternativeRegistry({self._alternatives})"
@@ -0,0 +1,225 @@
+"""
+Vectorised scoring of many selections against a single profile. The ballot types of the profile and the selections
+are encoded as indicator matrices over the alternatives so that the scores of all the selections are obtained through
+a handful of matrix products instead of Python loops.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+import numpy as np
+
+from trivoting.election.alternative import AlternativeRegistry
+from trivoting.election.selection import Selection
+from trivoting.election.trichotomous_ballot import FrozenTrichotomousBallot
+from trivoting.election.trichotomous_profile import AbstractTrichotomousProfile
+
+
+class BallotTypeMatrices:
+    """
+    Indicator matrices of the ballot types of a profile. Row `i` corresponds to the `i`-th ballot type and column `j`
+    to the alternative of index `j` in the registry.
+
+    Parameters
+    ----------
+    profile : AbstractTrichotomousProfile
+        The profile.
+    registry : AlternativeRegistry, optional
+        The registry used to index the alternatives. Defaults to the registry of the profile. Alternatives appearing
+        in the ballots but not in the registry are registered.
+
+    Attributes
+    ----------
+    registry : AlternativeRegistry
+        The registry used to index the alternatives.
+    ballots : list[FrozenTrichotomousBallot]
+        The ballot types, each equal ballot of the profile being represented once.
+    weights : numpy.ndarray
+        The multiplicity of each ballot type.
+    approved : numpy.ndarray
+        The matrix of dimension (number of ballot types, number of alternatives) with 1 at position `(i, j)` if
+        ballot type `i` approves of alternative `j` and 0 otherwise.
+    disapproved : numpy.ndarray
+        The matrix with 1 at position `(i, j)` if ballot type `i` disapproves of alternative `j` and 0 otherwise.
+    """
+
+    def __init__(
+        self, profile: AbstractTrichotomousProfile, registry: AlternativeRegistry = None
+    ) -> None:
+        if registry is None:
+            registry = profile.registry
+        self.registry = registry
+
+        type_counts = Counter()
+        for ballot in profile:
+            type_counts[
+                (frozenset(ballot.approved), frozenset(ballot.disapproved))
+            ] += profile.multiplicity(ballot)
+
+        self.ballots = []
+        approved_rows, disapproved_rows = [], []
+        for approved, disapproved in type_counts:
+            self.ballots.append(
+                FrozenTrichotomousBallot(approved=approved, disapproved=disapproved)
+            )
+            approved_rows.append([registry.register(a) for a in approved])
+            disapproved_rows.append([registry.register(a) for a in disapproved])
+        self.weights = np.fromiter(
+            type_counts.values(), dtype=np.int64, count=len(type_counts)
+        )
+
+        num_columns = len(registry)
+        self.approved = np.zeros((len(self.ballots), num_columns), dtype=np.float64)
+        self.disapproved = np.zeros((len(self.ballots), num_columns), dtype=np.float64)
+        for i, (approved_row, disapproved_row) in enumerate(
+            zip(approved_rows, disapproved_rows)
+        ):
+            self.approved[i, approved_row] = 1
+            self.disapproved[i, disapproved_row] = 1
+
+    def _pad(self, num_columns: int) -> None:
+        """Adds zero columns for the alternatives registered after the creation of the matrices."""
+        missing = num_columns - self.approved.shape[1]
+        if missing > 0:
+            padding = np.zeros((self.approved.shape[0], missing), dtype=np.float64)
+            self.approved = np.hstack((self.approved, padding))
+            self.disapproved = np.hstack((self.disapproved, padding))
+
+    def selection_indicators(
+        self, selections: Iterable[Selection]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Encodes selections as indicator matrices over the alternatives.
+
+        Parameters
+        ----------
+        selections : Iterable[Selection]
+            The selections.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            Two matrices of dimension (number of selections, number of alternatives): the first one with 1 at position
+            `(s, j)` if alternative `j` is selected in selection `s`, the second one with 1 if it is rejected. For
+            selections with `implicit_reject`, all the alternatives that are not selected are rejected.
+        """
+        selections = list(selections)
+        selected_rows, rejected_rows = [], []
+        for selection in selections:
+            selected_rows.append(
+                [self.registry.register(a) for a in selection.selected]
+            )
+            rejected_rows.append(
+                [self.registry.register(a) for a in selection.rejected]
+            )
+        num_columns = len(self.registry)
+        self._pad(num_columns)
+        selected = np.zeros((len(selections), num_columns), dtype=np.float64)
+        rejected = np.zeros((len(selections), num_columns), dtype=np.float64)
+        for s, selection in enumerate(selections):
+            selected[s, selected_rows[s]] = 1
+            if selection.implicit_reject:
+                rejected[s] = 1 - selected[s]
+            else:
+                rejected[s, rejected_rows[s]] = 1
+        return selected, rejected
+
+
+class SelectionBatchScores:
+    """
+    Scores of a batch of selections against the ballot types of a profile. All the satisfaction matrices have
+    dimension (number of selections, number of ballot types).
+
+    Attributes
+    ----------
+    ballots : list[FrozenTrichotomousBallot]
+        The ballot types of the profile, indexing the columns of the satisfaction matrices.
+    weights : numpy.ndarray
+        The multiplicity of each ballot type.
+    approved_selected : numpy.ndarray
+        For each selection and each ballot type, the number of approved alternatives that are selected.
+    disapproved_selected : numpy.ndarray
+        For each selection and each ballot type, the number of disapproved alternatives that are selected.
+    approved_rejected : numpy.ndarray
+        For each selection and each ballot type, the number of approved alternatives that are rejected.
+    disapproved_rejected : numpy.ndarray
+        For each selection and each ballot type, the number of disapproved alternatives that are rejected.
+    """
+
+    def __init__(
+        self,
+        ballots: list[FrozenTrichotomousBallot],
+        weights: np.ndarray,
+        approved_selected: np.ndarray,
+        disapproved_selected: np.ndarray,
+        approved_rejected: np.ndarray,
+        disapproved_rejected: np.ndarray,
+    ) -> None:
+        self.ballots = ballots
+        self.weights = weights
+        self.approved_selected = approved_selected
+        self.disapproved_selected = disapproved_selected
+        self.approved_rejected = approved_rejected
+        self.disapproved_rejected = disapproved_rejected
+
+    def satisfaction(self) -> np.ndarray:
+        """
+        Returns, for each selection and each ballot type, the number of approved and selected alternatives minus the
+        number of disapproved and selected ones.
+        """
+        return self.approved_selected - self.disapproved_selected
+
+    def selection_support(self) -> np.ndarray:
+        """
+        Returns the net support of each selection, as computed by
+        :py:meth:`~trivoting.election.trichotomous_profile.AbstractTrichotomousProfile.selection_support`.
+        """
+        return self.satisfaction() @ self.weights
+
+    def num_covered_ballots(self) -> np.ndarray:
+        """
+        Returns, for each selection, the number of ballots with strictly positive satisfaction, as computed by
+        :py:meth:`~trivoting.election.trichotomous_profile.AbstractTrichotomousProfile.num_covered_ballots`.
+        """
+        return (self.satisfaction() > 0).astype(np.int64) @ self.weights
+
+
+def score_selections(
+    profile: AbstractTrichotomousProfile | BallotTypeMatrices,
+    selections: Iterable[Selection],
+) -> SelectionBatchScores:
+    """
+    Scores a batch of selections against a profile in a single vectorised computation.
+
+    Parameters
+    ----------
+    profile : AbstractTrichotomousProfile | BallotTypeMatrices
+        The profile, or its ballot type matrices. Passing the matrices avoids recomputing them when several batches
+        are scored against the same profile.
+    selections : Iterable[Selection]
+        The selections to score.
+
+    Returns
+    -------
+    SelectionBatchScores
+        The scores of the selections, the `s`-th row of each matrix corresponding to the `s`-th selection.
+    """
+    if isinstance(profile, BallotTypeMatrices):
+        matrices = profile
+    else:
+        matrices = BallotTypeMatrices(profile)
+    selected, rejected = matrices.selection_indicators(selections)
+
+    def count(indicators, ballot_matrix):
+        return np.rint(indicators @ ballot_matrix.T).astype(np.int64)
+
+    return SelectionBatchScores(
+        matrices.ballots,
+        matrices.weights,
+        count(selected, matrices.approved),
+        count(selected, matrices.disapproved),
+        count(rejected, matrices.approved),
+        count(rejected, matrices.disapproved),
+    )
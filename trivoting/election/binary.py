@@ -0,0 +1,212 @@
+"""
+Binary on-disk format for trichotomous profiles.
+
+A file starts with a fixed-size header, followed by the table of the names of the alternatives and by the arrays of a
+:py:class:`~trivoting.election.trichotomous_profile.TrichotomousSparseProfile`: the CSR arrays of the approved and
+disapproved alternatives, and the weights of the rows. All the arrays are stored little-endian and aligned on 8 bytes
+so that the reader can memory-map them directly, without parsing the file.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+
+import numpy as np
+
+from trivoting.election.alternative import AlternativeRegistry
+from trivoting.election.trichotomous_profile import (
+    AbstractTrichotomousProfile,
+    TrichotomousSparseProfile,
+)
+
+BINARY_PROFILE_MAGIC = b"TRIVPROF"
+"""The magic bytes at the start of every binary profile file."""
+
+BINARY_PROFILE_VERSION = 1
+"""The version of the binary profile format written by :py:func:`write_binary_profile`."""
+
+# Magic, version, flags, max_size_selection, then the number of names, of profile alternatives, of rows, of approved
+# entries and of disapproved entries, and the size in bytes of the names table.
+_HEADER = struct.Struct("<8sIIqqqqqqq")
+
+_FLAG_HAS_MAX_SIZE = 1
+
+_INDEX_DTYPE = np.dtype("<i4")
+_INDPTR_DTYPE = np.dtype("<i8")
+_WEIGHT_DTYPE = np.dtype("<i8")
+
+
+def _padding(size: int) -> int:
+    return -size % 8
+
+
+def _encode_names(names: list[str]) -> bytes:
+    encoded = [name.encode("utf-8") for name in names]
+    lengths = np.array([len(e) for e in encoded], dtype=_INDPTR_DTYPE)
+    return lengths.tobytes() + b"".join(encoded)
+
+
+def write_binary_profile(profile: AbstractTrichotomousProfile, file_path: str) -> None:
+    """
+    Writes a trichotomous profile to a file in the binary profile format. The file can then be opened with
+    :py:func:`~trivoting.election.binary.parse_binary_profile`.
+
+    The profile is converted into a sparse profile if it is not one already, and each of its rows is stored together
+    with its weight. Alternatives are identified by their name, which must thus be strings.
+
+    Parameters
+    ----------
+    profile : AbstractTrichotomousProfile
+        The profile to write.
+    file_path : str
+        The path of the file to write.
+
+    Raises
+    ------
+    ValueError
+        If the `max_size_selection` of the profile is not an integer.
+    """
+    if not isinstance(profile, TrichotomousSparseProfile):
+        profile = TrichotomousSparseProfile(profile)
+
+    registry = profile.registry
+    names = [str(alt.name) for alt in registry]
+    names_table = _encode_names(names)
+    alternative_indices = np.array(
+        sorted(registry.index(alt) for alt in profile.alternatives),
+        dtype=_INDEX_DTYPE,
+    )
+    arrays = [
+        alternative_indices,
+        np.ascontiguousarray(profile.approved_indptr, dtype=_INDPTR_DTYPE),
+        np.ascontiguousarray(profile.approved_indices, dtype=_INDEX_DTYPE),
+        np.ascontiguousarray(profile.disapproved_indptr, dtype=_INDPTR_DTYPE),
+        np.ascontiguousarray(profile.disapproved_indices, dtype=_INDEX_DTYPE),
+        np.ascontiguousarray(profile.weights, dtype=_WEIGHT_DTYPE),
+    ]
+
+    flags = 0
+    max_size_selection = 0
+    if profile.max_size_selection is not None:
+        flags |= _FLAG_HAS_MAX_SIZE
+        max_size_selection = int(profile.max_size_selection)
+        if max_size_selection != profile.max_size_selection:
+            raise ValueError(
+                "Only integer values of max_size_selection can be stored in a binary profile file, "
+                f"{profile.max_size_selection} is not an integer."
+            )
+
+    header = _HEADER.pack(
+        BINARY_PROFILE_MAGIC,
+        BINARY_PROFILE_VERSION,
+        flags,
+        max_size_selection,
+        len(names),
+        len(alternative_indices),
+        profile.num_rows,
+        len(arrays[2]),
+        len(arrays[4]),
+        len(names_table),
+    )
+
+    with open(file_path, "wb") as f:
+        f.write(header)
+        f.write(names_table)
+        f.write(b"\0" * _padding(_HEADER.size + len(names_table)))
+        for array in arrays:
+            data = array.tobytes()
+            f.write(data)
+            f.write(b"\0" * _padding(len(data)))
+
+
+def parse_binary_profile(file_path: str) -> TrichotomousSparseProfile:
+    """
+    Opens a file in the binary profile format and returns the corresponding sparse profile.
+
+    The file is memory-mapped: the arrays of the profile are read-only views of the file, whose content is paged in
+    on demand by the operating system. Opening a file is thus almost instantaneous, whatever the number of ballots,
+    and only the table of the names of the alternatives is actually read.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file to read.
+
+    Returns
+    -------
+    TrichotomousSparseProfile
+        The profile stored in the file.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a binary profile file, or if its version is not supported.
+    """
+    with open(file_path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(buffer) < _HEADER.size:
+        raise ValueError(f"The file {file_path} is not a binary profile file.")
+    (
+        magic,
+        version,
+        flags,
+        max_size_selection,
+        num_names,
+        num_alternatives,
+        num_rows,
+        num_approved,
+        num_disapproved,
+        names_table_size,
+    ) = _HEADER.unpack_from(buffer)
+    if magic != BINARY_PROFILE_MAGIC:
+        raise ValueError(f"The file {file_path} is not a binary profile file.")
+    if version != BINARY_PROFILE_VERSION:
+        raise ValueError(
+            f"The binary profile format version {version} of file {file_path} is not supported."
+        )
+
+    offset = _HEADER.size
+    name_lengths = np.frombuffer(
+        buffer, dtype=_INDPTR_DTYPE, count=num_names, offset=offset
+    )
+    position = offset + name_lengths.nbytes
+    registry = AlternativeRegistry()
+    for length in name_lengths.tolist():
+        registry.intern_name(buffer[position : position + length].decode("utf-8"))
+        position += length
+    offset += names_table_size
+    offset += _padding(offset)
+
+    arrays = []
+    for dtype, count in (
+        (_INDEX_DTYPE, num_alternatives),
+        (_INDPTR_DTYPE, num_rows + 1),
+        (_INDEX_DTYPE, num_approved),
+        (_INDPTR_DTYPE, num_rows + 1),
+        (_INDEX_DTYPE, num_disapproved),
+        (_WEIGHT_DTYPE, num_rows),
+    ):
+        array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+        arrays.append(array)
+        offset += array.nbytes + _padding(array.nbytes)
+
+    (
+        alternative_indices,
+        approved_indptr,
+        approved_indices,
+        disapproved_indptr,
+        disapproved_indices,
+        weights,
+    ) = arrays
+    return TrichotomousSparseProfile.from_arrays(
+        approved_indices,
+        approved_indptr,
+        disapproved_indices,
+        disapproved_indptr,
+        weights,
+        registry,
+        alternatives=[registry.alternative(i) for i in alternative_indices.tolist()],
+        max_size_selection=(max_size_selection if flags & _FLAG_HAS_MAX_SIZE else None),
+    )
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from trivoting.election.alternative import Alternative
+import numpy as np
+
+from trivoting.election.alternative import Alternative, AlternativeRegistry
 from trivoting.election.trichotomous_ballot import TrichotomousBallot
-from trivoting.election.trichotomous_profile import TrichotomousProfile
+from trivoting.election.trichotomous_profile import (
+    TrichotomousProfile,
+    TrichotomousSparseProfile,
+)
 
 from pabutools.election import (
     AbstractApprovalProfile,
@@ -52,15 +57,58 @@ def pb_approval_profile_to_trichotomous_profile(
     TrichotomousProfile
         A trichotomous profile with approved alternatives from the approval profile.
     """
-    alt_map = {p: Alternative(p.name) for p in instance}
+    registry = AlternativeRegistry()
+    alt_map = {p: registry.intern_name(p.name) for p in instance}
     profile = TrichotomousProfile()
+    profile.registry = registry
     for ballot in app_profile:
         for _ in range(app_profile.multiplicity(ballot)):
             profile.append(pb_approval_ballot_to_trichotomous_ballot(ballot, alt_map))
     return profile
 
 
-def parse_pabulib(file_path: str) -> TrichotomousProfile:
+def pb_approval_profile_to_sparse_trichotomous_profile(
+    instance: Instance, app_profile: AbstractApprovalProfile
+) -> TrichotomousSparseProfile:
+    """
+    Converts a PaBuLib approval profile into a sparse trichotomous profile, without creating any ballot object. Each
+    ballot of the approval profile becomes a row weighted by its multiplicity.
+
+    Parameters
+    ----------
+    instance : Instance
+        The project instance from PaBuLib.
+    app_profile : AbstractApprovalProfile
+        The approval profile from PaBuLib.
+
+    Returns
+    -------
+    TrichotomousSparseProfile
+        A sparse trichotomous profile with approved alternatives from the approval profile.
+    """
+    registry = AlternativeRegistry()
+    index_map = {p: registry.index(registry.intern_name(p.name)) for p in instance}
+    approved_indices = []
+    approved_indptr = [0]
+    weights = []
+    for ballot in app_profile:
+        approved_indices.extend(sorted(index_map[p] for p in ballot))
+        approved_indptr.append(len(approved_indices))
+        weights.append(app_profile.multiplicity(ballot))
+    return TrichotomousSparseProfile.from_arrays(
+        np.array(approved_indices, dtype=np.int32),
+        np.array(approved_indptr, dtype=np.int64),
+        np.zeros(0, dtype=np.int32),
+        np.zeros(len(weights) + 1, dtype=np.int64),
+        np.array(weights, dtype=np.int64),
+        registry,
+        alternatives=(),
+    )
+
+
+def parse_pabulib(
+    file_path: str, sparse: bool = False
+) -> TrichotomousProfile | TrichotomousSparseProfile:
     """
     Parses a PaBuLib file and returns the corresponding trichotomous profile.
 
@@ -68,15 +116,25 @@ def parse_pabulib(file_path: str) -> TrichotomousProfile:
     ----------
     file_path : str
         Path to the PaBuLib file to be parsed.
+    sparse : bool, optional
+        If True, a :py:class:`~trivoting.election.trichotomous_profile.TrichotomousSparseProfile` is returned.
+        Defaults to False.
 
     Returns
     -------
-    TrichotomousProfile
+    TrichotomousProfile | TrichotomousSparseProfile
         The profile corresponding to the file.
     """
     pb_instance, pb_profile = pabutools_parse_pabulib(file_path)
     if isinstance(pb_profile, AbstractApprovalProfile):
-        profile = pb_approval_profile_to_trichotomous_profile(pb_instance, pb_profile)
+        if sparse:
+            profile = pb_approval_profile_to_sparse_trichotomous_profile(
+                pb_instance, pb_profile
+            )
+        else:
+            profile = pb_approval_profile_to_trichotomous_profile(
+                pb_instance, pb_profile
+            )
         profile.max_size_selection = pb_instance.budget_limit
         return profile
     raise ValueError(
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 from preflibtools.instances import CategoricalInstance, get_parsed_instance
-from trivoting.election import TrichotomousMultiProfile, FrozenTrichotomousBallot
+import numpy as np
 
-from trivoting.election.alternative import Alternative
+from trivoting.election import (
+    TrichotomousMultiProfile,
+    TrichotomousSparseProfile,
+    FrozenTrichotomousBallot,
+)
+
+from trivoting.election.alternative import Alternative, AlternativeRegistry
 
 
 def cat_preferences_to_frozen_trichotomous_ballot(
@@ -75,8 +81,10 @@ def cat_instance_to_trichotomous_profile(
             f"{cat_instance.num_categories} categories."
         )
 
-    alt_map = {j: Alternative(str(j)) for j in cat_instance.alternatives_name}
+    registry = AlternativeRegistry()
+    alt_map = {j: registry.intern_name(str(j)) for j in cat_instance.alternatives_name}
     profile = TrichotomousMultiProfile(alternatives=alt_map.values())
+    profile.registry = registry
 
     for p, m in cat_instance.multiplicity.items():
         ballot = cat_preferences_to_frozen_trichotomous_ballot(p, alt_map)
@@ -85,7 +93,63 @@ def cat_instance_to_trichotomous_profile(
     return profile
 
 
-def parse_preflib(file_path: str) -> TrichotomousMultiProfile:
+def cat_instance_to_sparse_trichotomous_profile(
+    cat_instance: CategoricalInstance,
+) -> TrichotomousSparseProfile:
+    """
+    Converts a PrefLib CategoricalInstance into a sparse trichotomous profile, without creating any ballot object.
+    Each distinct preference of the instance becomes a row weighted by its multiplicity. The categories are
+    interpreted as in :py:func:`~trivoting.election.preflib.cat_instance_to_trichotomous_profile`.
+
+    Parameters
+    ----------
+    cat_instance : CategoricalInstance
+        A parsed categorical instance from PrefLib.
+
+    Returns
+    -------
+    TrichotomousSparseProfile
+        A sparse profile composed of trichotomous ballots.
+    """
+    if cat_instance.num_categories == 0 or cat_instance.num_categories > 3:
+        raise ValueError(
+            "Only categorical preferences between 1 and 3 categories can be converted to"
+            f"a trichotomous profile. Categorical instance {cat_instance} has "
+            f"{cat_instance.num_categories} categories."
+        )
+    registry = AlternativeRegistry()
+    index_map = {
+        j: registry.index(registry.intern_name(str(j)))
+        for j in cat_instance.alternatives_name
+    }
+    approved_indices, disapproved_indices = [], []
+    approved_indptr, disapproved_indptr = [0], [0]
+    weights = []
+    for pref, m in cat_instance.multiplicity.items():
+        if len(pref) == 0 or len(pref) > 3:
+            raise ValueError(
+                "Only categorical preferences between 1 and 3 categories can be converted to"
+                f"a trichotomous ballot. Pref {pref} has {len(pref)} categories."
+            )
+        approved_indices.extend(sorted(index_map[j] for j in pref[0]))
+        approved_indptr.append(len(approved_indices))
+        if len(pref) >= 2:
+            disapproved_indices.extend(sorted(index_map[j] for j in pref[-1]))
+        disapproved_indptr.append(len(disapproved_indices))
+        weights.append(m)
+    return TrichotomousSparseProfile.from_arrays(
+        np.array(approved_indices, dtype=np.int32),
+        np.array(approved_indptr, dtype=np.int64),
+        np.array(disapproved_indices, dtype=np.int32),
+        np.array(disapproved_indptr, dtype=np.int64),
+        np.array(weights, dtype=np.int64),
+        registry,
+    )
+
+
+def parse_preflib(
+    file_path: str, sparse: bool = False
+) -> TrichotomousMultiProfile | TrichotomousSparseProfile:
     """
     Parses a PrefLib file and returns the corresponding trichotomous profile.
 
@@ -96,15 +160,20 @@ def parse_preflib(file_path: str) -> TrichotomousMultiProfile:
     ----------
     file_path : str
         The file path to a PrefLib categorical instance.
+    sparse : bool, optional
+        If True, a :py:class:`~trivoting.election.trichotomous_profile.TrichotomousSparseProfile` is returned
+        instead of a multiprofile. Defaults to False.
 
     Returns
     -------
-    TrichotomousMultiProfile
+    TrichotomousMultiProfile | TrichotomousSparseProfile
         A trichotomous multi-profile built from the given file.
     """
 
     instance = get_parsed_instance(file_path, autocorrect=True)
     if isinstance(instance, CategoricalInstance):
+        if sparse:
+            return cat_instance_to_sparse_trichotomous_profile(instance)
         return cat_instance_to_trichotomous_profile(instance)
     raise ValueError(
         f"PrefLib instances of type {type(instance)} cannot be converted to trichotomous profiles."
@@ -4,6 +4,90 @@ from collections.abc import Iterable
 from trivoting.election.alternative import Alternative
 
 
+class _MembershipList(list):
+    """
+    List of alternatives that keeps track of the number of occurrences of its elements so that membership tests
+    (:code:`a in lst`) run in constant time. The list can be used, and modified in place, as any other list; its
+    insertion order is preserved.
+    """
+
+    def __init__(self, iterable: Iterable[Alternative] = ()):
+        list.__init__(self, iterable)
+        self._counts = dict()
+        for alt in self:
+            self._counts[alt] = self._counts.get(alt, 0) + 1
+
+    def _count_in(self, alts: Iterable[Alternative]) -> None:
+        for alt in alts:
+            self._counts[alt] = self._counts.get(alt, 0) + 1
+
+    def _count_out(self, alts: Iterable[Alternative]) -> None:
+        for alt in alts:
+            count = self._counts[alt] - 1
+            if count == 0:
+                del self._counts[alt]
+            else:
+                self._counts[alt] = count
+
+    def __contains__(self, item) -> bool:
+        try:
+            return item in self._counts
+        except TypeError:
+            return list.__contains__(self, item)
+
+    def append(self, alt: Alternative) -> None:
+        list.append(self, alt)
+        self._count_in((alt,))
+
+    def extend(self, alts: Iterable[Alternative]) -> None:
+        alts = list(alts)
+        list.extend(self, alts)
+        self._count_in(alts)
+
+    def insert(self, index, alt: Alternative) -> None:
+        list.insert(self, index, alt)
+        self._count_in((alt,))
+
+    def remove(self, alt: Alternative) -> None:
+        list.remove(self, alt)
+        self._count_out((alt,))
+
+    def pop(self, index=-1) -> Alternative:
+        alt = list.pop(self, index)
+        self._count_out((alt,))
+        return alt
+
+    def clear(self) -> None:
+        list.clear(self)
+        self._counts.clear()
+
+    def __setitem__(self, key, value):
+        removed = self[key] if isinstance(key, slice) else (self[key],)
+        if isinstance(key, slice):
+            value = list(value)
+        list.__setitem__(self, key, value)
+        self._count_out(removed)
+        self._count_in(value if isinstance(key, slice) else (value,))
+
+    def __delitem__(self, key):
+        removed = self[key] if isinstance(key, slice) else (self[key],)
+        list.__delitem__(self, key)
+        self._count_out(removed)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, n):
+        list.__imul__(self, n)
+        self._counts.clear()
+        self._count_in(self)
+        return self
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (list(self),)
+
+
 class Selection:
     """
     A selection is the outcome of a rule. It contains both the alternatives that have been selected and the ones that
@@ -22,9 +106,11 @@ class Selection:
     Attributes
     ----------
         selected : list of Alternative
-            Alternatives that are selected.
+            Alternatives that are selected, in the order in which they have been added. Membership tests
+            (:code:`a in selection.selected`) run in constant time.
         rejected : list of Alternative
-            Alternatives that are rejected.
+            Alternatives that are rejected, in the order in which they have been added. Membership tests
+            (:code:`a in selection.rejected`) run in constant time.
         implicit_reject : bool
             Whether rejection is implicit for alternatives not in the selection.
     """
@@ -36,15 +122,31 @@ class Selection:
         implicit_reject: bool = True,
     ):
         if selected is None:
-            self.selected = list()
-        else:
-            self.selected = list(selected)
+            selected = ()
         if rejected is None:
-            self.rejected = list()
-        else:
-            self.rejected = list(rejected)
+            rejected = ()
+        self.selected = selected
+        self.rejected = rejected
         self.implicit_reject = implicit_reject
 
+    @property
+    def selected(self) -> list[Alternative]:
+        """List of the selected alternatives."""
+        return self._selected
+
+    @selected.setter
+    def selected(self, value: Iterable[Alternative]):
+        self._selected = _MembershipList(value)
+
+    @property
+    def rejected(self) -> list[Alternative]:
+        """List of the rejected alternatives."""
+        return self._rejected
+
+    @rejected.setter
+    def rejected(self, value: Iterable[Alternative]):
+        self._rejected = _MembershipList(value)
+
     def is_selected(self, a: Alternative) -> bool:
         """
         Check whether an alternative is considered selected. Same as `a in selection.selected`.
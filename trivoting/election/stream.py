@@ -0,0 +1,400 @@
+"""
+Streaming readers for files storing trichotomous profiles. A stream reads the ballots of a file one at a time, without
+ever building the profile in memory, so that statistics about the profile can be computed in a single pass over files
+larger than the available memory.
+"""
+
+from __future__ import annotations
+
+import abc
+import csv
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+
+from trivoting.election.alternative import Alternative, AlternativeRegistry
+from trivoting.election.binary import parse_binary_profile
+from trivoting.election.preflib import cat_preferences_to_frozen_trichotomous_ballot
+from trivoting.election.trichotomous_ballot import (
+    AbstractTrichotomousBallot,
+    FrozenTrichotomousBallot,
+)
+from trivoting.election.trichotomous_profile import ProfileAggregates
+from trivoting.fractions import Numeric, str_as_frac
+
+
+class AbstractBallotStream(abc.ABC, Iterable[tuple[FrozenTrichotomousBallot, int]]):
+    """
+    Abstract class for the streams of ballots read from a file. Iterating over a stream yields pairs of a ballot and
+    its multiplicity, reading the file lazily. A stream can be iterated over several times, the file being read again
+    each time.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file.
+
+    Attributes
+    ----------
+    file_path : str
+        The path of the file.
+    registry : AlternativeRegistry
+        The registry interning the alternatives of the file, shared by all the ballots yielded.
+    alternatives : set[Alternative]
+        The alternatives declared in the file.
+    max_size_selection : Numeric
+        The maximum number of alternatives to select declared in the file, if any.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self.registry = AlternativeRegistry()
+        self.alternatives = set()
+        self.max_size_selection = None
+
+    @abc.abstractmethod
+    def __iter__(self) -> Iterator[tuple[FrozenTrichotomousBallot, int]]:
+        pass
+
+
+class PrefLibBallotStream(AbstractBallotStream):
+    """
+    Stream of the ballots of a PrefLib categorical file (`.cat`). The header of the file is read when the stream is
+    created. The categories are interpreted as in
+    :py:func:`~trivoting.election.preflib.cat_instance_to_trichotomous_profile`.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file.
+    """
+
+    _CATEGORY_PATTERN = re.compile(r"\{[^}]*\}|[^,{}\s]+")
+
+    def __init__(self, file_path: str) -> None:
+        super(PrefLibBallotStream, self).__init__(file_path)
+        self.num_categories = None
+        self.alt_map = dict()
+        with open(file_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.startswith("#"):
+                    break
+                key, _, value = line[1:].partition(":")
+                key = key.strip()
+                if key == "NUMBER CATEGORIES":
+                    self.num_categories = int(value)
+                elif key.startswith("ALTERNATIVE NAME"):
+                    j = int(key[len("ALTERNATIVE NAME") :])
+                    self.alt_map[j] = self.registry.intern_name(str(j))
+        if self.num_categories is None or not 0 < self.num_categories <= 3:
+            raise ValueError(
+                "Only categorical preferences between 1 and 3 categories can be converted to"
+                f"a trichotomous profile. The file {file_path} has {self.num_categories} categories."
+            )
+        self.alternatives = set(self.alt_map.values())
+
+    def _alternative(self, j: int) -> Alternative:
+        alt = self.alt_map.get(j)
+        if alt is None:
+            alt = self.registry.intern_name(str(j))
+            self.alt_map[j] = alt
+        return alt
+
+    def parse_preferences(self, pref_str: str) -> tuple[tuple[int, ...], ...]:
+        """
+        Parses the categories of a line of the file.
+
+        Parameters
+        ----------
+        pref_str : str
+            The part of the line after the multiplicity, for instance `{1, 2}, 3, {}`.
+
+        Returns
+        -------
+        tuple[tuple[int, ...], ...]
+            The categories.
+        """
+        res = []
+        for category in self._CATEGORY_PATTERN.findall(pref_str):
+            category = category.strip("{}")
+            res.append(tuple(int(j) for j in category.split(",") if j.strip()))
+        return tuple(res)
+
+    def __iter__(self) -> Iterator[tuple[FrozenTrichotomousBallot, int]]:
+        with open(self.file_path, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("#") or not line.strip():
+                    continue
+                multiplicity, _, pref_str = line.partition(":")
+                pref = self.parse_preferences(pref_str)
+                for category in pref:
+                    for j in category:
+                        self._alternative(j)
+                yield cat_preferences_to_frozen_trichotomous_ballot(
+                    pref, self.alt_map
+                ), int(multiplicity)
+
+
+class PabulibBallotStream(AbstractBallotStream):
+    """
+    Stream of the ballots of a Pabulib file of approval votes. The `META` and `PROJECTS` sections of the file are read
+    when the stream is created. Each vote is yielded as a ballot approving of the projects of the vote with
+    multiplicity 1. The budget limit of the instance is used as the maximum number of alternatives to select, as in
+    :py:func:`~trivoting.election.pabulib.parse_pabulib`.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file.
+
+    Attributes
+    ----------
+    meta : dict[str, str]
+        The content of the `META` section of the file.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        super(PabulibBallotStream, self).__init__(file_path)
+        self.meta = dict()
+        for section, row in self._rows():
+            if section == "VOTES":
+                break
+            if section == "META":
+                self.meta[row["key"]] = row["value"]
+            elif section == "PROJECTS":
+                self.alternatives.add(self.registry.intern_name(row["project_id"]))
+        vote_type = self.meta.get("vote_type", "approval")
+        if vote_type != "approval":
+            raise ValueError(
+                f"PaBuLib files with votes of type {vote_type} cannot be converted as a trichotomous profile."
+            )
+        if "budget" in self.meta:
+            self.max_size_selection = str_as_frac(self.meta["budget"].replace(",", "."))
+
+    def _rows(self) -> Iterator[tuple[str, dict[str, str]]]:
+        """Yields the rows of the file together with the section they belong to."""
+        with open(self.file_path, encoding="utf-8-sig", newline="") as f:
+            section = None
+            header = None
+            for row in csv.reader(f, delimiter=";"):
+                if not row:
+                    continue
+                if len(row) == 1 and row[0].strip() in ("META", "PROJECTS", "VOTES"):
+                    section = row[0].strip()
+                    header = None
+                elif header is None:
+                    header = [h.strip() for h in row]
+                else:
+                    yield section, dict(zip(header, row))
+
+    def __iter__(self) -> Iterator[tuple[FrozenTrichotomousBallot, int]]:
+        intern_name = self.registry.intern_name
+        for section, row in self._rows():
+            if section == "VOTES":
+                vote = row.get("vote", "")
+                yield FrozenTrichotomousBallot(
+                    approved=(intern_name(p.strip()) for p in vote.split(",") if p)
+                ), 1
+
+
+class BinaryBallotStream(AbstractBallotStream):
+    """
+    Stream of the ballots of a file in the binary profile format (see
+    :py:func:`~trivoting.election.binary.write_binary_profile`). Each row of the file is yielded with its weight as
+    multiplicity. The file is memory-mapped, so its content is paged in only as the rows are read.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        super(BinaryBallotStream, self).__init__(file_path)
+        self._profile = parse_binary_profile(file_path)
+        self.registry = self._profile.registry
+        self.alternatives = self._profile.alternatives
+        self.max_size_selection = self._profile.max_size_selection
+
+    def __iter__(self) -> Iterator[tuple[FrozenTrichotomousBallot, int]]:
+        profile = self._profile
+        weights = profile.weights
+        for i in range(profile.num_rows):
+            yield profile[i], int(weights[i])
+
+
+def stream_ballots(file_path: str) -> AbstractBallotStream:
+    """
+    Returns the stream of the ballots of a file. The format of the file is deduced from its extension: `.cat` for
+    PrefLib categorical files, `.pb` for Pabulib files, and the binary profile format otherwise.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file.
+
+    Returns
+    -------
+    AbstractBallotStream
+        The stream of ballots.
+    """
+    lower_path = file_path.lower()
+    if lower_path.endswith(".cat"):
+        return PrefLibBallotStream(file_path)
+    if lower_path.endswith(".pb"):
+        return PabulibBallotStream(file_path)
+    return BinaryBallotStream(file_path)
+
+
+class ProfileSummary:
+    """
+    Summary of a profile computed in a single pass over its ballots: the approval and disapproval scores of the
+    alternatives, the number of ballots, and the histogram of the sizes of the ballots. Only the summary is stored,
+    not the ballots themselves, so the memory used does not depend on the number of ballots.
+
+    The summary exposes the scoring methods of a profile (:code:`num_ballots`, :code:`support_dict`,
+    :code:`approval_disapproval_score_dict`, etc.). It can thus be used in place of a profile by the functions
+    that only rely on these, such as :py:func:`~trivoting.rules.max_net_support.max_net_support` or the
+    preprocessing of the tax functions.
+
+    Parameters
+    ----------
+    alternatives : Iterable[Alternative], optional
+        The alternatives of the profile.
+    max_size_selection : Numeric, optional
+        The maximum number of alternatives to select.
+
+    Attributes
+    ----------
+    aggregates : ProfileAggregates
+        The aggregated scores of the ballots.
+    ballot_size_histogram : Counter[tuple[int, int]]
+        Maps pairs of a number of approved and of disapproved alternatives to the number of ballots of that size.
+    alternatives : set[Alternative]
+        The alternatives of the profile, including all the alternatives appearing in a ballot.
+    max_size_selection : Numeric
+        The maximum number of alternatives to select.
+    """
+
+    def __init__(
+        self,
+        alternatives: Iterable[Alternative] = None,
+        max_size_selection: Numeric = None,
+    ) -> None:
+        self.aggregates = ProfileAggregates()
+        self.ballot_size_histogram = Counter()
+        self.alternatives = set() if alternatives is None else set(alternatives)
+        self.max_size_selection = max_size_selection
+
+    @classmethod
+    def from_stream(
+        cls, ballots: Iterable[tuple[AbstractTrichotomousBallot, int]]
+    ) -> ProfileSummary:
+        """
+        Computes the summary of a stream of ballots, in a single pass. If the stream is an
+        :py:class:`~trivoting.election.stream.AbstractBallotStream`, its alternatives and maximum size of selection
+        are used.
+
+        Parameters
+        ----------
+        ballots : Iterable[tuple[AbstractTrichotomousBallot, int]]
+            The ballots together with their multiplicities.
+
+        Returns
+        -------
+        ProfileSummary
+            The summary.
+        """
+        if isinstance(ballots, AbstractBallotStream):
+            summary = cls(ballots.alternatives, ballots.max_size_selection)
+        else:
+            summary = cls()
+        for ballot, multiplicity in ballots:
+            summary.add_ballot(ballot, multiplicity)
+        return summary
+
+    def add_ballot(self, ballot: AbstractTrichotomousBallot, multiplicity: int = 1):
+        """
+        Updates the summary to account for a ballot appearing `multiplicity` many times.
+
+        Parameters
+        ----------
+        ballot : AbstractTrichotomousBallot
+            The ballot.
+        multiplicity : int, optional
+            The multiplicity of the ballot. Defaults to 1.
+        """
+        self.aggregates.add_ballot(ballot, multiplicity)
+        self.ballot_size_histogram[
+            (len(ballot.approved), len(ballot.disapproved))
+        ] += multiplicity
+        self.alternatives.update(ballot.approved)
+        self.alternatives.update(ballot.disapproved)
+
+    def num_ballots(self) -> int:
+        """Returns the total number of ballots, counting multiplicities."""
+        return self.aggregates.num_ballots
+
+    def approval_score(self, alternative: Alternative) -> int:
+        """Returns the approval score of an alternative."""
+        return self.aggregates.approval_scores.get(alternative, 0)
+
+    def approval_score_dict(self) -> defaultdict[Alternative, int]:
+        """Returns the approval score of all the alternatives."""
+        return defaultdict(int, self.aggregates.approval_scores)
+
+    def disapproval_score(self, alternative: Alternative) -> int:
+        """Returns the disapproval score of an alternative."""
+        return self.aggregates.disapproval_scores.get(alternative, 0)
+
+    def disapproval_score_dict(self) -> defaultdict[Alternative, int]:
+        """Returns the disapproval score of all the alternatives."""
+        return defaultdict(int, self.aggregates.disapproval_scores)
+
+    def approval_disapproval_score(self, alternative: Alternative) -> tuple[int, int]:
+        """Returns the approval and the disapproval score of an alternative."""
+        return self.approval_score(alternative), self.disapproval_score(alternative)
+
+    def approval_disapproval_score_dict(
+        self,
+    ) -> tuple[defaultdict[Alternative, int], defaultdict[Alternative, int]]:
+        """Returns the approval and the disapproval scores of all the alternatives."""
+        return self.approval_score_dict(), self.disapproval_score_dict()
+
+    def support(self, alternative: Alternative) -> int:
+        """Returns the support of an alternative, its approval score minus its disapproval score."""
+        return self.aggregates.support(alternative)
+
+    def support_dict(self) -> defaultdict[Alternative, int]:
+        """Returns the support of all the alternatives."""
+        return self.aggregates.support_dict()
+
+    def mean_ballot_size(self) -> tuple[float, float]:
+        """Returns the average number of approved and of disapproved alternatives per ballot."""
+        num_ballots = self.num_ballots()
+        if num_ballots == 0:
+            return 0.0, 0.0
+        return (
+            sum(a * c for (a, _), c in self.ballot_size_histogram.items())
+            / num_ballots,
+            sum(d * c for (_, d), c in self.ballot_size_histogram.items())
+            / num_ballots,
+        )
+
+
+def summarise_file(file_path: str) -> ProfileSummary:
+    """
+    Computes the summary of the profile stored in a file in a single pass over the file, without building the profile
+    in memory. See :py:func:`~trivoting.election.stream.stream_ballots` for the supported formats.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file.
+
+    Returns
+    -------
+    ProfileSummary
+        The summary of the profile.
+    """
+    return ProfileSummary.from_stream(stream_ballots(file_path))
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Collection, Container
+from collections.abc import Iterable, Collection, Container, Set
 
-from trivoting.election.alternative import Alternative
+from trivoting.election.alternative import Alternative, AlternativeRegistry
+from trivoting.utils import popcount
 
 
 class AbstractTrichotomousBallot(ABC, Container):
@@ -27,6 +29,84 @@ class AbstractTrichotomousBallot(ABC, Container):
         pass
 
 
+class _BallotAlternativeSet(set):
+    """
+    Set of alternatives of a :py:class:`TrichotomousBallot` that notifies the ballot whenever it is modified in place,
+    so that the profiles caching scores computed from the ballot know that these are outdated.
+    """
+
+    __slots__ = ("ballot",)
+
+    def __init__(self, iterable: Iterable[Alternative] = (), ballot=None):
+        set.__init__(self, iterable)
+        self.ballot = ballot
+
+    def _modified(self):
+        if self.ballot is not None:
+            self.ballot._notify_observers()
+
+    def add(self, element):
+        set.add(self, element)
+        self._modified()
+
+    def discard(self, element):
+        set.discard(self, element)
+        self._modified()
+
+    def remove(self, element):
+        set.remove(self, element)
+        self._modified()
+
+    def pop(self):
+        element = set.pop(self)
+        self._modified()
+        return element
+
+    def clear(self):
+        set.clear(self)
+        self._modified()
+
+    def update(self, *others):
+        set.update(self, *others)
+        self._modified()
+
+    def difference_update(self, *others):
+        set.difference_update(self, *others)
+        self._modified()
+
+    def intersection_update(self, *others):
+        set.intersection_update(self, *others)
+        self._modified()
+
+    def symmetric_difference_update(self, other):
+        set.symmetric_difference_update(self, other)
+        self._modified()
+
+    def __ior__(self, other):
+        res = set.__ior__(self, other)
+        if res is not NotImplemented:
+            self._modified()
+        return res
+
+    def __iand__(self, other):
+        res = set.__iand__(self, other)
+        if res is not NotImplemented:
+            self._modified()
+        return res
+
+    def __isub__(self, other):
+        res = set.__isub__(self, other)
+        if res is not NotImplemented:
+            self._modified()
+        return res
+
+    def __ixor__(self, other):
+        res = set.__ixor__(self, other)
+        if res is not NotImplemented:
+            self._modified()
+        return res
+
+
 class TrichotomousBallot(AbstractTrichotomousBallot):
     """
     Represents a mutable trichotomous ballot, where alternatives are categorized into approved, disapproved, or
@@ -53,15 +133,13 @@ class TrichotomousBallot(AbstractTrichotomousBallot):
         approved: Iterable[Alternative] = None,
         disapproved: Iterable[Alternative] = None,
     ):
-        if approved is None:
-            self._approved = set()
-        else:
-            self._approved = set(approved)
-
-        if disapproved is None:
-            self._disapproved = set()
-        else:
-            self._disapproved = set(disapproved)
+        self._observers = []
+        self._approved = _BallotAlternativeSet(
+            () if approved is None else approved, self
+        )
+        self._disapproved = _BallotAlternativeSet(
+            () if disapproved is None else disapproved, self
+        )
 
         AbstractTrichotomousBallot.__init__(self)
 
@@ -72,7 +150,8 @@ class TrichotomousBallot(AbstractTrichotomousBallot):
 
     @approved.setter
     def approved(self, value: Iterable[Alternative]):
-        self._approved = set(value)
+        self._approved = _BallotAlternativeSet(value, self)
+        self._notify_observers()
 
     @property
     def disapproved(self) -> set[Alternative]:
@@ -81,7 +160,8 @@ class TrichotomousBallot(AbstractTrichotomousBallot):
 
     @disapproved.setter
     def disapproved(self, value: Iterable[Alternative]):
-        self._disapproved = set(value)
+        self._disapproved = _BallotAlternativeSet(value, self)
+        self._notify_observers()
 
     def add_approved(self, alt: Alternative) -> None:
         """
@@ -105,6 +185,28 @@ class TrichotomousBallot(AbstractTrichotomousBallot):
         """
         self.disapproved.add(alt)
 
+    def _add_observer(self, observer) -> None:
+        """
+        Registers an object whose attribute `outdated` is set to True whenever the ballot is modified. Only a weak
+        reference to the observer is kept. Used by the profiles to know when their cached scores are outdated.
+        """
+        for ref in self._observers:
+            if ref() is observer:
+                return
+        self._observers = [ref for ref in self._observers if ref() is not None]
+        self._observers.append(weakref.ref(observer))
+
+    def _notify_observers(self) -> None:
+        for ref in self._observers:
+            observer = ref()
+            if observer is not None:
+                observer.outdated = True
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_observers"] = []
+        return state
+
     def freeze(self) -> FrozenTrichotomousBallot:
         """
         Return an immutable version of this ballot.
@@ -163,11 +265,37 @@ class TrichotomousBallot(AbstractTrichotomousBallot):
         return NotImplemented
 
 
+def canonical_alternative_tuple(
+    alternatives: Iterable[Alternative],
+) -> tuple[Alternative, ...]:
+    """
+    Returns the alternatives as a tuple in canonical order: sorted and without duplicates. Alternatives that cannot be
+    compared with one another are ordered by type and by string representation.
+
+    Parameters
+    ----------
+    alternatives : Iterable[Alternative]
+        The alternatives.
+
+    Returns
+    -------
+    tuple[Alternative, ...]
+        The sorted tuple of the distinct alternatives.
+    """
+    alternatives = set(alternatives)
+    try:
+        return tuple(sorted(alternatives))
+    except TypeError:
+        return tuple(sorted(alternatives, key=lambda a: (type(a).__name__, str(a))))
+
+
 class FrozenTrichotomousBallot(AbstractTrichotomousBallot):
     """
     Represents an immutable trichotomous ballot using tuples for storage.
 
-    This version is suitable for hashing and storing in sets or as keys in dictionaries.
+    This version is suitable for hashing and storing in sets or as keys in dictionaries. The tuples are stored in a
+    canonical order (sorted and without duplicates) so that two frozen ballots built from the same sets of
+    alternatives, in whatever order, are equal and have the same hash. The hash is computed once at creation.
 
     Parameters
     ----------
@@ -193,12 +321,14 @@ class FrozenTrichotomousBallot(AbstractTrichotomousBallot):
         if approved is None:
             self._approved = tuple()
         else:
-            self._approved = tuple(approved)
+            self._approved = canonical_alternative_tuple(approved)
 
         if disapproved is None:
             self._disapproved = tuple()
         else:
-            self._disapproved = tuple(disapproved)
+            self._disapproved = canonical_alternative_tuple(disapproved)
+
+        self._hash = hash((self._approved, self._disapproved))
 
         AbstractTrichotomousBallot.__init__(self)
 
@@ -243,9 +373,12 @@ class FrozenTrichotomousBallot(AbstractTrichotomousBallot):
         return self.__str__()
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, FrozenTrichotomousBallot):
             return (
-                self.approved == other.approved
+                self._hash == other._hash
+                and self.approved == other.approved
                 and self.disapproved == other.disapproved
             )
         return NotImplemented
@@ -259,4 +392,287 @@ class FrozenTrichotomousBallot(AbstractTrichotomousBallot):
         return NotImplemented
 
     def __hash__(self):
-        return hash((self.approved, self.disapproved))
+        return self._hash
+
+
+class BitmaskAlternativeSet(Set):
+    """
+    Read-only set of alternatives encoded as a bitmask over an alternative registry. Membership tests are answered in
+    constant time and iteration follows the indices of the registry.
+
+    Parameters
+    ----------
+    registry : AlternativeRegistry
+        The registry used to encode the alternatives.
+    mask : int
+        The bitmask.
+
+    Attributes
+    ----------
+    registry : AlternativeRegistry
+        The registry used to encode the alternatives.
+    mask : int
+        The bitmask.
+    """
+
+    __slots__ = ("registry", "mask")
+
+    def __init__(self, registry: AlternativeRegistry, mask: int):
+        self.registry = registry
+        self.mask = mask
+
+    def __contains__(self, item):
+        index = self.registry.get_index(item)
+        return index is not None and (self.mask >> index) & 1 == 1
+
+    def __iter__(self):
+        return self.registry.alternatives_from_mask(self.mask)
+
+    def __len__(self):
+        return popcount(self.mask)
+
+    def __and__(self, other):
+        if isinstance(other, BitmaskAlternativeSet) and other.registry is self.registry:
+            return BitmaskAlternativeSet(self.registry, self.mask & other.mask)
+        return Set.__and__(self, other)
+
+    def __or__(self, other):
+        if isinstance(other, BitmaskAlternativeSet) and other.registry is self.registry:
+            return BitmaskAlternativeSet(self.registry, self.mask | other.mask)
+        return Set.__or__(self, other)
+
+    def __sub__(self, other):
+        if isinstance(other, BitmaskAlternativeSet) and other.registry is self.registry:
+            return BitmaskAlternativeSet(self.registry, self.mask & ~other.mask)
+        return Set.__sub__(self, other)
+
+    def __eq__(self, other):
+        if isinstance(other, BitmaskAlternativeSet) and other.registry is self.registry:
+            return self.mask == other.mask
+        return Set.__eq__(self, other)
+
+    __hash__ = None
+
+    def __str__(self):
+        return str(set(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class BitmaskTrichotomousBallot(AbstractTrichotomousBallot):
+    """
+    Represents an immutable trichotomous ballot in which the approved and disapproved alternatives are encoded as
+    integer bitmasks over an alternative registry shared by all the ballots of a profile. Membership tests, and
+    counting the approved or disapproved alternatives within a set encoded as a mask, are then cheap integer
+    operations.
+
+    Ballots can only be compared with ballots using the same registry. They are hashable and can thus be used as keys
+    of a :py:class:`~trivoting.election.trichotomous_profile.TrichotomousMultiProfile`.
+
+    Parameters
+    ----------
+    approved : Iterable[Alternative], optional
+        Approved alternatives.
+    disapproved : Iterable[Alternative], optional
+        Disapproved alternatives.
+    registry : AlternativeRegistry
+        The registry used to encode the alternatives. Alternatives that are not registered yet are registered.
+
+    Attributes
+    ----------
+    registry : AlternativeRegistry
+        The registry used to encode the alternatives.
+    approved_mask : int
+        The bitmask of the approved alternatives.
+    disapproved_mask : int
+        The bitmask of the disapproved alternatives.
+    """
+
+    __slots__ = ("registry", "_approved_mask", "_disapproved_mask")
+
+    def __init__(
+        self,
+        *,
+        approved: Iterable[Alternative] = None,
+        disapproved: Iterable[Alternative] = None,
+        registry: AlternativeRegistry,
+    ):
+        self.registry = registry
+        self._approved_mask = 0
+        if approved is not None:
+            for alt in approved:
+                self._approved_mask |= 1 << registry.register(alt)
+        self._disapproved_mask = 0
+        if disapproved is not None:
+            for alt in disapproved:
+                self._disapproved_mask |= 1 << registry.register(alt)
+
+        AbstractTrichotomousBallot.__init__(self)
+
+    @classmethod
+    def from_masks(
+        cls, registry: AlternativeRegistry, approved_mask: int, disapproved_mask: int
+    ) -> BitmaskTrichotomousBallot:
+        """
+        Builds a ballot directly from its bitmasks.
+
+        Parameters
+        ----------
+        registry : AlternativeRegistry
+            The registry used to encode the alternatives.
+        approved_mask : int
+            The bitmask of the approved alternatives.
+        disapproved_mask : int
+            The bitmask of the disapproved alternatives.
+
+        Returns
+        -------
+        BitmaskTrichotomousBallot
+            The ballot.
+        """
+        ballot = cls(registry=registry)
+        ballot._approved_mask = approved_mask
+        ballot._disapproved_mask = disapproved_mask
+        return ballot
+
+    @classmethod
+    def from_ballot(
+        cls, ballot: AbstractTrichotomousBallot, registry: AlternativeRegistry
+    ) -> BitmaskTrichotomousBallot:
+        """
+        Converts any trichotomous ballot into a bitmask ballot.
+
+        Parameters
+        ----------
+        ballot : AbstractTrichotomousBallot
+            The ballot to convert.
+        registry : AlternativeRegistry
+            The registry used to encode the alternatives.
+
+        Returns
+        -------
+        BitmaskTrichotomousBallot
+            The converted ballot.
+        """
+        return cls(
+            approved=ballot.approved, disapproved=ballot.disapproved, registry=registry
+        )
+
+    @property
+    def approved_mask(self) -> int:
+        """Bitmask of the approved alternatives."""
+        return self._approved_mask
+
+    @property
+    def disapproved_mask(self) -> int:
+        """Bitmask of the disapproved alternatives."""
+        return self._disapproved_mask
+
+    @property
+    def approved(self) -> BitmaskAlternativeSet:
+        """Set of approved alternatives."""
+        return BitmaskAlternativeSet(self.registry, self._approved_mask)
+
+    @property
+    def disapproved(self) -> BitmaskAlternativeSet:
+        """Set of disapproved alternatives."""
+        return BitmaskAlternativeSet(self.registry, self._disapproved_mask)
+
+    def num_approved_in(self, mask: int) -> int:
+        """
+        Returns the number of approved alternatives within the set encoded by the mask.
+
+        Parameters
+        ----------
+        mask : int
+            A bitmask over the registry of the ballot.
+
+        Returns
+        -------
+        int
+            The number of approved alternatives in the mask.
+        """
+        return popcount(self._approved_mask & mask)
+
+    def num_disapproved_in(self, mask: int) -> int:
+        """
+        Returns the number of disapproved alternatives within the set encoded by the mask.
+
+        Parameters
+        ----------
+        mask : int
+            A bitmask over the registry of the ballot.
+
+        Returns
+        -------
+        int
+            The number of disapproved alternatives in the mask.
+        """
+        return popcount(self._disapproved_mask & mask)
+
+    def freeze(self) -> FrozenTrichotomousBallot:
+        """
+        Return the frozen ballot corresponding to this ballot.
+
+        Returns
+        -------
+        FrozenTrichotomousBallot
+            The frozen ballot.
+        """
+        return FrozenTrichotomousBallot(
+            approved=self.approved, disapproved=self.disapproved
+        )
+
+    def __contains__(self, item):
+        """
+        Check if an alternative is in either the approved or disapproved sets.
+
+        Parameters
+        ----------
+        item : Alternative
+
+        Returns
+        -------
+        bool
+        """
+        index = self.registry.get_index(item)
+        if index is None:
+            return False
+        return ((self._approved_mask | self._disapproved_mask) >> index) & 1 == 1
+
+    def __len__(self):
+        """
+        Return the total number of alternatives in the ballot (both approved and disapproved).
+
+        Returns
+        -------
+        int
+        """
+        return popcount(self._approved_mask) + popcount(self._disapproved_mask)
+
+    def __str__(self):
+        return f"{{{self.approved}}} // {{{self.disapproved}}}"
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __eq__(self, other):
+        if isinstance(other, BitmaskTrichotomousBallot):
+            return (
+                self.registry is other.registry
+                and self._approved_mask == other._approved_mask
+                and self._disapproved_mask == other._disapproved_mask
+            )
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, BitmaskTrichotomousBallot):
+            return (self._approved_mask, self._disapproved_mask) < (
+                other._approved_mask,
+                other._disapproved_mask,
+            )
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self._approved_mask, self._disapproved_mask))
@@ -9,19 +9,187 @@ from collections.abc import (
     Iterator,
     Collection,
 )
-from itertools import product
+from itertools import chain, product
 
-from trivoting.election.alternative import Alternative
+import numpy as np
+
+from trivoting.election.alternative import Alternative, AlternativeRegistry
 from trivoting.election.selection import Selection
 from trivoting.election.trichotomous_ballot import (
     TrichotomousBallot,
     AbstractTrichotomousBallot,
     FrozenTrichotomousBallot,
+    BitmaskTrichotomousBallot,
 )
 from trivoting.fractions import Numeric
 from trivoting.utils import generate_subsets, generate_two_list_partitions
 
 
+class ProfileAggregates:
+    """
+    Aggregated scores of a collection of ballots: the approval and disapproval scores of the alternatives and the
+    total number of ballots. The aggregates can be updated incrementally as ballots are added or removed, they are
+    notably used by the profiles to cache their scores. The aggregates observe the mutable
+    :py:class:`~trivoting.election.trichotomous_ballot.TrichotomousBallot` they count: modifying such a ballot, even by
+    mutating its sets in place, marks the aggregates as outdated.
+
+    Attributes
+    ----------
+    approval_scores : dict[Alternative, int]
+        The approval score of the alternatives. Only alternatives with a non-zero score are present.
+    disapproval_scores : dict[Alternative, int]
+        The disapproval score of the alternatives. Only alternatives with a non-zero score are present.
+    num_ballots : int
+        The total number of ballots, counting multiplicities.
+    outdated : bool
+        Whether a ballot counted in the aggregates has been modified since it was added.
+    """
+
+    __slots__ = (
+        "approval_scores",
+        "disapproval_scores",
+        "num_ballots",
+        "outdated",
+        "__weakref__",
+    )
+
+    def __init__(self):
+        self.approval_scores = dict()
+        self.disapproval_scores = dict()
+        self.num_ballots = 0
+        self.outdated = False
+
+    @classmethod
+    def from_profile(cls, profile: AbstractTrichotomousProfile) -> ProfileAggregates:
+        """
+        Computes the aggregates of a profile.
+
+        Parameters
+        ----------
+        profile : AbstractTrichotomousProfile
+            The profile.
+
+        Returns
+        -------
+        ProfileAggregates
+            The aggregates of the profile.
+        """
+        aggregates = cls()
+        for ballot in profile:
+            aggregates.add_ballot(ballot, profile.multiplicity(ballot))
+        return aggregates
+
+    @staticmethod
+    def _add_to_scores(scores: dict, alternatives: Iterable[Alternative], count: int):
+        for alt in alternatives:
+            new_score = scores.get(alt, 0) + count
+            if new_score == 0:
+                del scores[alt]
+            else:
+                scores[alt] = new_score
+
+    def add_ballot(self, ballot: AbstractTrichotomousBallot, multiplicity: int = 1):
+        """
+        Updates the aggregates to account for a ballot added `multiplicity` many times. Negative multiplicities
+        correspond to removals.
+
+        Parameters
+        ----------
+        ballot : AbstractTrichotomousBallot
+            The ballot.
+        multiplicity : int, optional
+            The number of copies of the ballot that are added. Defaults to 1.
+        """
+        if multiplicity == 0:
+            return
+        if multiplicity > 0 and isinstance(ballot, TrichotomousBallot):
+            ballot._add_observer(self)
+        self.num_ballots += multiplicity
+        self._add_to_scores(self.approval_scores, ballot.approved, multiplicity)
+        self._add_to_scores(self.disapproval_scores, ballot.disapproved, multiplicity)
+
+    def remove_ballot(self, ballot: AbstractTrichotomousBallot, multiplicity: int = 1):
+        """
+        Updates the aggregates to account for a ballot removed `multiplicity` many times.
+
+        Parameters
+        ----------
+        ballot : AbstractTrichotomousBallot
+            The ballot.
+        multiplicity : int, optional
+            The number of copies of the ballot that are removed. Defaults to 1.
+        """
+        self.add_ballot(ballot, -multiplicity)
+
+    def support(self, alternative: Alternative) -> int:
+        """Returns the support of the alternative, its approval score minus its disapproval score."""
+        return self.approval_scores.get(alternative, 0) - self.disapproval_scores.get(
+            alternative, 0
+        )
+
+    def support_dict(self) -> defaultdict[Alternative, int]:
+        """Returns the support of all the alternatives appearing in the approval or disapproval scores."""
+        res = defaultdict(int, self.approval_scores)
+        for alt, score in self.disapproval_scores.items():
+            res[alt] -= score
+        return res
+
+    def copy(self) -> ProfileAggregates:
+        """Returns a copy of the aggregates."""
+        res = ProfileAggregates()
+        res.approval_scores = self.approval_scores.copy()
+        res.disapproval_scores = self.disapproval_scores.copy()
+        res.num_ballots = self.num_ballots
+        return res
+
+
+class _ProfileAlternatives(set):
+    """
+    The set of the alternatives of a profile. The alternatives added to the set are registered in the registry of the
+    profile, if any, so that the registry never needs to scan the alternatives to be up to date.
+    """
+
+    def __init__(
+        self,
+        alternatives: Iterable[Alternative] = (),
+        registry: AlternativeRegistry | None = None,
+    ):
+        super(_ProfileAlternatives, self).__init__(alternatives)
+        self.registry = registry
+        if registry is not None:
+            for alt in self:
+                registry.register(alt)
+
+    def _register(self, alternatives: Iterable[Alternative]) -> None:
+        if self.registry is not None:
+            for alt in alternatives:
+                if alt in self:
+                    self.registry.register(alt)
+
+    def add(self, alt: Alternative) -> None:
+        super(_ProfileAlternatives, self).add(alt)
+        self._register((alt,))
+
+    def update(self, *others: Iterable[Alternative]) -> None:
+        others = [list(other) for other in others]
+        super(_ProfileAlternatives, self).update(*others)
+        for other in others:
+            self._register(other)
+
+    def symmetric_difference_update(self, other: Iterable[Alternative]) -> None:
+        other = list(other)
+        super(_ProfileAlternatives, self).symmetric_difference_update(other)
+        self._register(other)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
+
+
 class AbstractTrichotomousProfile(ABC, Iterable[AbstractTrichotomousBallot]):
     """
     Abstract class representing a profile, i.e., a collection of ballots.
@@ -33,16 +201,97 @@ class AbstractTrichotomousProfile(ABC, Iterable[AbstractTrichotomousBallot]):
         The set of all alternatives in the profile.
     max_size_selection : int or None
         The maximum number of alternatives that can be selected in a feasible selection (optional).
+    registry : AlternativeRegistry
+        The registry of the alternatives of the profile, mapping them to dense integer indices.
     """
 
     def __init__(
         self, alternatives: Iterable[Alternative] = None, max_size_selection: int = None
     ):
+        self._registry = None
         if alternatives is None:
             self.alternatives = set()
         else:
             self.alternatives = set(alternatives)
         self.max_size_selection = max_size_selection
+        self._aggregates = None
+
+    def _get_aggregates(self) -> ProfileAggregates:
+        """
+        Returns the cached aggregates of the profile, recomputing them if they are missing or if one of the ballots
+        of the profile has been modified since they were computed.
+        """
+        if self._aggregates is None or self._aggregates.outdated:
+            self._aggregates = ProfileAggregates.from_profile(self)
+        return self._aggregates
+
+    def _update_aggregates(
+        self, ballots: Iterable[AbstractTrichotomousBallot], multiplicity: int
+    ):
+        """
+        Updates the cached aggregates, if any, when the multiplicity of the ballots changes by `multiplicity`. Called
+        once the inner container has been modified.
+        """
+        if self._aggregates is not None:
+            if self._aggregates.outdated:
+                self._aggregates = None
+            else:
+                for ballot in ballots:
+                    self._aggregates.add_ballot(ballot, multiplicity)
+
+    def invalidate_aggregates(self):
+        """
+        Discards the cached scores of the profile. The scores of the profile (approval scores, supports, number of
+        ballots...) are cached and kept up to date when the profile is modified via its methods, or when one of its
+        ballots is modified. This method is thus only needed to free the memory used by the cache, which is rebuilt on
+        next access.
+        """
+        self._aggregates = None
+
+    def __getstate__(self):
+        # The cache is not kept since the copied ballots would not be observed by the copied aggregates
+        state = self.__dict__.copy()
+        state["_aggregates"] = None
+        return state
+
+    @property
+    def alternatives(self) -> set[Alternative]:
+        """
+        The set of all the alternatives of the profile. Once the registry of the profile exists, the alternatives added
+        to the set are registered as they are added.
+        """
+        return self._alternatives
+
+    @alternatives.setter
+    def alternatives(self, value: Iterable[Alternative]):
+        self._alternatives = _ProfileAlternatives(value, self._registry)
+
+    @property
+    def registry(self) -> AlternativeRegistry:
+        """
+        The registry of the alternatives of the profile, assigning a dense integer index to each alternative. It is
+        created on first access, registering the alternatives in sorted order when they can be sorted. Alternatives
+        later added to the profile are registered when they are added, after the existing ones, so that indices never
+        change.
+        """
+        if self._registry is None:
+            try:
+                alternatives = sorted(self.alternatives)
+            except TypeError:
+                alternatives = self.alternatives
+            self._set_registry(AlternativeRegistry(alternatives))
+        return self._registry
+
+    @registry.setter
+    def registry(self, value: AlternativeRegistry):
+        self._set_registry(value)
+
+    def _set_registry(self, registry: AlternativeRegistry) -> None:
+        """Sets the registry of the profile, registering the alternatives of the profile that are not in it yet."""
+        self._registry = registry
+        self._alternatives.registry = registry
+        for alt in self._alternatives:
+            registry.register(alt)
 
     def get_alternative_by_name(self, alt_name: str) -> Alternative | None:
         """
@@ -58,9 +307,9 @@ class AbstractTrichotomousProfile(ABC, Iterable[AbstractTrichotomousBallot]):
             Alternative | None
                 The alternative with the given name. None if there is no such alternative.
         """
-        for alt in self.alternatives:
-            if alt.name == alt_name:
-                return alt
+        alt = self.registry.get_by_name(alt_name)
+        if alt is not None and alt in self.alternatives:
+            return alt
 
     @property
     @abstractmethod
@@ -272,6 +521,53 @@ class AbstractTrichotomousProfile(ABC, Iterable[AbstractTrichotomousBallot]):
             An iterator over all subprofiles of the profile.
         """
 
+    def _bitmask_registry(self) -> AlternativeRegistry | None:
+        """
+        Returns the registry shared by all the ballots of the profile if they all are bitmask ballots using the same
+        registry, and None otherwise.
+        """
+        registry = None
+        for ballot in self._ballot_container:
+            if not isinstance(ballot, BitmaskTrichotomousBallot):
+                return None
+            if registry is None:
+                registry = ballot.registry
+            elif ballot.registry is not registry:
+                return None
+        return registry
+
+    def as_bitmask_multiprofile(
+        self, registry: AlternativeRegistry = None
+    ) -> TrichotomousMultiProfile:
+        """
+        Returns the multiprofile corresponding to this profile in which all ballots are converted to bitmask ballots
+        sharing the same registry.
+
+        Parameters
+        ----------
+        registry : AlternativeRegistry, optional
+            The registry used to encode the alternatives. Defaults to the registry of the profile.
+
+        Returns
+        -------
+        TrichotomousMultiProfile
+            The multiprofile with bitmask ballots.
+        """
+        if registry is None:
+            registry = self.registry
+        ballots_counter = Counter()
+        for ballot in self:
+            ballots_counter[
+                BitmaskTrichotomousBallot.from_ballot(ballot, registry)
+            ] += self.multiplicity(ballot)
+        res = TrichotomousMultiProfile(
+            ballots_counter,
+            alternatives=self.alternatives,
+            max_size_selection=self.max_size_selection,
+        )
+        res.registry = registry
+        return res
+
     def commonly_approved_alternatives(self) -> set[Alternative]:
         """
         Returns the pairwise intersection of the approved alternatives of all ballots in the profile.
@@ -281,6 +577,12 @@ class AbstractTrichotomousProfile(ABC, Iterable[AbstractTrichotomousBallot]):
             set[Alternative]
                 The set of alternatives commonly approved by all ballots.
         """
+        registry = self._bitmask_registry()
+        if registry is not None:
+            mask = -1
+            for ballot in self._ballot_container:
+                mask &= ballot.approved_mask
+            return set(registry.alternatives_from_mask(mask))
         return set.intersection(
             *(set(ballot.approved) for ballot in self._ballot_container)
         )
@@ -296,6 +598,12 @@ class AbstractTrichotomousProfile(ABC, Iterable[AbstractTrichotomousBallot]):
         """
         if len(self._ballot_container) == 0:
             return set()
+        registry = self._bitmask_registry()
+        if registry is not None:
+            mask = -1
+            for ballot in self._ballot_container:
+                mask &= ballot.disapproved_mask
+            return set(registry.alternatives_from_mask(mask))
         return set.intersection(
             *(set(ballot.disapproved) for ballot in self._ballot_container)
         )
@@ -315,6 +623,15 @@ class AbstractTrichotomousProfile(ABC, Iterable[AbstractTrichotomousBallot]):
                 The number of ballots with strictly positive satisfaction for the selection.
         """
         covered_voters = 0
+        registry = self._bitmask_registry()
+        if registry is not None:
+            selection_mask = registry.mask(selection.selected)
+            for ballot in self:
+                if ballot.num_approved_in(selection_mask) > ballot.num_disapproved_in(
+                    selection_mask
+                ):
+                    covered_voters += self.multiplicity(ballot)
+            return covered_voters
         for ballot in self:
             satisfaction = sum(
                 1 for alt in ballot.approved if selection.is_selected(alt)
@@ -367,72 +684,36 @@ class TrichotomousProfile(
         return self._ballots_list
 
     def support(self, alternative: Alternative) -> int:
-        score = 0
-        for ballot in self:
-            if alternative in ballot.approved:
-                score += 1
-            elif alternative in ballot.disapproved:
-                score -= 1
-        return score
+        return self._get_aggregates().support(alternative)
 
     def support_dict(self) -> defaultdict[Alternative, int]:
-        res = defaultdict(int)
-        for ballot in self:
-            for alt in ballot.approved:
-                res[alt] += 1
-            for alt in ballot.disapproved:
-                res[alt] -= 1
-        return res
+        return self._get_aggregates().support_dict()
 
     def approval_score(self, alternative: Alternative) -> int:
-        score = 0
-        for ballot in self:
-            if alternative in ballot.approved:
-                score += 1
-        return score
+        return self._get_aggregates().approval_scores.get(alternative, 0)
 
     def approval_score_dict(self) -> defaultdict[Alternative, int]:
-        res = defaultdict(int)
-        for ballot in self:
-            for alt in ballot.approved:
-                res[alt] += 1
-        return res
+        return defaultdict(int, self._get_aggregates().approval_scores)
 
     def disapproval_score(self, alternative: Alternative) -> int:
-        score = 0
-        for ballot in self:
-            if alternative in ballot.disapproved:
-                score += 1
-        return score
+        return self._get_aggregates().disapproval_scores.get(alternative, 0)
 
     def disapproval_score_dict(self) -> defaultdict[Alternative, int]:
-        res = defaultdict(int)
-        for ballot in self:
-            for alt in ballot.disapproved:
-                res[alt] += 1
-        return res
+        return defaultdict(int, self._get_aggregates().disapproval_scores)
 
     def approval_disapproval_score(self, alternative: Alternative) -> tuple[int, int]:
-        app_score = 0
-        disapp_score = 0
-        for ballot in self:
-            if alternative in ballot.approved:
-                app_score += 1
-            if alternative in ballot.disapproved:
-                disapp_score += 1
-        return app_score, disapp_score
+        aggregates = self._get_aggregates()
+        return aggregates.approval_scores.get(
+            alternative, 0
+        ), aggregates.disapproval_scores.get(alternative, 0)
 
     def approval_disapproval_score_dict(
         self,
     ) -> tuple[defaultdict[Alternative, int], defaultdict[Alternative, int]]:
-        app_scores = defaultdict(int)
-        disapp_scores = defaultdict(int)
-        for ballot in self:
-            for alt in ballot.approved:
-                app_scores[alt] += 1
-            for alt in ballot.disapproved:
-                disapp_scores[alt] += 1
-        return app_scores, disapp_scores
+        aggregates = self._get_aggregates()
+        return defaultdict(int, aggregates.approval_scores), defaultdict(
+            int, aggregates.disapproval_scores
+        )
 
     def selection_support(self, selection: Selection) -> int:
         res = 0
@@ -469,18 +750,53 @@ class TrichotomousProfile(
     def as_multiprofile(self) -> TrichotomousMultiProfile:
         """
         Returns the multiprofile corresponding to this profile. Ballots are converted to immutable frozen ballots.
+        Equal ballots are merged into a single ballot type whose multiplicity is the number of such ballots; each
+        ballot type is frozen only once.
 
         Returns
         -------
         TrichotomousMultiProfile
             The multiprofile representation of this profile with frozen ballots.
         """
-
-        return TrichotomousMultiProfile(
-            [ballot.freeze() for ballot in self],
+        ballot_type_counts = Counter(
+            (frozenset(ballot.approved), frozenset(ballot.disapproved))
+            for ballot in self
+        )
+        multiprofile = TrichotomousMultiProfile(
+            {
+                FrozenTrichotomousBallot(
+                    approved=approved, disapproved=disapproved
+                ): count
+                for (approved, disapproved), count in ballot_type_counts.items()
+            },
             alternatives=self.alternatives,
             max_size_selection=self.max_size_selection,
         )
+        if self._registry is not None:
+            multiprofile.registry = self._registry
+        return multiprofile
+
+    def as_matrix_profile(self) -> TrichotomousMatrixProfile:
+        """
+        Returns the matrix profile corresponding to this profile, with one row per ballot.
+
+        Returns
+        -------
+        TrichotomousMatrixProfile
+            The matrix representation of this profile.
+        """
+        return TrichotomousMatrixProfile(self)
+
+    def as_sparse_profile(self) -> TrichotomousSparseProfile:
+        """
+        Returns the sparse profile corresponding to this profile, with one row per ballot.
+
+        Returns
+        -------
+        TrichotomousSparseProfile
+            The sparse representation of this profile.
+        """
+        return TrichotomousSparseProfile(self)
 
     def all_sub_profiles(self) -> Iterator[TrichotomousProfile]:
         """
@@ -509,10 +825,24 @@ class TrichotomousProfile(
         return self._ballots_list[index]
 
     def __setitem__(self, index, value):
-        self._ballots_list[index] = value
+        if isinstance(index, slice):
+            value = list(value)
+            old_values = self._ballots_list[index]
+            self._ballots_list[index] = value
+            self._update_aggregates(old_values, -1)
+            self._update_aggregates(value, 1)
+        else:
+            old_value = self._ballots_list[index]
+            self._ballots_list[index] = value
+            self._update_aggregates((old_value,), -1)
+            self._update_aggregates((value,), 1)
 
     def __delitem__(self, index):
+        old_values = self._ballots_list[index]
         del self._ballots_list[index]
+        if not isinstance(index, slice):
+            old_values = (old_values,)
+        self._update_aggregates(old_values, -1)
 
     def __len__(self):
         return len(self._ballots_list)
@@ -528,21 +858,29 @@ class TrichotomousProfile(
 
     def append(self, value):
         self._ballots_list.append(value)
+        self._update_aggregates((value,), 1)
 
     def extend(self, iterable):
-        self._ballots_list.extend(iterable)
+        values = list(iterable)
+        self._ballots_list.extend(values)
+        self._update_aggregates(values, 1)
 
     def insert(self, index, value):
         self._ballots_list.insert(index, value)
+        self._update_aggregates((value,), 1)
 
     def remove(self, value):
         self._ballots_list.remove(value)
+        self._update_aggregates((value,), -1)
 
     def pop(self, index=-1):
-        return self._ballots_list.pop(index)
+        value = self._ballots_list.pop(index)
+        self._update_aggregates((value,), -1)
+        return value
 
     def clear(self):
         self._ballots_list.clear()
+        self._aggregates = None
 
     def index(self, value, start=0, end=None):
         if end is None:
@@ -571,9 +909,11 @@ class TrichotomousProfile(
 
     def __iadd__(self, other):
         if isinstance(other, TrichotomousProfile):
-            self._ballots_list += other._ballots_list
+            other = other._ballots_list
         else:
-            self._ballots_list += other
+            other = list(other)
+        self._ballots_list += other
+        self._update_aggregates(other, 1)
         return self
 
     def __mul__(self, n):
@@ -587,6 +927,7 @@ class TrichotomousProfile(
         if not isinstance(n, int):
             return ValueError("Cannot multiply profiles with non-int.")
         self._ballots_list *= n
+        self._aggregates = None
         return self
 
     def __repr__(self):
@@ -650,81 +991,48 @@ class TrichotomousMultiProfile(
         return self._ballots_counter
 
     def support(self, alternative: Alternative) -> int:
-        score = 0
-        for ballot, count in self.items():
-            if alternative in ballot.approved:
-                score += count
-            elif alternative in ballot.disapproved:
-                score -= count
-        return score
+        return self._get_aggregates().support(alternative)
 
     def support_dict(self) -> dict[Alternative, int]:
-        res = dict()
-        for ballot, count in self.items():
-            for alt in ballot.approved:
-                if alt in res:
-                    res[alt] += count
-                else:
-                    res[alt] = count
-            for alt in ballot.disapproved:
-                if alt in res:
-                    res[alt] -= count
-                else:
-                    res[alt] = -count
-        return res
+        return dict(self._get_aggregates().support_dict())
 
     def approval_score(self, alternative: Alternative) -> int:
-        score = 0
-        for ballot, count in self.items():
-            if alternative in ballot.approved:
-                score += count
-        return score
+        return self._get_aggregates().approval_scores.get(alternative, 0)
 
     def approval_score_dict(self) -> defaultdict[Alternative, int]:
-        res = defaultdict(int)
-        for ballot, count in self.items():
-            for alt in ballot.approved:
-                res[alt] += count
-        return res
+        return defaultdict(int, self._get_aggregates().approval_scores)
 
     def disapproval_score(self, alternative: Alternative) -> int:
-        score = 0
-        for ballot, count in self.items():
-            if alternative in ballot.disapproved:
-                score += count
-        return score
+        return self._get_aggregates().disapproval_scores.get(alternative, 0)
 
     def disapproval_score_dict(self) -> defaultdict[Alternative, int]:
-        res = defaultdict(int)
-        for ballot, count in self.items():
-            for alt in ballot.disapproved:
-                res[alt] += count
-        return res
+        return defaultdict(int, self._get_aggregates().disapproval_scores)
 
     def approval_disapproval_score(self, alternative: Alternative) -> tuple[int, int]:
-        app_score = 0
-        disapp_score = 0
-        for ballot, count in self.items():
-            if alternative in ballot.approved:
-                app_score += count
-            if alternative in ballot.disapproved:
-                disapp_score += count
-        return app_score, disapp_score
+        aggregates = self._get_aggregates()
+        return aggregates.approval_scores.get(
+            alternative, 0
+        ), aggregates.disapproval_scores.get(alternative, 0)
 
     def approval_disapproval_score_dict(
         self,
     ) -> tuple[defaultdict[Alternative, int], defaultdict[Alternative, int]]:
-        app_scores = defaultdict(int)
-        disapp_scores = defaultdict(int)
-        for ballot, count in self.items():
-            for alt in ballot.approved:
-                app_scores[alt] += count
-            for alt in ballot.disapproved:
-                disapp_scores[alt] += count
-        return app_scores, disapp_scores
+        aggregates = self._get_aggregates()
+        return defaultdict(int, aggregates.approval_scores), defaultdict(
+            int, aggregates.disapproval_scores
+        )
 
     def selection_support(self, selection: Selection) -> int:
         res = 0
+        registry = self._bitmask_registry()
+        if registry is not None:
+            selection_mask = registry.mask(selection.selected)
+            for ballot, count in self.items():
+                res += count * (
+                    ballot.num_approved_in(selection_mask)
+                    - ballot.num_disapproved_in(selection_mask)
+                )
+            return res
         for ballot, count in self.items():
             ballot_support = sum(1 for a in ballot.approved if selection.is_selected(a))
             ballot_support -= sum(
@@ -743,7 +1051,7 @@ class TrichotomousMultiProfile(
             Total number of ballots.
         """
         # Re-implemented as it is not available in Python <3.10
-        return sum(self.values())
+        return self._get_aggregates().num_ballots
 
     def num_ballots(self) -> int:
         return self.total()
@@ -805,13 +1113,18 @@ class TrichotomousMultiProfile(
         return self._ballots_counter[key]
 
     def __setitem__(self, key, value):
+        old_value = self._ballots_counter[key]
         if value <= 0:
             del self._ballots_counter[key]
+            value = 0
         else:
             self._ballots_counter[key] = value
+        self._update_aggregates((key,), value - old_value)
 
     def __delitem__(self, key):
+        old_value = self._ballots_counter[key]
         del self._ballots_counter[key]
+        self._update_aggregates((key,), -old_value)
 
     def __iter__(self):
         return iter(self._ballots_counter)
@@ -843,6 +1156,7 @@ class TrichotomousMultiProfile(
             self._ballots_counter += other._ballots_counter
         else:
             self._ballots_counter += other
+        self._aggregates = None
         return self
 
     def __sub__(self, other):
@@ -860,6 +1174,7 @@ class TrichotomousMultiProfile(
             self._ballots_counter -= other._ballots_counter
         else:
             self._ballots_counter -= other
+        self._aggregates = None
         return self
 
     def __or__(self, other):
@@ -877,6 +1192,7 @@ class TrichotomousMultiProfile(
             self._ballots_counter |= other._ballots_counter
         else:
             self._ballots_counter |= other
+        self._aggregates = None
         return self
 
     def __and__(self, other):
@@ -894,6 +1210,7 @@ class TrichotomousMultiProfile(
             self._ballots_counter &= other._ballots_counter
         else:
             self._ballots_counter &= other
+        self._aggregates = None
         return self
 
     def elements(self):
@@ -903,13 +1220,877 @@ class TrichotomousMultiProfile(
         return self._ballots_counter.most_common(n)
 
     def subtract(self, other):
-        self._ballots_counter.subtract(other)
+        delta = Counter(other)
+        self._ballots_counter.subtract(delta)
+        for ballot, count in delta.items():
+            self._update_aggregates((ballot,), -count)
 
     def update(self, iterable=None, **kwargs):
-        self._ballots_counter.update(iterable, **kwargs)
+        delta = Counter(iterable, **kwargs)
+        self._ballots_counter.update(delta)
+        for ballot, count in delta.items():
+            self._update_aggregates((ballot,), count)
 
     def clear(self):
         self._ballots_counter.clear()
+        self._aggregates = None
 
     def copy(self):
-        return TrichotomousMultiProfile(self)
+        new_profile = TrichotomousMultiProfile(self)
+        if self._aggregates is not None:
+            new_profile._aggregates = self._aggregates.copy()
+        return new_profile
+
+    def as_matrix_profile(self) -> TrichotomousMatrixProfile:
+        """
+        Returns the matrix profile corresponding to this multiprofile, with one row per distinct ballot weighted by its
+        multiplicity.
+
+        Returns
+        -------
+        TrichotomousMatrixProfile
+            The matrix representation of this multiprofile.
+        """
+        return TrichotomousMatrixProfile(self)
+
+    def as_sparse_profile(self) -> TrichotomousSparseProfile:
+        """
+        Returns the sparse profile corresponding to this multiprofile, with one row per distinct ballot weighted by its
+        multiplicity.
+
+        Returns
+        -------
+        TrichotomousSparseProfile
+            The sparse representation of this multiprofile.
+        """
+        return TrichotomousSparseProfile(self)
+
+
+class _IndexedTrichotomousProfile(AbstractTrichotomousProfile):
+    """
+    Base class for the profiles storing their ballots in arrays of alternative indices, the indices being the ones of
+    the registry of the profile. Each row of the arrays represents a ballot and is associated with a weight.
+
+    Iterating over such a profile yields one frozen ballot per distinct row, and the multiplicity of such a ballot is
+    the sum of the weights of all the rows equal to it. The order of the rows is preserved when converting the
+    profile back to a :py:class:`~trivoting.election.trichotomous_profile.TrichotomousProfile`.
+    """
+
+    def __init__(
+        self, alternatives: Iterable[Alternative] = None, max_size_selection: int = None
+    ):
+        AbstractTrichotomousProfile.__init__(self, alternatives, max_size_selection)
+        self._ballot_types_cache = None
+        self._column_counts_cache = None
+
+    @AbstractTrichotomousProfile.registry.setter
+    def registry(self, value: AlternativeRegistry):
+        raise AttributeError(
+            "The registry of a profile stored as arrays defines the indices used in the arrays, it cannot be "
+            "replaced."
+        )
+
+    @property
+    @abstractmethod
+    def weights(self) -> np.ndarray:
+        """The weight, i.e., the multiplicity, of each row."""
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows."""
+        return len(self.weights)
+
+    @property
+    def column_alternatives(self) -> list[Alternative]:
+        """The alternatives corresponding to the indices used in the arrays, in order."""
+        return list(self._registry)
+
+    @abstractmethod
+    def _rows(self) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Iterates over the rows, yielding the sorted indices of the approved and of the disapproved alternatives."""
+
+    @abstractmethod
+    def _column_counts(self, weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns, for each index of the registry, the total weight of the rows approving of the alternative and the
+        total weight of the rows disapproving of it.
+        """
+
+    @abstractmethod
+    def _row_satisfactions(self, selection_indices: np.ndarray) -> np.ndarray:
+        """Returns the number of approved minus disapproved selected alternatives, for each row."""
+
+    def _invalidate_caches(self) -> None:
+        self._ballot_types_cache = None
+        self._column_counts_cache = None
+
+    def _cached_column_counts(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._column_counts_cache is None:
+            self._column_counts_cache = self._column_counts(self.weights)
+        return self._column_counts_cache
+
+    def _column_count(self, alternative: Alternative, side: int) -> int:
+        index = self._registry.get_index(alternative)
+        counts = self._cached_column_counts()[side]
+        if index is None or index >= len(counts):
+            return 0
+        return int(counts[index])
+
+    def _count_dict(self, counts: np.ndarray) -> defaultdict[Alternative, int]:
+        res = defaultdict(int)
+        for j in np.flatnonzero(counts):
+            res[self._registry.alternative(j)] = int(counts[j])
+        return res
+
+    def _selection_indices(self, selection: Selection) -> np.ndarray:
+        """Returns the indices of the selected alternatives."""
+        indices = (self._registry.get_index(alt) for alt in selection.selected)
+        return np.fromiter(sorted(i for i in indices if i is not None), dtype=np.intp)
+
+    def _ballot_from_indices(
+        self, approved_indices: Iterable[int], disapproved_indices: Iterable[int]
+    ) -> FrozenTrichotomousBallot:
+        return FrozenTrichotomousBallot(
+            approved=[self._registry.alternative(j) for j in approved_indices],
+            disapproved=[self._registry.alternative(j) for j in disapproved_indices],
+        )
+
+    def _ballot_types(self) -> dict[FrozenTrichotomousBallot, int]:
+        """Returns the distinct ballots of the profile, ordered by first appearance, mapped to their multiplicity."""
+        if self._ballot_types_cache is None:
+            weights_by_key = dict()
+            for (approved, disapproved), weight in zip(self._rows(), self.weights):
+                key = (approved.tobytes(), disapproved.tobytes())
+                if key in weights_by_key:
+                    weights_by_key[key][2] += int(weight)
+                else:
+                    weights_by_key[key] = [approved, disapproved, int(weight)]
+            self._ballot_types_cache = {
+                self._ballot_from_indices(approved, disapproved): weight
+                for approved, disapproved, weight in weights_by_key.values()
+            }
+        return self._ballot_types_cache
+
+    def _as_frozen(
+        self, ballot: AbstractTrichotomousBallot
+    ) -> FrozenTrichotomousBallot | None:
+        """Returns the ballot expressed in the same form as the ballots obtained when iterating over the profile, or
+        None if it involves an alternative that is not registered, in which case it cannot be a ballot of the
+        profile."""
+        for alt in chain(ballot.approved, ballot.disapproved):
+            if alt not in self._registry:
+                return None
+        approved = sorted(self._registry.index(a) for a in ballot.approved)
+        disapproved = sorted(self._registry.index(a) for a in ballot.disapproved)
+        return self._ballot_from_indices(approved, disapproved)
+
+    @property
+    def _ballot_container(self) -> Collection[AbstractTrichotomousBallot]:
+        return self._ballot_types()
+
+    def multiplicity(self, ballot: AbstractTrichotomousBallot) -> int:
+        """
+        Returns the multiplicity of a ballot, i.e., the total weight of the rows corresponding to it.
+
+        Parameters
+        ----------
+        ballot : AbstractTrichotomousBallot
+            The ballot whose multiplicity is requested.
+
+        Returns
+        -------
+        int
+            The multiplicity of the ballot.
+        """
+        types = self._ballot_types()
+        if isinstance(ballot, FrozenTrichotomousBallot) and ballot in types:
+            return types[ballot]
+        frozen_ballot = self._as_frozen(ballot)
+        if frozen_ballot is None:
+            return 0
+        return types.get(frozen_ballot, 0)
+
+    def num_ballots(self) -> int:
+        return int(self.weights.sum())
+
+    def support(self, alternative: Alternative) -> int:
+        return self._column_count(alternative, 0) - self._column_count(alternative, 1)
+
+    def support_dict(self) -> defaultdict[Alternative, int]:
+        app_scores, disapp_scores = self._cached_column_counts()
+        res = defaultdict(int)
+        for j in np.flatnonzero(app_scores + disapp_scores):
+            res[self._registry.alternative(j)] = int(app_scores[j] - disapp_scores[j])
+        return res
+
+    def approval_score(self, alternative: Alternative) -> int:
+        return self._column_count(alternative, 0)
+
+    def approval_score_dict(self) -> defaultdict[Alternative, int]:
+        return self._count_dict(self._cached_column_counts()[0])
+
+    def disapproval_score(self, alternative: Alternative) -> int:
+        return self._column_count(alternative, 1)
+
+    def disapproval_score_dict(self) -> defaultdict[Alternative, int]:
+        return self._count_dict(self._cached_column_counts()[1])
+
+    def approval_disapproval_score(self, alternative: Alternative) -> tuple[int, int]:
+        return self._column_count(alternative, 0), self._column_count(alternative, 1)
+
+    def approval_disapproval_score_dict(
+        self,
+    ) -> tuple[defaultdict[Alternative, int], defaultdict[Alternative, int]]:
+        app_scores, disapp_scores = self._cached_column_counts()
+        return self._count_dict(app_scores), self._count_dict(disapp_scores)
+
+    def selection_support(self, selection: Selection) -> int:
+        satisfactions = self._row_satisfactions(self._selection_indices(selection))
+        return int(self.weights @ satisfactions)
+
+    def num_covered_ballots(self, selection: Selection) -> int:
+        satisfactions = self._row_satisfactions(self._selection_indices(selection))
+        return int(self.weights[satisfactions > 0].sum())
+
+    def commonly_approved_alternatives(self) -> set[Alternative]:
+        if self.num_rows == 0:
+            return set()
+        app_rows, _ = self._column_counts(np.ones(self.num_rows, dtype=np.int64))
+        return {
+            self._registry.alternative(j)
+            for j in np.flatnonzero(app_rows == self.num_rows)
+        }
+
+    def commonly_disapproved_alternatives(self) -> set[Alternative]:
+        if self.num_rows == 0:
+            return set()
+        _, disapp_rows = self._column_counts(np.ones(self.num_rows, dtype=np.int64))
+        return {
+            self._registry.alternative(j)
+            for j in np.flatnonzero(disapp_rows == self.num_rows)
+        }
+
+    def all_sub_profiles(self) -> Iterator[_IndexedTrichotomousProfile]:
+        """
+        Generates all possible sub-profiles of the current profile.
+
+        A sub-profile is any profile obtained by choosing any number (including zero) of occurrences
+        of each distinct ballot up to their multiplicity in the current profile.
+
+        Yields
+        ------
+        _IndexedTrichotomousProfile
+            Each possible sub-profile, of the same type as the current profile.
+        """
+        items = list(self._ballot_types().items())
+        for counts in product(*(range(count + 1) for _, count in items)):
+            yield type(self)(
+                TrichotomousMultiProfile(
+                    {key: count for (key, _), count in zip(items, counts) if count > 0}
+                ),
+                alternatives=self.alternatives,
+                max_size_selection=self.max_size_selection,
+            )
+
+    def as_profile(self) -> TrichotomousProfile:
+        """
+        Returns the profile corresponding to this profile, with one mutable ballot per voter. Rows are repeated as
+        many times as their weight, in order.
+
+        Returns
+        -------
+        TrichotomousProfile
+            The corresponding profile.
+        """
+        ballots = []
+        for (approved, disapproved), weight in zip(self._rows(), self.weights):
+            approved = [self._registry.alternative(j) for j in approved]
+            disapproved = [self._registry.alternative(j) for j in disapproved]
+            for _ in range(weight):
+                ballots.append(
+                    TrichotomousBallot(approved=approved, disapproved=disapproved)
+                )
+        return TrichotomousProfile(
+            ballots,
+            alternatives=self.alternatives,
+            max_size_selection=self.max_size_selection,
+        )
+
+    def as_multiprofile(self) -> TrichotomousMultiProfile:
+        """
+        Returns the multiprofile corresponding to this profile.
+
+        Returns
+        -------
+        TrichotomousMultiProfile
+            The corresponding multiprofile.
+        """
+        return TrichotomousMultiProfile(
+            self._ballot_types(),
+            alternatives=self.alternatives,
+            max_size_selection=self.max_size_selection,
+        )
+
+    def __iter__(self):
+        return iter(self._ballot_types())
+
+    def __len__(self):
+        return len(self._ballot_types())
+
+    def __contains__(self, item):
+        return self.multiplicity(item) > 0
+
+    def __repr__(self):
+        return repr(self._ballot_types())
+
+    def __str__(self):
+        return str(self._ballot_types())
+
+
+class TrichotomousMatrixProfile(_IndexedTrichotomousProfile):
+    """
+    Represents a trichotomous profile stored as a dense matrix. Each row of the matrix corresponds to a ballot and each
+    column to an alternative. An entry is equal to 1 if the ballot approves of the alternative, to -1 if it disapproves
+    of it, and to 0 otherwise. A weight vector stores the multiplicity of each row.
+
+    All the scores are computed via vectorised reductions over the matrix, which is much faster than iterating over
+    the ballots for large profiles.
+
+    Iterating over the profile yields one frozen ballot per distinct row of the matrix, and the multiplicity of such a
+    ballot is the sum of the weights of all the rows equal to it. The order of the rows is preserved when converting
+    the profile back to a :py:class:`~trivoting.election.trichotomous_profile.TrichotomousProfile`.
+
+    Parameters
+    ----------
+    init : Iterable[AbstractTrichotomousBallot], optional
+        An iterable of trichotomous ballots used to initialize the profile. If `init` is an
+        `AbstractTrichotomousProfile`, the multiplicities of its ballots are used as weights. Defaults to empty.
+    alternatives : Iterable[Alternative], optional
+        An iterable of all alternatives present in the profile. If not provided and `init` is
+        an `AbstractTrichotomousProfile`, its alternatives are used.
+    max_size_selection : int, optional
+        The maximum number of alternatives to be selected when computing the outcome of a rule on the profile.
+        Used notably when reading files from preference libraries. If not provided and `init` is an
+        `AbstractTrichotomousProfile`, its `max_size_selection` is used.
+
+    Attributes
+    ----------
+    alternatives : set[Alternative]
+        The set of all alternatives in the profile.
+    max_size_selection : int
+        Maximum number of alternatives to select in an outcome (optional).
+    """
+
+    _CHUNK_SIZE = 4096
+    """Number of rows processed at once in the reductions, bounds the size of the temporary arrays."""
+
+    def __init__(
+        self,
+        init: Iterable[AbstractTrichotomousBallot] = (),
+        *,
+        alternatives: Iterable[Alternative] = None,
+        max_size_selection: int = None,
+    ) -> None:
+        if alternatives is None and isinstance(init, AbstractTrichotomousProfile):
+            alternatives = init.alternatives
+        if max_size_selection is None and isinstance(init, AbstractTrichotomousProfile):
+            max_size_selection = init.max_size_selection
+        _IndexedTrichotomousProfile.__init__(self, alternatives, max_size_selection)
+
+        # The columns of the matrix are the indices of the registry of the profile
+        registry = self.registry
+
+        if isinstance(init, AbstractTrichotomousProfile):
+            ballots_weights = [(ballot, init.multiplicity(ballot)) for ballot in init]
+        else:
+            ballots_weights = [(ballot, 1) for ballot in init]
+
+        row_indices = []
+        column_indices = []
+        values = []
+        for i, (ballot, _) in enumerate(ballots_weights):
+            for alt in ballot.approved:
+                row_indices.append(i)
+                column_indices.append(registry.register(alt))
+                values.append(1)
+            for alt in ballot.disapproved:
+                row_indices.append(i)
+                column_indices.append(registry.register(alt))
+                values.append(-1)
+
+        self._num_rows = len(ballots_weights)
+        self._matrix_buffer = np.zeros((self._num_rows, len(registry)), dtype=np.int8)
+        self._matrix_buffer[row_indices, column_indices] = values
+        self._weights_buffer = np.fromiter(
+            (w for _, w in ballots_weights), dtype=np.int64, count=self._num_rows
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        matrix: np.ndarray,
+        weights: np.ndarray,
+        registry: AlternativeRegistry,
+        *,
+        alternatives: Iterable[Alternative] = None,
+        max_size_selection: int = None,
+    ) -> TrichotomousMatrixProfile:
+        """
+        Builds a matrix profile directly from its arrays, without going through ballot objects.
+
+        Parameters
+        ----------
+        matrix : numpy.ndarray
+            The voter-by-alternative matrix, with entries in {-1, 0, 1}.
+        weights : numpy.ndarray
+            The weight of each row of the matrix.
+        registry : AlternativeRegistry
+            The registry of the profile, the column `j` of the matrix corresponds to the alternative of index `j`.
+        alternatives : Iterable[Alternative], optional
+            The alternatives of the profile. Defaults to all the alternatives of the registry.
+        max_size_selection : int, optional
+            The maximum number of alternatives to be selected.
+
+        Returns
+        -------
+        TrichotomousMatrixProfile
+            The profile.
+        """
+        if alternatives is None:
+            alternatives = registry
+        profile = cls(alternatives=(), max_size_selection=max_size_selection)
+        profile.alternatives = set(alternatives)
+        # Registers the alternatives that are not columns of the matrix yet
+        profile._set_registry(registry)
+        profile._num_rows = matrix.shape[0]
+        profile._matrix_buffer = np.zeros(
+            (matrix.shape[0], len(registry)), dtype=np.int8
+        )
+        profile._matrix_buffer[:, : matrix.shape[1]] = matrix
+        profile._weights_buffer = np.array(weights, dtype=np.int64)
+        return profile
+
+    def _reserve(self, num_rows: int, num_columns: int) -> None:
+        """Grows the buffers, if needed, so that they can hold the given number of rows and columns."""
+        buffer_num_rows, buffer_num_columns = self._matrix_buffer.shape
+        if num_rows > buffer_num_rows or num_columns > buffer_num_columns:
+            # Amortised growth of the buffers
+            if num_rows > buffer_num_rows:
+                num_rows = max(2 * buffer_num_rows, num_rows)
+            else:
+                num_rows = buffer_num_rows
+            num_columns = max(buffer_num_columns, num_columns)
+            new_matrix = np.zeros((num_rows, num_columns), dtype=np.int8)
+            new_matrix[: self._num_rows, :buffer_num_columns] = self._matrix_buffer[
+                : self._num_rows
+            ]
+            new_weights = np.zeros(num_rows, dtype=np.int64)
+            new_weights[: self._num_rows] = self.weights
+            self._matrix_buffer = new_matrix
+            self._weights_buffer = new_weights
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        The voter-by-alternative matrix of the profile. The column `j` corresponds to the alternative of index `j` in
+        the registry of the profile.
+        """
+        self._reserve(self._num_rows, len(self._registry))
+        return self._matrix_buffer[: self._num_rows, : len(self._registry)]
+
+    @property
+    def weights(self) -> np.ndarray:
+        """The weight, i.e., the multiplicity, of each row of the matrix."""
+        return self._weights_buffer[: self._num_rows]
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows of the matrix."""
+        return self._num_rows
+
+    def _rows(self) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        for row in self.matrix:
+            yield np.flatnonzero(row == 1), np.flatnonzero(row == -1)
+
+    def _column_counts(self, weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        matrix = self.matrix
+        app_counts = np.zeros(matrix.shape[1], dtype=np.int64)
+        disapp_counts = np.zeros(matrix.shape[1], dtype=np.int64)
+        for start in range(0, matrix.shape[0], self._CHUNK_SIZE):
+            end = start + self._CHUNK_SIZE
+            app_counts += weights[start:end] @ (matrix[start:end] == 1)
+            disapp_counts += weights[start:end] @ (matrix[start:end] == -1)
+        return app_counts, disapp_counts
+
+    def _row_satisfactions(self, selection_indices: np.ndarray) -> np.ndarray:
+        return self.matrix[:, selection_indices].sum(axis=1, dtype=np.int64)
+
+    def _ballot_types(self) -> dict[FrozenTrichotomousBallot, int]:
+        if self._ballot_types_cache is None:
+            types = dict()
+            if self._num_rows > 0:
+                unique_rows, inverse = np.unique(
+                    self.matrix, axis=0, return_inverse=True
+                )
+                type_weights = np.bincount(
+                    inverse.reshape(-1),
+                    weights=self.weights,
+                    minlength=len(unique_rows),
+                )
+                # Types are ordered by first appearance in the matrix
+                first_rows = np.full(len(unique_rows), self._num_rows)
+                np.minimum.at(
+                    first_rows, inverse.reshape(-1), np.arange(self._num_rows)
+                )
+                for t in np.argsort(first_rows, kind="stable"):
+                    row = unique_rows[t]
+                    ballot = self._ballot_from_indices(
+                        np.flatnonzero(row == 1), np.flatnonzero(row == -1)
+                    )
+                    types[ballot] = int(type_weights[t])
+            self._ballot_types_cache = types
+        return self._ballot_types_cache
+
+    def add_ballot(self, ballot: AbstractTrichotomousBallot, weight: int = 1):
+        """
+        Adds a ballot to the profile as a new row of the matrix.
+
+        Parameters
+        ----------
+        ballot : AbstractTrichotomousBallot
+            The ballot to add.
+        weight : int, optional
+            The weight of the new row. Defaults to 1.
+        """
+        approved_indices = [self._registry.register(a) for a in ballot.approved]
+        disapproved_indices = [self._registry.register(a) for a in ballot.disapproved]
+        self._reserve(self._num_rows + 1, len(self._registry))
+        row = self._matrix_buffer[self._num_rows]
+        row[:] = 0
+        row[approved_indices] = 1
+        row[disapproved_indices] = -1
+        self._weights_buffer[self._num_rows] = weight
+        self._num_rows += 1
+        self._invalidate_caches()
+
+    def copy(self) -> TrichotomousMatrixProfile:
+        return TrichotomousMatrixProfile.from_arrays(
+            self.matrix.copy(),
+            self.weights.copy(),
+            AlternativeRegistry(self._registry),
+            alternatives=self.alternatives,
+            max_size_selection=self.max_size_selection,
+        )
+
+
+class TrichotomousSparseProfile(_IndexedTrichotomousProfile):
+    """
+    Represents a trichotomous profile stored in compressed sparse row (CSR) format. For each ballot, only the indices
+    of the approved and of the disapproved alternatives are stored, so that the memory used per ballot grows with the
+    length of the ballot and not with the number of alternatives. This is the most compact representation for
+    elections with many alternatives in which voters only approve of a few of them, as is typical of participatory
+    budgeting.
+
+    The approved alternatives of row `i` have indices `approved_indices[approved_indptr[i]:approved_indptr[i + 1]]`
+    in the registry of the profile, and similarly for the disapproved alternatives. A weight vector stores the
+    multiplicity of each row. Scores are computed via vectorised operations on these arrays.
+
+    Iterating over the profile yields one frozen ballot per distinct row, and the multiplicity of such a ballot is the
+    sum of the weights of all the rows equal to it. The profile can be sliced to select a subset of the rows:
+    `profile[i]` returns the ballot of row `i` and `profile[start:end]` the profile formed by the corresponding rows.
+
+    Parameters
+    ----------
+    init : Iterable[AbstractTrichotomousBallot], optional
+        An iterable of trichotomous ballots used to initialize the profile. If `init` is an
+        `AbstractTrichotomousProfile`, the multiplicities of its ballots are used as weights. Defaults to empty.
+    alternatives : Iterable[Alternative], optional
+        An iterable of all alternatives present in the profile. If not provided and `init` is
+        an `AbstractTrichotomousProfile`, its alternatives are used.
+    max_size_selection : int, optional
+        The maximum number of alternatives to be selected when computing the outcome of a rule on the profile.
+        Used notably when reading files from preference libraries. If not provided and `init` is an
+        `AbstractTrichotomousProfile`, its `max_size_selection` is used.
+
+    Attributes
+    ----------
+    alternatives : set[Alternative]
+        The set of all alternatives in the profile.
+    max_size_selection : int
+        Maximum number of alternatives to select in an outcome (optional).
+    """
+
+    def __init__(
+        self,
+        init: Iterable[AbstractTrichotomousBallot] = (),
+        *,
+        alternatives: Iterable[Alternative] = None,
+        max_size_selection: int = None,
+    ) -> None:
+        if alternatives is None and isinstance(init, AbstractTrichotomousProfile):
+            alternatives = init.alternatives
+        if max_size_selection is None and isinstance(init, AbstractTrichotomousProfile):
+            max_size_selection = init.max_size_selection
+        _IndexedTrichotomousProfile.__init__(self, alternatives, max_size_selection)
+
+        # The indices stored are the ones of the registry of the profile
+        registry = self.registry
+
+        if isinstance(init, AbstractTrichotomousProfile):
+            ballots_weights = [(ballot, init.multiplicity(ballot)) for ballot in init]
+        else:
+            ballots_weights = [(ballot, 1) for ballot in init]
+
+        self._approved_indices = np.zeros(0, dtype=np.int32)
+        self._approved_indptr = np.zeros(1, dtype=np.int64)
+        self._disapproved_indices = np.zeros(0, dtype=np.int32)
+        self._disapproved_indptr = np.zeros(1, dtype=np.int64)
+        self._weights = np.zeros(0, dtype=np.int64)
+        self._pending_rows = [
+            (
+                sorted(registry.register(a) for a in ballot.approved),
+                sorted(registry.register(a) for a in ballot.disapproved),
+                weight,
+            )
+            for ballot, weight in ballots_weights
+        ]
+
+    @classmethod
+    def from_arrays(
+        cls,
+        approved_indices: np.ndarray,
+        approved_indptr: np.ndarray,
+        disapproved_indices: np.ndarray,
+        disapproved_indptr: np.ndarray,
+        weights: np.ndarray,
+        registry: AlternativeRegistry,
+        *,
+        alternatives: Iterable[Alternative] = None,
+        max_size_selection: int = None,
+    ) -> TrichotomousSparseProfile:
+        """
+        Builds a sparse profile directly from its CSR arrays, without going through ballot objects. The arrays are
+        used as is, they are not copied. Indices are expected to be sorted within each row.
+
+        Parameters
+        ----------
+        approved_indices : numpy.ndarray
+            The indices of the approved alternatives, row after row.
+        approved_indptr : numpy.ndarray
+            The pointers to the start of each row in `approved_indices`, of length the number of rows plus one.
+        disapproved_indices : numpy.ndarray
+            The indices of the disapproved alternatives, row after row.
+        disapproved_indptr : numpy.ndarray
+            The pointers to the start of each row in `disapproved_indices`, of length the number of rows plus one.
+        weights : numpy.ndarray
+            The weight of each row.
+        registry : AlternativeRegistry
+            The registry of the profile, mapping the indices to the alternatives.
+        alternatives : Iterable[Alternative], optional
+            The alternatives of the profile. Defaults to all the alternatives of the registry.
+        max_size_selection : int, optional
+            The maximum number of alternatives to be selected.
+
+        Returns
+        -------
+        TrichotomousSparseProfile
+            The profile.
+        """
+        if alternatives is None:
+            alternatives = registry
+        profile = cls(alternatives=(), max_size_selection=max_size_selection)
+        profile.alternatives = set(alternatives)
+        profile._set_registry(registry)
+        profile._approved_indices = approved_indices
+        profile._approved_indptr = approved_indptr
+        profile._disapproved_indices = disapproved_indices
+        profile._disapproved_indptr = disapproved_indptr
+        profile._weights = weights
+        return profile
+
+    def _flush_pending_rows(self) -> None:
+        """Appends the rows added since the last access to the CSR arrays."""
+        if self._pending_rows:
+            rows = self._pending_rows
+            self._pending_rows = []
+            self._approved_indices, self._approved_indptr = self._extend_csr(
+                self._approved_indices, self._approved_indptr, [r[0] for r in rows]
+            )
+            self._disapproved_indices, self._disapproved_indptr = self._extend_csr(
+                self._disapproved_indices,
+                self._disapproved_indptr,
+                [r[1] for r in rows],
+            )
+            self._weights = np.concatenate(
+                (self._weights, np.array([r[2] for r in rows], dtype=np.int64))
+            )
+
+    @staticmethod
+    def _extend_csr(
+        indices: np.ndarray, indptr: np.ndarray, new_rows: list[list[int]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        lengths = np.fromiter((len(r) for r in new_rows), dtype=np.int64)
+        new_indices = np.fromiter(
+            (j for r in new_rows for j in r), dtype=np.int32, count=int(lengths.sum())
+        )
+        new_indptr = indptr[-1] + np.cumsum(lengths)
+        return np.concatenate((indices, new_indices)), np.concatenate(
+            (indptr, new_indptr)
+        )
+
+    @property
+    def approved_indices(self) -> np.ndarray:
+        """The indices of the approved alternatives, row after row."""
+        self._flush_pending_rows()
+        return self._approved_indices
+
+    @property
+    def approved_indptr(self) -> np.ndarray:
+        """The pointers to the start of each row in `approved_indices`."""
+        self._flush_pending_rows()
+        return self._approved_indptr
+
+    @property
+    def disapproved_indices(self) -> np.ndarray:
+        """The indices of the disapproved alternatives, row after row."""
+        self._flush_pending_rows()
+        return self._disapproved_indices
+
+    @property
+    def disapproved_indptr(self) -> np.ndarray:
+        """The pointers to the start of each row in `disapproved_indices`."""
+        self._flush_pending_rows()
+        return self._disapproved_indptr
+
+    @property
+    def weights(self) -> np.ndarray:
+        """The weight, i.e., the multiplicity, of each row."""
+        self._flush_pending_rows()
+        return self._weights
+
+    def _rows(self) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        approved_indices, approved_indptr = self.approved_indices, self.approved_indptr
+        disapproved_indices = self.disapproved_indices
+        disapproved_indptr = self.disapproved_indptr
+        for i in range(self.num_rows):
+            yield (
+                approved_indices[approved_indptr[i] : approved_indptr[i + 1]],
+                disapproved_indices[disapproved_indptr[i] : disapproved_indptr[i + 1]],
+            )
+
+    def _column_counts(self, weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        num_columns = len(self._registry)
+        res = []
+        for indices, indptr in (
+            (self.approved_indices, self.approved_indptr),
+            (self.disapproved_indices, self.disapproved_indptr),
+        ):
+            entry_weights = np.repeat(weights, np.diff(indptr))
+            res.append(
+                np.rint(
+                    np.bincount(indices, weights=entry_weights, minlength=num_columns)
+                ).astype(np.int64)
+            )
+        return res[0], res[1]
+
+    def _row_satisfactions(self, selection_indices: np.ndarray) -> np.ndarray:
+        is_selected = np.zeros(len(self._registry), dtype=np.int64)
+        is_selected[selection_indices] = 1
+        res = np.zeros(self.num_rows, dtype=np.int64)
+        for indices, indptr, sign in (
+            (self.approved_indices, self.approved_indptr, 1),
+            (self.disapproved_indices, self.disapproved_indptr, -1),
+        ):
+            cumulative_hits = np.concatenate(([0], np.cumsum(is_selected[indices])))
+            res += sign * (cumulative_hits[indptr[1:]] - cumulative_hits[indptr[:-1]])
+        return res
+
+    def add_ballot(self, ballot: AbstractTrichotomousBallot, weight: int = 1):
+        """
+        Adds a ballot to the profile as a new row.
+
+        Parameters
+        ----------
+        ballot : AbstractTrichotomousBallot
+            The ballot to add.
+        weight : int, optional
+            The weight of the new row. Defaults to 1.
+        """
+        self._pending_rows.append(
+            (
+                sorted(self._registry.register(a) for a in ballot.approved),
+                sorted(self._registry.register(a) for a in ballot.disapproved),
+                weight,
+            )
+        )
+        self._invalidate_caches()
+
+    @staticmethod
+    def _take_rows(
+        indices: np.ndarray, indptr: np.ndarray, rows: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Extracts the given rows of CSR arrays."""
+        lengths = indptr[rows + 1] - indptr[rows]
+        new_indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=new_indptr[1:])
+        positions = np.repeat(indptr[rows] - new_indptr[:-1], lengths) + np.arange(
+            new_indptr[-1]
+        )
+        return indices[positions], new_indptr
+
+    def take_rows(self, rows) -> TrichotomousSparseProfile:
+        """
+        Returns the sparse profile formed by a subset of the rows of the profile.
+
+        Parameters
+        ----------
+        rows : slice or array_like
+            The rows to select, as a slice, an array of row indices or a boolean mask.
+
+        Returns
+        -------
+        TrichotomousSparseProfile
+            The profile formed by the selected rows. It shares the registry of the current profile.
+        """
+        rows = np.arange(self.num_rows)[rows]
+        approved_indices, approved_indptr = self._take_rows(
+            self.approved_indices, self.approved_indptr, rows
+        )
+        disapproved_indices, disapproved_indptr = self._take_rows(
+            self.disapproved_indices, self.disapproved_indptr, rows
+        )
+        return TrichotomousSparseProfile.from_arrays(
+            approved_indices,
+            approved_indptr,
+            disapproved_indices,
+            disapproved_indptr,
+            self.weights[rows],
+            self._registry,
+            alternatives=self.alternatives,
+            max_size_selection=self.max_size_selection,
+        )
+
+    def copy(self) -> TrichotomousSparseProfile:
+        return TrichotomousSparseProfile.from_arrays(
+            self.approved_indices.copy(),
+            self.approved_indptr.copy(),
+            self.disapproved_indices.copy(),
+            self.disapproved_indptr.copy(),
+            self.weights.copy(),
+            AlternativeRegistry(self._registry),
+            alternatives=self.alternatives,
+            max_size_selection=self.max_size_selection,
+        )
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            approved_indptr = self.approved_indptr
+            disapproved_indptr = self.disapproved_indptr
+            row = range(self.num_rows)[item]
+            return self._ballot_from_indices(
+                self.approved_indices[approved_indptr[row] : approved_indptr[row + 1]],
+                self.disapproved_indices[
+                    disapproved_indptr[row] : disapproved_indptr[row + 1]
+                ],
+            )
+        return self.take_rows(item)
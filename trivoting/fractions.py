@@ -4,6 +4,7 @@ Module introducing all the functions used to handle fractions.
 
 from __future__ import annotations
 
+import math
 from typing import Union
 
 from gmpy2 import mpq
@@ -31,6 +32,12 @@ Constant describing which module to use for computing fractions. It can either b
 "gmpy2".
 """
 
+FLOAT_TOLERANCE = 1e-9
+"""
+Tolerance used to compare numbers when the `FRACTION` constant is "float": two floats are considered equal when they
+are within this absolute or relative tolerance of one another.
+"""
+
 
 def frac(*arg: Numeric) -> Numeric:
     """
@@ -90,3 +97,65 @@ def str_as_frac(s: str) -> Numeric:
         return float(s)
     else:
         raise ValueError(f"The `FRACTION` constant has an unknown value: {FRACTION}")
+
+
+def frac_isclose(a: Numeric, b: Numeric) -> bool:
+    """
+    Tests whether two numbers are equal. When the `FRACTION` constant is "float", the numbers are compared up to
+    :py:data:`FLOAT_TOLERANCE` to absorb rounding errors, otherwise they are compared exactly.
+
+    Parameters
+    ----------
+        a: Numeric
+            The first number.
+        b: Numeric
+            The second number.
+
+    Returns
+    -------
+        bool
+            Whether the two numbers are equal.
+    """
+    if FRACTION == FLOAT_FRAC:
+        return math.isclose(a, b, rel_tol=FLOAT_TOLERANCE, abs_tol=FLOAT_TOLERANCE)
+    return a == b
+
+
+def frac_gt(a: Numeric, b: Numeric) -> bool:
+    """
+    Tests whether a number is strictly greater than another one, the numbers being considered equal as in
+    :py:func:`frac_isclose`.
+
+    Parameters
+    ----------
+        a: Numeric
+            The first number.
+        b: Numeric
+            The second number.
+
+    Returns
+    -------
+        bool
+            Whether `a` is strictly greater than `b`.
+    """
+    return a > b and not frac_isclose(a, b)
+
+
+def frac_lt(a: Numeric, b: Numeric) -> bool:
+    """
+    Tests whether a number is strictly lower than another one, the numbers being considered equal as in
+    :py:func:`frac_isclose`.
+
+    Parameters
+    ----------
+        a: Numeric
+            The first number.
+        b: Numeric
+            The second number.
+
+    Returns
+    -------
+        bool
+            Whether `a` is strictly lower than `b`.
+    """
+    return a < b and not frac_isclose(a, b)
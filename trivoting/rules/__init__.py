@@ -1,6 +1,8 @@
 from trivoting.rules.thiele import (
     thiele_method,
+    thiele_method_size_sweep,
     sequential_thiele,
+    sequential_thiele_size_sweep,
     PAVScoreKraiczy2025,
     PAVScoreTalmonPaige2021,
     PAVScoreHervouin2025,
@@ -12,16 +14,25 @@ from trivoting.rules.tax_rules import (
     TaxKraiczy2025,
     DisapprovalLinearTax,
 )
-from trivoting.rules.phragmen import sequential_phragmen
-from trivoting.rules.chamberlin_courant import chamberlin_courant
+from trivoting.rules.phragmen import (
+    sequential_phragmen,
+    sequential_phragmen_size_sweep,
+)
+from trivoting.rules.chamberlin_courant import (
+    chamberlin_courant,
+    chamberlin_courant_size_sweep,
+    chamberlin_courant_greedy,
+)
 from trivoting.rules.max_net_support import max_net_support
 
 __all__ = [
     "thiele_method",
+    "thiele_method_size_sweep",
     "PAVScoreKraiczy2025",
     "PAVScoreTalmonPaige2021",
     "PAVScoreHervouin2025",
     "sequential_thiele",
+    "sequential_thiele_size_sweep",
     "PAVScoreKraiczy2025",
     "PAVScoreTalmonPaige2021",
     "PAVScoreHervouin2025",
@@ -31,6 +42,9 @@ __all__ = [
     "TaxKraiczy2025",
     "DisapprovalLinearTax",
     "sequential_phragmen",
+    "sequential_phragmen_size_sweep",
     "chamberlin_courant",
+    "chamberlin_courant_size_sweep",
+    "chamberlin_courant_greedy",
     "max_net_support",
 ]
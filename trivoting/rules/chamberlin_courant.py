@@ -4,14 +4,31 @@ with strictly more selected and approved alternatives than selected but disappro
 
 from __future__ import annotations
 
-from pulp import lpSum, LpBinary, LpVariable, LpInteger, LpAffineExpression
+from itertools import islice
+
+import numpy as np
+from pulp import (
+    lpSum,
+    LpBinary,
+    LpContinuous,
+    LpVariable,
+    LpInteger,
+    LpAffineExpression,
+    LpStatusOptimal,
+    value,
+)
 
 from trivoting.election import AbstractTrichotomousProfile, Selection
+from trivoting.election.batch import BallotTypeMatrices, score_selections
 from trivoting.rules.ilp_schemes import (
     ILPBuilder,
+    ILPFormulation,
     ilp_optimiser_rule,
+    ilp_optimiser_size_sweep,
     ILPNotOptimalError,
 )
+from trivoting.rules.thiele import _MarginalContributionHeap
+from trivoting.tiebreaking import TieBreakingRule, lexico_tie_breaking
 from trivoting.utils import generate_subsets
 
 
@@ -20,6 +37,7 @@ def chamberlin_courant_brute_force(
     max_size_selection: int,
     initial_selection: Selection = None,
     resoluteness: bool = True,
+    batch_size: int = 1024,
 ) -> Selection | list[Selection]:
     """
     Compute the selections of the Chamberlin-Courant rule using a brute-force approach. The approach is simple: each
@@ -27,6 +45,8 @@ def chamberlin_courant_brute_force(
     Chamberlin-Courant score is equal to the number of voters with strictly more selected and approved alternatives
     than selected but disapproved ones.
 
+    The selections are scored by batches via :py:func:`~trivoting.election.batch.score_selections`.
+
     Used mostly for testing purposes.
 
     Parameters
@@ -42,6 +62,8 @@ def chamberlin_courant_brute_force(
         If True, returns a single selection (resolute).
         If False, returns all tied optimal selections (irresolute).
         Defaults to True.
+    batch_size : int, optional
+        Number of selections scored at once. Defaults to 1024.
 
     Returns
     -------
@@ -52,21 +74,33 @@ def chamberlin_courant_brute_force(
     if initial_selection is None:
         initial_selection = Selection(implicit_reject=True)
     len_initial_selection = len(initial_selection)
+    ballot_type_matrices = BallotTypeMatrices(profile)
     max_coverage = None
     arg_max_coverage = None
-    for selection_selected in generate_subsets(
-        profile.alternatives, max_size=max_size_selection - len_initial_selection
-    ):
-        selection = Selection(
+    all_selections = (
+        Selection(
             selected=list(selection_selected) + initial_selection.selected,
             implicit_reject=True,
         )
-        covered_voters = profile.num_covered_ballots(selection)
-        if max_coverage is None or covered_voters > max_coverage:
-            max_coverage = covered_voters
-            arg_max_coverage = [selection]
-        elif max_coverage == covered_voters:
-            arg_max_coverage.append(selection)
+        for selection_selected in generate_subsets(
+            profile.alternatives, max_size=max_size_selection - len_initial_selection
+        )
+    )
+    while True:
+        selections = list(islice(all_selections, batch_size))
+        if not selections:
+            break
+        coverages = score_selections(
+            ballot_type_matrices, selections
+        ).num_covered_ballots()
+        batch_max_coverage = int(coverages.max())
+        if max_coverage is None or batch_max_coverage > max_coverage:
+            max_coverage = batch_max_coverage
+            arg_max_coverage = []
+        if batch_max_coverage == max_coverage:
+            arg_max_coverage.extend(
+                selections[i] for i in np.flatnonzero(coverages == max_coverage)
+            )
     if arg_max_coverage is None:
         raise ValueError("In CC brute force no solution has been found, weird...")
     if resoluteness:
@@ -74,6 +108,115 @@ def chamberlin_courant_brute_force(
     return arg_max_coverage
 
 
+def chamberlin_courant_greedy(
+    profile: AbstractTrichotomousProfile,
+    max_size_selection: int,
+    initial_selection: Selection = None,
+    tie_breaking: TieBreakingRule = None,
+    lazy: bool = False,
+) -> Selection:
+    """
+    Compute a selection approximating the Chamberlin-Courant rule by greedily selecting, one at a time, the alternative
+    that covers the most new voters, until `max_size_selection` alternatives are selected or no alternative increases
+    the number of covered voters anymore.
+
+    The net support of each ballot type for the current selection is maintained while alternatives are selected. The
+    number of voters newly covered by an alternative is then the number of voters with a net support of 0 approving of
+    it, minus the number of voters with a net support of 1 disapproving of it.
+
+    With `lazy=True`, the gains of the alternatives are evaluated lazily: only the alternatives whose last known gain
+    is at least the best current gain are evaluated again. Lazy evaluation is only used when the number of covered
+    voters is submodular, that is, when no alternative that can be selected is disapproved of and the initial
+    selection does not give a negative net support to any voter. The outcome is then the same as without it.
+
+    The number of voters covered by the outcome (see
+    :py:meth:`~trivoting.election.trichotomous_profile.AbstractTrichotomousProfile.num_covered_ballots`) can be
+    compared with the upper bound computed by
+    :py:func:`~trivoting.rules.chamberlin_courant.chamberlin_courant_lp_bound` to assess the quality of the
+    approximation.
+
+    Parameters
+    ----------
+    profile : AbstractTrichotomousProfile
+        The trichotomous profile.
+    max_size_selection : int
+        Maximum number of alternatives to select.
+    initial_selection : Selection, optional
+        An initial selection that fixes some alternatives as selected or rejected.
+        If `implicit_reject` is True, no alternatives are fixed to be rejected.
+    tie_breaking : TieBreakingRule, optional
+        Tie-breaking rule used when multiple alternatives tie.
+        Defaults to lexicographic tie-breaking.
+    lazy : bool, optional
+        If True, the gains of the alternatives are evaluated lazily when the number of covered voters is submodular.
+        Defaults to False.
+
+    Returns
+    -------
+    Selection
+        The selection.
+    """
+
+    def _gain(alternative_index: int) -> int:
+        """Returns the number of voters newly covered if the alternative is selected."""
+        supporters = supporters_per_alternative[alternative_index]
+        opponents = opponents_per_alternative[alternative_index]
+        return int(
+            weights[supporters][net_supports[supporters] == 0].sum()
+            - weights[opponents][net_supports[opponents] == 1].sum()
+        )
+
+    if initial_selection is None:
+        selection = Selection(implicit_reject=True)
+    else:
+        selection = initial_selection.copy()
+    if tie_breaking is None:
+        tie_breaking = lexico_tie_breaking
+
+    matrices = BallotTypeMatrices(profile)
+    registry = matrices.registry
+    weights = matrices.weights
+    candidates = [a for a in profile.alternatives if a not in selection]
+    candidate_indices = {a: j for j, a in enumerate(candidates)}
+    approved = matrices.approved[:, [registry.index(a) for a in candidates]]
+    disapproved = matrices.disapproved[:, [registry.index(a) for a in candidates]]
+    supporters_per_alternative = [np.flatnonzero(column) for column in approved.T]
+    opponents_per_alternative = [np.flatnonzero(column) for column in disapproved.T]
+    selected_indices = [registry.index(a) for a in selection.selected]
+    net_supports = np.rint(
+        matrices.approved[:, selected_indices].sum(axis=1)
+        - matrices.disapproved[:, selected_indices].sum(axis=1)
+    ).astype(np.int64)
+
+    available = np.ones(len(candidates), dtype=bool)
+    remaining = set(candidates)
+    use_lazy = lazy and not disapproved.any() and bool((net_supports >= 0).all())
+    heap = _MarginalContributionHeap(candidates) if use_lazy else None
+    while remaining and len(selection) < max_size_selection:
+        if use_lazy:
+            max_gain, tied = heap.best_alternatives(
+                remaining, lambda a: _gain(candidate_indices[a])
+            )
+            tied.sort(key=candidate_indices.get)
+        else:
+            gains = (weights * (net_supports == 0)) @ approved - (
+                weights * (net_supports == 1)
+            ) @ disapproved
+            gains[~available] = -np.inf
+            max_gain = gains.max()
+            tied = [candidates[j] for j in np.flatnonzero(gains == max_gain)]
+        if max_gain <= 0:
+            break
+        alternative = tie_breaking.order(profile, tied)[0]
+        selection.add_selected(alternative)
+        j = candidate_indices[alternative]
+        net_supports[supporters_per_alternative[j]] += 1
+        net_supports[opponents_per_alternative[j]] -= 1
+        available[j] = False
+        remaining.remove(alternative)
+    return selection
+
+
 class ChamberlinCourantILPBuilder(ILPBuilder):
     """Builder class for the ILP corresponding to the Chamberlin-Courant rule. Used in the function
     :py:func:`~trivoting.rules.chamberlin_courant.chamberlin_courant`."""
@@ -87,7 +230,11 @@ class ChamberlinCourantILPBuilder(ILPBuilder):
         self.vars["dissat_var"] = dict()
         self.vars["cc_var"] = dict()
 
-        for i, ballot in enumerate(self.profile):
+        if self.formulation == ILPFormulation.COMPACT:
+            self.init_compact_vars()
+            return
+
+        for i, (ballot, _) in enumerate(self.ballot_types):
             sat_var = LpVariable(
                 f"sat_{i}",
                 lowBound=-self.max_size_selection,
@@ -109,9 +256,9 @@ class ChamberlinCourantILPBuilder(ILPBuilder):
                 self.vars["selection"][alt] for alt in ballot.disapproved
             )
 
-            # Linearisation of z = 1 if x > y and z = 0 otherwise
-            self.model += (
-                sat_var - dissat_var >= 1 - (1 - cc_var) * self.max_size_selection
+            # Linearisation of z = 1 if x > y and z = 0 otherwise, x - y can be as low as -max_size_selection
+            self.model += sat_var - dissat_var >= 1 - (1 - cc_var) * (
+                self.max_size_selection + 1
             )
             self.model += sat_var - dissat_var <= cc_var * self.max_size_selection
 
@@ -119,8 +266,33 @@ class ChamberlinCourantILPBuilder(ILPBuilder):
             self.vars["dissat_var"][i] = dissat_var
             self.vars["cc_var"][i] = cc_var
 
+    def init_compact_vars(self) -> None:
+        """Initialises the coverage variables of the compact formulation, in which the net support of the ballots is
+        expressed directly from the selection variables and the big-M constants are bounded per ballot. Ballots that
+        do not approve of any alternative can never be covered and have no coverage variable.
+        """
+        for i, (ballot, _) in enumerate(self.ballot_types):
+            if len(ballot.approved) == 0:
+                continue
+            cc_var = LpVariable(f"cc_{i}", cat=LpBinary)
+            net_support = lpSum(
+                self.vars["selection"][alt] for alt in ballot.approved
+            ) - lpSum(self.vars["selection"][alt] for alt in ballot.disapproved)
+
+            # Linearisation of z = 1 if x > 0 and z = 0 otherwise, with -max_dissat <= x <= max_sat
+            max_sat = self.max_count(ballot.approved)
+            max_dissat = self.max_count(ballot.disapproved)
+            self.model += net_support >= 1 - (1 - cc_var) * (1 + max_dissat)
+            self.model += net_support <= cc_var * max_sat
+
+            self.vars["cc_var"][i] = cc_var
+
     def objective(self) -> LpAffineExpression:
-        return lpSum(self.vars["cc_var"].values())
+        return lpSum(
+            self.vars["cc_var"][i] * multiplicity
+            for i, (_, multiplicity) in enumerate(self.ballot_types)
+            if i in self.vars["cc_var"]
+        )
 
 
 def chamberlin_courant(
@@ -130,6 +302,8 @@ def chamberlin_courant(
     resoluteness: bool = True,
     max_seconds: int = 600,
     verbose: bool = False,
+    warm_start: bool = False,
+    max_num_selections: int = None,
 ) -> Selection | list[Selection]:
     """
     Compute the selections of the Chamberlin-Courant rule.
@@ -137,7 +311,9 @@ def chamberlin_courant(
     The Chamberlin-Courant returns selections that maximise the number of covered voter. A voter is covered if
     strictly more approved alternatives are selected than disapproved ones.
 
-    The outcome of the rule is computed via an Integer Linear Program (ILP).
+    The outcome of the rule is computed via an Integer Linear Program (ILP). With `warm_start=True`, a greedy
+    selection, adding one at a time the alternative covering the most new voters, is passed to the solver as a
+    starting solution. The outcome of the rule does not depend on the warm start.
 
     Parameters
     ----------
@@ -158,6 +334,12 @@ def chamberlin_courant(
     verbose : bool, optional
         If True the output of the ILP solver is not silenced.
         Defaults to False.
+    warm_start : bool, optional
+        If True, the solver is started from a greedy selection.
+        Defaults to False.
+    max_num_selections : int, optional
+        If irresolute, the maximum number of selections to return. Defaults to None, in which case all the optimal
+        selections are returned.
 
     Returns
     -------
@@ -171,8 +353,148 @@ def chamberlin_courant(
         initial_selection,
         max_seconds=max_seconds,
         verbose=verbose,
+        warm_start=(
+            chamberlin_courant_greedy(profile, max_size_selection, initial_selection)
+            if warm_start
+            else None
+        ),
     )
     try:
-        return ilp_optimiser_rule(ilp_builder, resoluteness=resoluteness)
+        return ilp_optimiser_rule(
+            ilp_builder,
+            resoluteness=resoluteness,
+            max_num_selections=max_num_selections,
+        )
     except ILPNotOptimalError as e:
         raise RuntimeError("Chamberlin-Courant ILP did not converge.") from e
+
+
+def chamberlin_courant_size_sweep(
+    profile: AbstractTrichotomousProfile,
+    max_size_selection: int,
+    initial_selection: Selection = None,
+    resoluteness: bool = True,
+    max_seconds: int = 600,
+    verbose: bool = False,
+    max_num_selections: int = None,
+) -> dict[int, Selection | list[Selection]]:
+    """
+    Compute the selections of the Chamberlin-Courant rule, as
+    :py:func:`~trivoting.rules.chamberlin_courant.chamberlin_courant` does, for all the maximum sizes of the
+    selections from 1 to `max_size_selection`.
+
+    The ILP is built once and only the constraint bounding the size of the selections changes between the sizes, each
+    resolution being warm-started from the optimal selection for the previous size (see
+    :py:func:`~trivoting.rules.ilp_schemes.ilp_optimiser_size_sweep`).
+
+    Parameters
+    ----------
+    profile : AbstractTrichotomousProfile
+        The trichotomous profile.
+    max_size_selection : int
+        The largest maximum number of alternatives to select.
+    initial_selection : Selection, optional
+        An initial selection that fixes some alternatives as selected or rejected.
+        If `implicit_reject` is True, no alternatives are fixed to be rejected.
+    resoluteness : bool, optional
+        If True, returns a single selection (resolute) for each size.
+        If False, returns all tied optimal selections (irresolute) for each size.
+        Defaults to True.
+    max_seconds : int, optional
+        Maximum number of seconds to run the ILP solver for, for each resolution.
+        Defaults to 600 seconds (10 minutes).
+    verbose : bool, optional
+        If True the output of the ILP solver is not silenced.
+        Defaults to False.
+    max_num_selections : int, optional
+        If irresolute, the maximum number of selections to return for each size. Defaults to None, in which case all
+        the optimal selections are returned.
+
+    Returns
+    -------
+    dict[int, Selection | list[Selection]]
+        Maps each size to the selection if resolute (:code:`resoluteness == True`), or to the list of selections if
+        irresolute (:code:`resoluteness == False`).
+    """
+    ilp_builder = ChamberlinCourantILPBuilder(
+        profile,
+        max_size_selection,
+        initial_selection,
+        max_seconds=max_seconds,
+        verbose=verbose,
+    )
+    try:
+        return ilp_optimiser_size_sweep(
+            ilp_builder,
+            resoluteness=resoluteness,
+            max_num_selections=max_num_selections,
+        )
+    except ILPNotOptimalError as e:
+        raise RuntimeError("Chamberlin-Courant ILP did not converge.") from e
+
+
+def chamberlin_courant_lp_bound(
+    profile: AbstractTrichotomousProfile,
+    max_size_selection: int,
+    initial_selection: Selection = None,
+    max_seconds: int = 600,
+    verbose: bool = False,
+) -> float:
+    """
+    Compute an upper bound on the number of voters covered by the selections of the Chamberlin-Courant rule, as the
+    optimal value of the linear relaxation of its ILP. The relaxation is strengthened by bounding the coverage variable
+    of each ballot by the sum of the selection variables of the alternatives it approves of, which holds for all
+    selections since a covered voter approves of at least one selected alternative.
+
+    Solving the relaxation is much faster than solving the ILP. Together with
+    :py:func:`~trivoting.rules.chamberlin_courant.chamberlin_courant_greedy`, it brackets the number of voters covered
+    by the outcome of the rule.
+
+    Parameters
+    ----------
+    profile : AbstractTrichotomousProfile
+        The trichotomous profile.
+    max_size_selection : int
+        Maximum number of alternatives to select.
+    initial_selection : Selection, optional
+        An initial selection that fixes some alternatives as selected or rejected.
+        If `implicit_reject` is True, no alternatives are fixed to be rejected.
+    max_seconds : int, optional
+        Maximum number of seconds to run the LP solver for.
+        Defaults to 600 seconds (10 minutes).
+    verbose : bool, optional
+        If True the output of the LP solver is not silenced.
+        Defaults to False.
+
+    Returns
+    -------
+    float
+        The upper bound. The number of covered voters being an integer, it is at most the integer part of the bound.
+    """
+    if initial_selection is not None and len(initial_selection) >= max_size_selection:
+        return profile.num_covered_ballots(initial_selection)
+
+    ilp_builder = ChamberlinCourantILPBuilder(
+        profile,
+        max_size_selection,
+        initial_selection,
+        max_seconds=max_seconds,
+        verbose=verbose,
+    )
+    ilp_builder.init_vars()
+    ilp_builder.apply_constraints()
+    ilp_builder.set_objective()
+    for i, cc_var in ilp_builder.vars["cc_var"].items():
+        ballot = ilp_builder.ballot_types[i][0]
+        ilp_builder.model += cc_var <= lpSum(
+            ilp_builder.vars["selection"][alt] for alt in ballot.approved
+        )
+    for var in ilp_builder.model.variables():
+        var.cat = LpContinuous
+    # The interior point method is much faster than the simplex method on the relaxations of large profiles
+    ilp_builder.solver.optionsDict["solver"] = "ipm"
+
+    status = ilp_builder.solve()
+    if status != LpStatusOptimal:
+        raise RuntimeError("Chamberlin-Courant LP relaxation did not converge.")
+    return value(ilp_builder.model.objective)
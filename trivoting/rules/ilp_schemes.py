@@ -3,22 +3,34 @@
 from __future__ import annotations
 
 import abc
+from collections.abc import Collection
 from enum import Enum
 
+import highspy
+import numpy as np
 from pulp import (
+    LpConstraint,
     LpProblem,
     LpMaximize,
     LpAffineExpression,
     LpVariable,
     LpBinary,
+    LpInteger,
+    LpSolver,
     lpSum,
-    HiGHS,
     PULP_CBC_CMD,
     LpStatusOptimal,
+    LpStatusInfeasible,
+    LpStatusUnbounded,
+    LpStatusNotSolved,
     value,
 )
 
-from trivoting.election import AbstractTrichotomousProfile, Selection
+from trivoting.election import (
+    Alternative,
+    AbstractTrichotomousProfile,
+    Selection,
+)
 from trivoting.fractions import Numeric
 
 
@@ -32,12 +44,219 @@ class ILPSolver(Enum):
     """Enumerates the different solvers available."""
 
     HIGHS = "HIGHS"
-    """HiGHS: open-source software to solve linear programming"""
+    """HiGHS: open-source software to solve linear programming. It is called directly through highspy, its Python
+    interface, the constraint matrix being passed to HiGHS in memory as sparse arrays. Solutions that are not proven
+    optimal, for instance because the time limit is reached, are not reported as optimal."""
 
     CBC = "CBC"
     """Cbc (Coin-or branch and cut) is an open-source mixed integer linear programming solver"""
 
 
+def _pass_start_solution(highs, start: list[tuple[int, float]]) -> None:
+    """Passes a (partial) starting solution, given as pairs of column index and value, to a HiGHS model."""
+    if start:
+        indices, values = zip(*start)
+        highs.setSolution(
+            len(indices),
+            np.array(indices, dtype=np.int32),
+            np.array(values, dtype=np.float64),
+        )
+
+
+def _constraints(lp: LpProblem) -> list[LpConstraint]:
+    """Returns the constraints of a PuLP problem, in the order in which they were added. Since PuLP 3.3.1, the
+    constraints are stored in the private dictionary `_constraints`, the public mapping being deprecated. This private
+    dictionary is only accessed here and in :py:func:`_remove_constraints`, PuLP being pinned below 4.0 which changes
+    this API.
+    """
+    return list(lp._constraints.values())
+
+
+def _remove_constraints(lp: LpProblem, num_constraints: int) -> None:
+    """Removes the constraints of a PuLP problem that were added after the first `num_constraints` ones."""
+    for name in list(lp._constraints)[num_constraints:]:
+        del lp._constraints[name]
+
+
+def _row_bounds(constraints) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the lower and upper bounds of the rows corresponding to PuLP constraints."""
+    lower = np.empty(len(constraints), dtype=np.float64)
+    upper = np.empty(len(constraints), dtype=np.float64)
+    for i, constraint in enumerate(constraints):
+        lb = constraint.getLb()
+        ub = constraint.getUb()
+        lower[i] = -highspy.kHighsInf if lb is None else lb
+        upper[i] = highspy.kHighsInf if ub is None else ub
+    return lower, upper
+
+
+def _column_bounds(variables) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the lower and upper bounds of the columns corresponding to PuLP variables."""
+    lower = np.array(
+        [-highspy.kHighsInf if v.lowBound is None else v.lowBound for v in variables],
+        dtype=np.float64,
+    )
+    upper = np.array(
+        [highspy.kHighsInf if v.upBound is None else v.upBound for v in variables],
+        dtype=np.float64,
+    )
+    return lower, upper
+
+
+class _HiGHS(LpSolver):
+    """Solver passing PuLP problems directly to highspy. The variables and the constraints of the problem are collected
+    into sparse arrays in a single pass and added to HiGHS in bulk. The HiGHS model is kept alive so that problems can
+    be resolved (see :py:meth:`pulp.LpProblem.resolve`) after adding constraints to them or changing the bounds of
+    their variables and constraints, in which case only the changes are passed to HiGHS. When `warmStart` is True, the
+    current values of the variables (see :py:meth:`pulp.LpVariable.setInitialValue`) are passed to HiGHS as a starting
+    solution at the next resolution, after which `warmStart` is reset. The starting solution can be partial, HiGHS
+    completing it by itself. The entries of `optionsDict` are passed to HiGHS as options.
+    """
+
+    name = "HIGHS"
+
+    def __init__(self, warmStart: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.warmStart = warmStart
+
+    def available(self):
+        return True
+
+    @staticmethod
+    def _add_rows(highs, constraints, columns):
+        starts, indices, coefficients = [], [], []
+        for constraint in constraints:
+            starts.append(len(indices))
+            indices.extend(
+                columns.setdefault(var, len(columns)) for var in constraint.keys()
+            )
+            coefficients.extend(constraint.values())
+        lower, upper = _row_bounds(constraints)
+        highs.addRows(
+            len(constraints),
+            lower,
+            upper,
+            len(indices),
+            np.array(starts, dtype=np.int32),
+            np.array(indices, dtype=np.int32),
+            np.array(coefficients, dtype=np.float64),
+        )
+
+    def actualSolve(self, lp):
+        highs = highspy.Highs()
+        highs.setOptionValue("output_flag", bool(self.msg))
+        if self.timeLimit is not None:
+            highs.setOptionValue("time_limit", float(self.timeLimit))
+        for key, option_value in self.optionsDict.items():
+            highs.setOptionValue(key, option_value)
+
+        columns = dict()
+        objective = lp.objective if lp.objective is not None else LpAffineExpression()
+        for var in objective.keys():
+            columns.setdefault(var, len(columns))
+        # The columns are added to HiGHS before the rows
+        constraints = _constraints(lp)
+        for constraint in constraints:
+            for var in constraint.keys():
+                columns.setdefault(var, len(columns))
+
+        variables = list(columns)
+        costs = np.zeros(len(variables), dtype=np.float64)
+        for var, coefficient in objective.items():
+            costs[columns[var]] = coefficient
+        lower, upper = _column_bounds(variables)
+        highs.addCols(
+            len(variables),
+            costs,
+            lower,
+            upper,
+            0,
+            np.array([], dtype=np.int32),
+            np.array([], dtype=np.int32),
+            np.array([], dtype=np.float64),
+        )
+        integers = [i for i, v in enumerate(variables) if v.cat == LpInteger]
+        if integers and self.mip:
+            highs.changeColsIntegrality(
+                len(integers),
+                np.array(integers, dtype=np.int32),
+                np.array([highspy.HighsVarType.kInteger] * len(integers)),
+            )
+        if lp.sense == LpMaximize:
+            highs.changeObjectiveSense(highspy.ObjSense.kMaximize)
+        highs.changeObjectiveOffset(float(objective.constant))
+        self._add_rows(highs, constraints, columns)
+
+        lp.solverModel = highs
+        lp.solverColumns = columns
+        lp.resolveOK = True
+        return self._run(lp)
+
+    def actualResolve(self, lp, **kwargs):
+        highs = lp.solverModel
+        columns = lp.solverColumns
+        num_rows = highs.getNumRow()
+        constraints = _constraints(lp)
+        if any(
+            var not in columns
+            for constraint in constraints[num_rows:]
+            for var in constraint.keys()
+        ):
+            # New variables cannot be added incrementally
+            return self.actualSolve(lp)
+        lower, upper = _column_bounds(columns)
+        highs.changeColsBounds(
+            len(columns), np.arange(len(columns), dtype=np.int32), lower, upper
+        )
+        lower, upper = _row_bounds(constraints[:num_rows])
+        highs.changeRowsBounds(
+            num_rows, np.arange(num_rows, dtype=np.int32), lower, upper
+        )
+        self._add_rows(highs, constraints[num_rows:], columns)
+        return self._run(lp)
+
+    def _run(self, lp) -> int:
+        highs = lp.solverModel
+        if self.warmStart:
+            _pass_start_solution(
+                highs,
+                [
+                    (i, var.varValue)
+                    for var, i in lp.solverColumns.items()
+                    if var.varValue is not None
+                ],
+            )
+            self.warmStart = False
+        highs.run()
+        model_status = highs.getModelStatus()
+        if model_status == highspy.HighsModelStatus.kOptimal:
+            status = LpStatusOptimal
+        elif model_status == highspy.HighsModelStatus.kInfeasible:
+            status = LpStatusInfeasible
+        elif model_status == highspy.HighsModelStatus.kUnbounded:
+            status = LpStatusUnbounded
+        else:
+            status = LpStatusNotSolved
+        if status == LpStatusOptimal:
+            for var, x in zip(lp.solverColumns, highs.getSolution().col_value):
+                var.varValue = x
+        lp.assignStatus(status)
+        return status
+
+
+class ILPFormulation(Enum):
+    """Enumerates the different formulations of the ILPs of the rules."""
+
+    COMPACT = "COMPACT"
+    """The number of satisfaction variables of a ballot is bounded by the number of alternatives it approves or
+    disapproves of that can be selected together, and satisfactions that are linear in the selection variables are
+    used directly as expressions, without auxiliary variables."""
+
+    STANDARD = "STANDARD"
+    """Each ballot has as many satisfaction variables as there are alternatives, and the satisfactions are stored in
+    auxiliary integer variables."""
+
+
 class ILPBuilder(abc.ABC):
     """
     Abstract class used to define ILP programs that are then passed to the
@@ -60,6 +279,13 @@ class ILPBuilder(abc.ABC):
         Defaults to False.
     solver_name : ILPSolver
         Name of the ILP solver to use.
+    formulation : ILPFormulation, optional
+        The formulation of the ILP. Defaults to :py:attr:`~trivoting.rules.ilp_schemes.ILPFormulation.COMPACT`.
+    warm_start : Selection, optional
+        A feasible selection, typically computed by a fast heuristic, passed to the solver as a starting solution. A
+        good starting solution spares the solver the search for a first incumbent. Only the selection variables are
+        given a starting value: HiGHS completes the starting solution by itself while CBC starts the other variables
+        at 0.
 
     Attributes
     ----------
@@ -72,14 +298,31 @@ class ILPBuilder(abc.ABC):
     initial_selection : Selection, optional
         An initial selection that fixes some alternatives as selected or rejected.
         If `implicit_reject` is True, no alternatives are fixed to be rejected.
+    formulation : ILPFormulation
+        The formulation of the ILP.
+    warm_start : Selection or None
+        The starting solution passed to the solver.
     model : LpProblem
         The actual PuLP model.
+    size_constraint : LpConstraint or None
+        The constraint bounding the size of the selections, once it has been added to the model.
+    size_bounded_vars : list[tuple[LpVariable, int]]
+        Binary variables that can only be equal to 1 when the maximum size of the selections is at least a given value,
+        together with that value. Only used when changing the maximum size of the selections, see
+        :py:meth:`~trivoting.rules.ilp_schemes.ILPBuilder.set_max_size_selection`.
     vars: dict[str, dict]
         The variables used in the ILP model, mapping type of variable to dictionary containing LpVariable.
+    ballot_types : list[tuple[AbstractTrichotomousBallot, int]]
+        The ballot types of the profile together with their multiplicity, see
+        :py:meth:`~trivoting.rules.ilp_schemes.ILPBuilder.init_ballot_types`.
     """
 
     model_name = "NoName"
 
+    size_dependent_model = False
+    """Whether the model depends on the maximum size of the selections beyond the constraint bounding the size of the
+    selections. See :py:meth:`~trivoting.rules.ilp_schemes.ILPBuilder.set_max_size_selection`."""
+
     def __init__(
         self,
         profile: AbstractTrichotomousProfile,
@@ -88,15 +331,21 @@ class ILPBuilder(abc.ABC):
         max_seconds: int = 600,
         verbose: bool = False,
         solver_name: ILPSolver = None,
+        formulation: ILPFormulation = None,
+        warm_start: Selection = None,
     ) -> None:
 
         self.profile = profile
         self.max_size_selection = max_size_selection
         self.initial_selection = initial_selection
+        if formulation is None:
+            formulation = ILPFormulation.COMPACT
+        self.formulation = formulation
+        self.warm_start = warm_start
         if solver_name is None:
             solver_name = ILPSolver.HIGHS
         if solver_name == ILPSolver.HIGHS:
-            self.solver = HiGHS(msg=verbose, timeLimit=max_seconds)
+            self.solver = _HiGHS(msg=verbose, timeLimit=max_seconds)
         elif solver_name == ILPSolver.CBC:
             self.solver = PULP_CBC_CMD(msg=verbose, timeLimit=max_seconds)
         else:
@@ -104,20 +353,63 @@ class ILPBuilder(abc.ABC):
 
         self.model = LpProblem(self.model_name, sense=LpMaximize)
         self.vars = dict()
+        self.ballot_types = []
+        self.size_constraint = None
+        self.size_bounded_vars = []
 
     def init_selection_vars(self):
         """Initialises the selections variables. Other function assumes that self.vars["selection"] exists and
-        correspond to the variables indicating whether an alternative is selected or not.
+        correspond to the variables indicating whether an alternative is selected or not. Variables are named after
+        the index of the alternatives in the registry of the profile.
         """
+        registry = self.profile.registry
         self.vars["selection"] = {
-            alt: LpVariable(f"y_{alt.name}", cat=LpBinary)
+            alt: LpVariable(f"y_{registry.index(alt)}", cat=LpBinary)
             for alt in self.profile.alternatives
         }
 
+    def init_ballot_types(self):
+        """Collapses the ballots of the profile into ballot types: ballots approving and disapproving of the same
+        alternatives are represented once, together with their total multiplicity. The variables and constraints
+        related to the voters are then defined per ballot type rather than per ballot, and weighted by the
+        multiplicity in the objective.
+        """
+        multiplicities = dict()
+        representatives = dict()
+        for ballot in self.profile:
+            key = (frozenset(ballot.approved), frozenset(ballot.disapproved))
+            if key in multiplicities:
+                multiplicities[key] += self.profile.multiplicity(ballot)
+            else:
+                multiplicities[key] = self.profile.multiplicity(ballot)
+                representatives[key] = ballot
+        self.ballot_types = [
+            (representatives[key], multiplicity)
+            for key, multiplicity in multiplicities.items()
+        ]
+
+    def max_count(self, alternatives: Collection[Alternative]) -> int:
+        """
+        Returns the maximum number of alternatives among the given ones that can be selected together, used to bound
+        the number of satisfaction variables of the ballots.
+
+        Parameters
+        ----------
+        alternatives : Collection[Alternative]
+            The alternatives, typically the approved or disapproved alternatives of a ballot.
+
+        Returns
+        -------
+        int
+            The minimum of the number of alternatives and of the maximum size of the selections.
+        """
+        return min(len(alternatives), int(self.max_size_selection))
+
     def init_vars(self) -> None:
         """Initialises the variables. This function is meant to be overridden. The super() needs to be called to
-        ensure the initialisation of all the variables that are shared by all ILP models.
+        ensure the initialisation of all the variables that are shared by all ILP models, and of the ballot types.
         """
+        self.init_ballot_types()
         self.init_selection_vars()
 
     def constrain_initial_selection(self):
@@ -131,7 +423,41 @@ class ILPBuilder(abc.ABC):
 
     def constrain_max_size_selection(self):
         """Adds the constraint related to the maximum size of the selections."""
-        self.model += lpSum(self.vars["selection"].values()) <= self.max_size_selection
+        self.size_constraint = (
+            lpSum(self.vars["selection"].values()) <= self.max_size_selection
+        )
+        self.model += self.size_constraint
+
+    def set_max_size_selection(self, max_size_selection: int) -> None:
+        """
+        Changes the maximum size of the selections of a model that has already been built. Only the right-hand side of
+        the constraint bounding the size of the selections is changed so that the model can be resolved incrementally
+        (see :py:meth:`~trivoting.rules.ilp_schemes.ILPBuilder.resolve`). The model is however built again from
+        scratch if it depends on the maximum size of the selections in other ways (see
+        :py:attr:`~trivoting.rules.ilp_schemes.ILPBuilder.size_dependent_model`).
+
+        The satisfaction variables of the compact formulations are created for the maximum size of the selections the
+        model has been built with: the maximum size should only be decreased, or increased up to that value. The
+        variables that cannot be used for the new maximum size (see
+        :py:attr:`~trivoting.rules.ilp_schemes.ILPBuilder.size_bounded_vars`) are fixed to 0.
+
+        Parameters
+        ----------
+        max_size_selection : int
+            The new maximum size of the selections.
+        """
+        self.max_size_selection = max_size_selection
+        if self.size_dependent_model:
+            self.model = LpProblem(self.model_name, sense=LpMaximize)
+            self.vars = dict()
+            self.size_bounded_vars = []
+            self.init_vars()
+            self.apply_constraints()
+            self.set_objective()
+        else:
+            self.size_constraint.changeRHS(max_size_selection)
+            for var, min_size in self.size_bounded_vars:
+                var.upBound = 1 if max_size_selection >= min_size else 0
 
     def apply_constraints(self):
         """Applies the different constraints to the model."""
@@ -146,6 +472,19 @@ class ILPBuilder(abc.ABC):
         """Sets the objective function to the model itself."""
         self.model += self.objective()
 
+    def set_warm_start_values(self):
+        """Sets the initial values of the selection variables to the starting solution, if there is one, and asks the
+        solver to start from the values of the variables at the next resolution. The values of the other variables are
+        those of the last solution found, if any.
+        """
+        if self.warm_start is not None:
+            for alt, var in self.vars["selection"].items():
+                var.setInitialValue(1 if alt in self.warm_start.selected else 0)
+            if isinstance(self.solver, PULP_CBC_CMD):
+                self.solver.optionsDict["warmStart"] = True
+            else:
+                self.solver.warmStart = True
+
     def solve(self) -> int:
         """
         Optimises the model and return the optimisation status.
@@ -157,6 +496,19 @@ class ILPBuilder(abc.ABC):
         """
         return self.model.solve(self.solver)
 
+    def resolve(self) -> int:
+        """
+        Optimises again the model after constraints have been added to it and return the optimisation status. With
+        HiGHS, the model of the solver is kept alive and only the new constraints are passed to it. With other solvers,
+        the model is solved from scratch.
+
+        Returns
+        -------
+        int
+            The optimisation status of the solver.
+        """
+        return self.model.resolve()
+
     def force_objective_value(self, v: Numeric):
         """
         Adds a constraint to the model to force the objective to have a specific value.
@@ -166,7 +518,7 @@ class ILPBuilder(abc.ABC):
         v : Numeric
             The value of the objective.
         """
-        self.model += self.objective() == v
+        self.model += self.model.objective == v
 
     def ban_selection(self, selection: Selection) -> None:
         """
@@ -192,9 +544,14 @@ class ILPBuilder(abc.ABC):
 def ilp_optimiser_rule(
     ilp_builder: ILPBuilder,
     resoluteness: bool = True,
+    max_num_selections: int = None,
 ) -> Selection | list[Selection]:
     """Rule that optimises an ILP and returns the corresponding selection(s). Returns the first optimal solution found
-    if :code:`resoluteness = True` and, all the optimal solutions otherwise."""
+    if :code:`resoluteness = True` and, all the optimal solutions otherwise.
+
+    When irresolute, the optimal solutions are enumerated by resolving the model after banning each solution found
+    (see :py:meth:`~trivoting.rules.ilp_schemes.ILPBuilder.resolve`). The enumeration stops after
+    `max_num_selections` solutions if it is not None."""
 
     if (
         ilp_builder.initial_selection
@@ -209,9 +566,96 @@ def ilp_optimiser_rule(
     ilp_builder.init_vars()
     ilp_builder.apply_constraints()
     ilp_builder.set_objective()
+    ilp_builder.set_warm_start_values()
+
+    return _optimal_selections(
+        ilp_builder, ilp_builder.solve(), resoluteness, max_num_selections
+    )
+
+
+def ilp_optimiser_size_sweep(
+    ilp_builder: ILPBuilder,
+    resoluteness: bool = True,
+    max_num_selections: int = None,
+) -> dict[int, Selection | list[Selection]]:
+    """
+    Optimises an ILP for all the maximum sizes of the selections from 1 to the maximum size of the builder, and returns
+    the corresponding selection(s) for each size, as :py:func:`~trivoting.rules.ilp_schemes.ilp_optimiser_rule` would.
+
+    The model is built once, for the largest size. The sizes are then considered in increasing order, only changing the
+    right-hand side of the constraint bounding the size of the selections between the resolutions (see
+    :py:meth:`~trivoting.rules.ilp_schemes.ILPBuilder.set_max_size_selection`). Each resolution is warm-started from the
+    optimal solution for the previous size, which remains feasible.
+
+    Parameters
+    ----------
+    ilp_builder : ILPBuilder
+        The ILP builder, whose maximum size of the selections is the largest size considered.
+    resoluteness : bool, optional
+        If True, returns a single optimal selection for each size, and all of them otherwise.
+        Defaults to True.
+    max_num_selections : int, optional
+        If irresolute, the maximum number of selections to return for each size. Defaults to None, in which case all
+        the optimal selections are returned.
+
+    Returns
+    -------
+    dict[int, Selection | list[Selection]]
+        Maps each size to the selection if resolute (:code:`resoluteness == True`), or to the list of selections if
+        irresolute (:code:`resoluteness == False`).
+    """
+    max_size_selection = ilp_builder.max_size_selection
+    # A starting solution for the largest size would not be feasible for the smaller ones
+    ilp_builder.warm_start = None
+    if not ilp_builder.size_dependent_model:
+        ilp_builder.init_vars()
+        ilp_builder.apply_constraints()
+        ilp_builder.set_objective()
+
+    outcomes = dict()
+    built = False
+    len_initial_selection = (
+        0
+        if ilp_builder.initial_selection is None
+        else len(ilp_builder.initial_selection)
+    )
+    for size in range(1, int(max_size_selection) + 1):
+        if size <= len_initial_selection:
+            outcomes[size] = (
+                ilp_builder.initial_selection
+                if resoluteness
+                else [ilp_builder.initial_selection]
+            )
+            continue
+        ilp_builder.set_max_size_selection(size)
+        ilp_builder.set_warm_start_values()
+        num_constraints = ilp_builder.model.numConstraints()
+        if built:
+            status = ilp_builder.resolve()
+        else:
+            status = ilp_builder.solve()
+            built = not ilp_builder.size_dependent_model
+        selections = _optimal_selections(
+            ilp_builder, status, resoluteness, max_num_selections
+        )
+        outcomes[size] = selections
+        ilp_builder.warm_start = selections if resoluteness else selections[0]
+        if not resoluteness:
+            # The constraints added to enumerate the selections are removed, the model then needs to be passed to the
+            # solver again
+            _remove_constraints(ilp_builder.model, num_constraints)
+            built = False
+    return outcomes
 
-    status = ilp_builder.solve()
 
+def _optimal_selections(
+    ilp_builder: ILPBuilder,
+    status: int,
+    resoluteness: bool,
+    max_num_selections: int | None,
+) -> Selection | list[Selection]:
+    """Reads the optimal selection from a solved model and, if irresolute, enumerates the other optimal selections by
+    resolving the model after banning the previous ones."""
     all_selections = []
 
     if status == LpStatusOptimal:
@@ -231,10 +675,10 @@ def ilp_optimiser_rule(
     # If irresolute, we solve again, banning the previous selections
     ilp_builder.force_objective_value(value(ilp_builder.model.objective))
     previous_selection = selection
-    while True:
+    while max_num_selections is None or len(all_selections) < max_num_selections:
         ilp_builder.ban_selection(previous_selection)
 
-        status = ilp_builder.solve()
+        status = ilp_builder.resolve()
 
         if status != LpStatusOptimal:
             break
@@ -4,11 +4,16 @@ disapproved but selected ones."""
 
 from __future__ import annotations
 
+import heapq
+from collections.abc import Iterator
+from itertools import combinations, islice
+
 from pulp import lpSum, LpVariable, LpInteger, LpAffineExpression
 
 from trivoting.election import AbstractTrichotomousProfile, Selection
 from trivoting.rules.ilp_schemes import (
     ILPBuilder,
+    ILPFormulation,
     ilp_optimiser_rule,
     ILPNotOptimalError,
 )
@@ -23,9 +28,13 @@ class MaxNetSupportILPBuilder(ILPBuilder):
     def init_vars(self) -> None:
         super(MaxNetSupportILPBuilder, self).init_vars()
 
+        if self.formulation == ILPFormulation.COMPACT:
+            # The net support of a ballot is directly expressed from the selection variables
+            return
+
         self.vars["sat_var"] = dict()
 
-        for i, ballot in enumerate(self.profile):
+        for i, (ballot, _) in enumerate(self.ballot_types):
             sat_var = LpVariable(
                 f"sat_{i}",
                 lowBound=-self.max_size_selection,
@@ -38,9 +47,18 @@ class MaxNetSupportILPBuilder(ILPBuilder):
             self.vars["sat_var"][i] = sat_var
 
     def objective(self) -> LpAffineExpression:
+        if self.formulation == ILPFormulation.COMPACT:
+            return lpSum(
+                (
+                    lpSum(self.vars["selection"][alt] for alt in ballot.approved)
+                    - lpSum(self.vars["selection"][alt] for alt in ballot.disapproved)
+                )
+                * multiplicity
+                for ballot, multiplicity in self.ballot_types
+            )
         return lpSum(
-            self.vars["sat_var"][i] * self.profile.multiplicity(b)
-            for i, b in enumerate(self.profile)
+            self.vars["sat_var"][i] * multiplicity
+            for i, (_, multiplicity) in enumerate(self.ballot_types)
         )
 
 
@@ -51,12 +69,15 @@ def max_net_support_ilp(
     resoluteness: bool = True,
     max_seconds: int = 600,
     verbose: bool = False,
+    warm_start: bool = False,
+    max_num_selections: int = None,
 ) -> Selection | list[Selection]:
     """
     Compute the selections maximising the total net support of the voters via an ILP solver.
 
     Used mostly for debugging purposes, the function :py:func:`~trivoting.rules.max_net_support.max_net_support` being
-    much more efficient.
+    much more efficient. With `warm_start=True`, the outcome of the latter is passed to the solver as a starting
+    solution.
 
     Parameters
     ----------
@@ -77,6 +98,13 @@ def max_net_support_ilp(
     verbose : bool, optional
         If True the output of the ILP solver is not silenced.
         Defaults to False.
+    warm_start : bool, optional
+        If True, the solver is started from the outcome of
+        :py:func:`~trivoting.rules.max_net_support.max_net_support`.
+        Defaults to False.
+    max_num_selections : int, optional
+        If irresolute, the maximum number of selections to return. Defaults to None, in which case all the optimal
+        selections are returned.
 
     Returns
     -------
@@ -90,9 +118,22 @@ def max_net_support_ilp(
         initial_selection,
         max_seconds=max_seconds,
         verbose=verbose,
+        warm_start=(
+            max_net_support(
+                profile,
+                max_size_selection,
+                None if initial_selection is None else initial_selection.copy(),
+            )
+            if warm_start
+            else None
+        ),
     )
     try:
-        return ilp_optimiser_rule(ilp_builder, resoluteness=resoluteness)
+        return ilp_optimiser_rule(
+            ilp_builder,
+            resoluteness=resoluteness,
+            max_num_selections=max_num_selections,
+        )
     except ILPNotOptimalError as e:
         raise RuntimeError("Max Net Support ILP did not converge.") from e
 
@@ -102,6 +143,7 @@ def max_net_support(
     max_size_selection: int,
     initial_selection: Selection = None,
     resoluteness: bool = True,
+    max_num_selections: int = None,
 ) -> Selection | list[Selection]:
     """
     Compute the selections maximising the total net support of the voters by sequentially selecting up to
@@ -110,6 +152,9 @@ def max_net_support(
     The net support of an alternative is the number of voters approving of it minus the number of voters disapproving
     of it.
 
+    When irresolute, the optimal selections are enumerated combinatorially by
+    :py:func:`~trivoting.rules.max_net_support.max_net_support_selections`, without solving any ILP.
+
     Parameters
     ----------
     profile : AbstractTrichotomousProfile
@@ -123,24 +168,91 @@ def max_net_support(
         If True, returns a single selection (resolute).
         If False, returns all tied optimal selections (irresolute).
         Defaults to True.
+    max_num_selections : int, optional
+        If irresolute, the maximum number of selections to return. Defaults to None, in which case all the optimal
+        selections are returned.
+
     Returns
     -------
     Selection | list[Selection]
         The selection if resolute (:code:`resoluteness == True`), or a list of selections
         if irresolute (:code:`resoluteness == False`).
     """
-    if not resoluteness:
-        raise NotImplementedError(
-            "Max Net Support does not yet support resoluteness=False."
-        )
-    alt_scores = profile.support_dict()
+    selections = max_net_support_selections(
+        profile, max_size_selection, initial_selection
+    )
+    if resoluteness:
+        return next(selections)
+    return list(islice(selections, max_num_selections))
+
+
+def max_net_support_selections(
+    profile: AbstractTrichotomousProfile,
+    max_size_selection: int,
+    initial_selection: Selection = None,
+) -> Iterator[Selection]:
+    """
+    Generates all the selections maximising the total net support of the voters, without computing them in advance.
+
+    If `r` alternatives can still be added to the initial selection, the optimal selections are determined by the
+    `r`-th highest positive net support, the cut-off: they contain all the alternatives with a net support above the
+    cut-off, and any choice of the alternatives tied at the cut-off. When there are fewer than `r` alternatives with
+    positive net support, they are all selected, together with any choice of the alternatives with zero net support
+    fitting in the remaining room. The cut-off is found with a partial sort of the `r` highest net supports and each
+    selection is generated in time linear in its size.
+
+    The first selection generated is the resolute outcome of
+    :py:func:`~trivoting.rules.max_net_support.max_net_support`.
+
+    Parameters
+    ----------
+    profile : AbstractTrichotomousProfile
+        The trichotomous profile.
+    max_size_selection : int
+        Maximum number of alternatives to select.
+    initial_selection : Selection, optional
+        An initial selection that fixes some alternatives as selected or rejected.
+        If `implicit_reject` is True, no alternatives are fixed to be rejected.
+
+    Yields
+    ------
+    Selection
+        The optimal selections, each one exactly once.
+    """
     if initial_selection is None:
-        selection = Selection(implicit_reject=True)
+        initial_selection = Selection(implicit_reject=True)
+    num_to_select = max_size_selection - len(initial_selection)
+    if num_to_select <= 0:
+        yield initial_selection.copy()
+        return
+
+    alt_scores = profile.support_dict()
+    positive_scores = [
+        (alt, score)
+        for alt, score in alt_scores.items()
+        if score > 0 and alt not in initial_selection
+    ]
+    # Equivalent to a stable sort in decreasing order, restricted to the first num_to_select alternatives
+    top_scores = heapq.nlargest(num_to_select, positive_scores, key=lambda x: x[1])
+
+    if len(top_scores) == num_to_select:
+        cutoff = top_scores[-1][1]
+        above_cutoff = [alt for alt, score in top_scores if score > cutoff]
+        tied = [alt for alt, score in positive_scores if score == cutoff]
+        num_tied_to_select = [num_to_select - len(above_cutoff)]
     else:
-        selection = initial_selection
-    for alt, score in sorted(alt_scores.items(), key=lambda x: x[1], reverse=True):
-        if len(selection) >= max_size_selection:
-            break
-        if score > 0:
-            selection.add_selected(alt)
-    return selection
+        # All the alternatives with positive support are selected, there is room for those with zero support
+        above_cutoff = [alt for alt, _ in top_scores]
+        tied = sorted(
+            alt
+            for alt in profile.alternatives
+            if alt_scores.get(alt, 0) == 0 and alt not in initial_selection
+        )
+        num_tied_to_select = range(min(num_to_select - len(top_scores), len(tied)) + 1)
+
+    for num_tied in num_tied_to_select:
+        for tied_selection in combinations(tied, num_tied):
+            selection = initial_selection.copy()
+            selection.extend_selected(above_cutoff)
+            selection.extend_selected(tied_selection)
+            yield selection
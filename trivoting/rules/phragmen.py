@@ -4,14 +4,18 @@ Phragmén's rules compute selections that try to balance the load carried by eac
 
 from __future__ import annotations
 
-from copy import deepcopy
+import heapq
+from collections.abc import Iterable
+
+import numpy as np
 
 from trivoting.election.alternative import Alternative
 from trivoting.election.trichotomous_ballot import AbstractTrichotomousBallot
 from trivoting.election.trichotomous_profile import AbstractTrichotomousProfile
-from trivoting.fractions import Numeric, frac
+from trivoting.fractions import Numeric, frac, frac_isclose
 from trivoting.election.selection import Selection
 from trivoting.tiebreaking import TieBreakingRule, lexico_tie_breaking
+from trivoting.utils import explore_ties_in_parallel
 
 
 class PhragmenVoter:
@@ -48,6 +52,219 @@ class PhragmenVoter:
         return self.multiplicity * self.load
 
 
+class PhragmenLoadTracker:
+    """
+    Keeps track of the loads of the voters during a run of the sequential Phragmén rule. For each alternative, the
+    tracker stores the total load of its supporters and of its opponents, from which the new maximum load that
+    selecting, or vetoing, the alternative would induce is computed. When the load of a voter changes, only the sums
+    of the alternatives appearing on their ballot are updated. The new maximum loads are kept in a priority queue
+    whose outdated entries are skipped, so that the minimum is obtained without scanning all the alternatives.
+
+    Parameters
+    ----------
+    voters : list[PhragmenVoter]
+        The voters, whose loads are updated by the tracker.
+    supporters : dict[Alternative, list[int]]
+        For each alternative, the indices of the voters approving of it.
+    opponents : dict[Alternative, list[int]]
+        For each alternative, the indices of the voters disapproving of it.
+    """
+
+    def __init__(
+        self,
+        voters: list[PhragmenVoter],
+        supporters: dict[Alternative, list[int]],
+        opponents: dict[Alternative, list[int]],
+    ) -> None:
+        self.voters = voters
+        self.supporters = supporters
+        self.opponents = opponents
+        # The pairs (alternative, veto) that can be chosen, identified by their position in the list
+        self.choices = []
+        self.alternative_choices = dict()
+        self.voter_choices = [[] for _ in voters]
+        self.num_voters = []
+        self.load_sums = []
+        for alt in supporters:
+            for considered_voters, veto in (
+                (supporters[alt], False),
+                (opponents[alt], True),
+            ):
+                num_considered_voters = sum(
+                    voters[i].multiplicity for i in considered_voters
+                )
+                if num_considered_voters > 0:
+                    choice = len(self.choices)
+                    self.choices.append((alt, veto))
+                    self.alternative_choices.setdefault(alt, []).append(choice)
+                    self.num_voters.append(num_considered_voters)
+                    self.load_sums.append(
+                        sum(voters[i].total_load() for i in considered_voters)
+                    )
+                    for i in considered_voters:
+                        self.voter_choices[i].append(choice)
+        self.voter_choices = [
+            np.array(choices, dtype=np.int64) for choices in self.voter_choices
+        ]
+        self.versions = [0] * len(self.choices)
+        self.queue = [
+            (self.new_maxload(choice), choice, 0) for choice in range(len(self.choices))
+        ]
+        heapq.heapify(self.queue)
+
+    def new_maxload(self, choice: int) -> Numeric:
+        """Returns the new maximum load of the voters concerned by the choice, if it was made."""
+        return frac(self.load_sums[choice] + 1, self.num_voters[choice])
+
+    def min_new_maxload(
+        self, alternatives: set[Alternative]
+    ) -> tuple[Numeric | None, list[tuple[Alternative, bool]]]:
+        """
+        Returns the minimum new maximum load over the alternatives, and the pairs (alternative, veto) achieving it.
+        In float mode, the loads are compared with a tolerance (see :py:func:`~trivoting.fractions.frac_isclose`)
+        since the load sums updated incrementally accumulate rounding errors.
+
+        Parameters
+        ----------
+        alternatives : set[Alternative]
+            The alternatives that can still be selected or vetoed. The others are discarded from the queue.
+
+        Returns
+        -------
+        tuple[Numeric | None, list[tuple[Alternative, bool]]]
+            The minimum new maximum load (None if there is no alternative) and the pairs (alternative, veto) achieving
+            it.
+        """
+        queue = self.queue
+        min_maxload = None
+        argmin = []
+        while queue:
+            maxload, choice, version = queue[0]
+            if (
+                version != self.versions[choice]
+                or self.choices[choice][0] not in alternatives
+            ):
+                heapq.heappop(queue)
+                continue
+            if min_maxload is None:
+                min_maxload = maxload
+            elif not frac_isclose(maxload, min_maxload):
+                break
+            argmin.append(heapq.heappop(queue))
+        for entry in argmin:
+            heapq.heappush(queue, entry)
+        return min_maxload, [self.choices[choice] for _, choice, _ in argmin]
+
+    def choose(self, alternative: Alternative, veto: bool, load: Numeric) -> tuple:
+        """
+        Assigns the load to the supporters of the alternative, or to its opponents if it is vetoed, and updates the
+        sums of the loads of the alternatives appearing on their ballots.
+
+        Parameters
+        ----------
+        alternative : Alternative
+            The alternative.
+        veto : bool
+            Whether the alternative is vetoed.
+        load : Numeric
+            The new load of the voters.
+
+        Returns
+        -------
+        tuple
+            The record of the changes, to be passed to :py:meth:`~trivoting.rules.phragmen.PhragmenLoadTracker.undo`
+            to revert them.
+        """
+        considered_voters = (
+            self.opponents[alternative] if veto else self.supporters[alternative]
+        )
+        # The voters are grouped by their previous load: the load sum of a choice then increases by the number of
+        # voters of a group concerned by the choice, times the increase of the load for that group.
+        voters_per_load = dict()
+        previous_loads = []
+        previous_sums = []
+        for i in considered_voters:
+            voter = self.voters[i]
+            if voter.load != load:
+                voters_per_load.setdefault(voter.load, []).append(i)
+                previous_loads.append((i, voter.load))
+                voter.load = load
+        updated = np.zeros(len(self.choices), dtype=bool)
+        for previous_load, voter_indices in voters_per_load.items():
+            choices = [self.voter_choices[i] for i in voter_indices]
+            counts = np.bincount(
+                np.concatenate(choices),
+                weights=np.repeat(
+                    [self.voters[i].multiplicity for i in voter_indices],
+                    [len(c) for c in choices],
+                ),
+                minlength=len(self.choices),
+            )
+            updated_choices = np.flatnonzero(counts)
+            delta = load - previous_load
+            for choice, count in zip(
+                updated_choices.tolist(),
+                np.rint(counts[updated_choices]).astype(np.int64).tolist(),
+            ):
+                previous_sums.append((choice, self.load_sums[choice]))
+                self.load_sums[choice] += count * delta
+            updated[updated_choices] = True
+        self._push(np.flatnonzero(updated).tolist())
+        return alternative, previous_loads, previous_sums
+
+    def undo(self, record: tuple) -> None:
+        """
+        Reverts the changes of a call to :py:meth:`~trivoting.rules.phragmen.PhragmenLoadTracker.choose`. The calls
+        must be undone in the reverse order in which they were made.
+
+        Parameters
+        ----------
+        record : tuple
+            The record returned by the call.
+        """
+        alternative, previous_loads, previous_sums = record
+        for i, load in previous_loads:
+            self.voters[i].load = load
+        for choice, load_sum in reversed(previous_sums):
+            self.load_sums[choice] = load_sum
+        # The entries of the alternative may have been discarded from the queue once it was no longer available
+        self._push(
+            {choice for choice, _ in previous_sums}.union(
+                self.alternative_choices[alternative]
+            )
+        )
+
+    def _push(self, choices: Iterable[int]) -> None:
+        """Adds up-to-date entries for the choices to the queue, their previous entries becoming outdated."""
+        for choice in choices:
+            self.versions[choice] += 1
+            heapq.heappush(
+                self.queue,
+                (self.new_maxload(choice), choice, self.versions[choice]),
+            )
+
+    def copy(self) -> PhragmenLoadTracker:
+        """Returns a copy of the tracker, with copies of the voters, sharing the immutable data with the current one."""
+        res = PhragmenLoadTracker.__new__(PhragmenLoadTracker)
+        res.voters = [
+            PhragmenVoter(v.ballot, v.load, v.multiplicity) for v in self.voters
+        ]
+        res.supporters = self.supporters
+        res.opponents = self.opponents
+        res.choices = self.choices
+        res.alternative_choices = self.alternative_choices
+        res.voter_choices = self.voter_choices
+        res.num_voters = self.num_voters
+        res.load_sums = self.load_sums.copy()
+        res.versions = self.versions.copy()
+        res.queue = self.queue.copy()
+        return res
+
+
+# Actions of the depth-first exploration of the ties in the sequential Phragmén rule
+_VISIT, _CHOOSE, _UNDO = range(3)
+
+
 def sequential_phragmen(
     profile: AbstractTrichotomousProfile,
     max_size_selection: int,
@@ -55,6 +272,7 @@ def sequential_phragmen(
     initial_selection: Selection | None = None,
     tie_breaking: TieBreakingRule | None = None,
     resoluteness: bool = True,
+    n_jobs: int | None = None,
 ) -> Selection | list[Selection]:
     """
     Compute the selections of the sequential Phragmén's rule.
@@ -62,6 +280,10 @@ def sequential_phragmen(
     The definition of the sequential Phragmén's rule for the trichotomous context is taken from Section 3.2 of
     ``Proportionality in Thumbs Up and Down Voting`` (Kraiczy, Papasotiropoulos, Pierczyński and Skowron, 2025).
 
+    When irresolute, the branches of the first tie can be explored in parallel by a pool of `n_jobs` processes (see
+    :py:func:`~trivoting.utils.explore_ties_in_parallel`). The outcome does not depend on the number of processes. All
+    the arguments, including the tie-breaking rule, then need to be picklable.
+
     Parameters
     ----------
     profile : AbstractTrichotomousProfile
@@ -80,6 +302,9 @@ def sequential_phragmen(
         If True, returns a single selection (resolute).
         If False, returns all tied optimal selections (irresolute).
         Defaults to True.
+    n_jobs : int, optional
+        Number of processes used to explore the ties when irresolute, a negative value meaning one per processor.
+        Defaults to None, in which case everything is run in the current process.
 
     Returns
     -------
@@ -88,70 +313,194 @@ def sequential_phragmen(
         if irresolute (:code:`resoluteness == False`).
     """
 
-    def _select_next_alternative(
-        alternatives: set[Alternative],
-        voters: list[PhragmenVoter],
-        selection: Selection,
-    ):
-        if len(alternatives) == 0 or len(selection) == max_size_selection:
-            if not resoluteness:
-                selection.sort()
-                if selection not in all_selections:
-                    all_selections.append(selection)
-            else:
-                all_selections.append(selection)
+    if not resoluteness and n_jobs is not None and n_jobs != 1:
+        return explore_ties_in_parallel(
+            _sequential_phragmen,
+            (
+                profile,
+                max_size_selection,
+                initial_loads,
+                initial_selection,
+                tie_breaking,
+                resoluteness,
+            ),
+            n_jobs,
+        )
+    return _sequential_phragmen(
+        profile,
+        max_size_selection,
+        initial_loads,
+        initial_selection,
+        tie_breaking,
+        resoluteness,
+    )[0]
+
+
+def sequential_phragmen_size_sweep(
+    profile: AbstractTrichotomousProfile,
+    max_size_selection: int,
+    initial_loads: list[Numeric] | None = None,
+    initial_selection: Selection | None = None,
+    tie_breaking: TieBreakingRule | None = None,
+) -> dict[int, Selection]:
+    """
+    Compute the selection of the sequential Phragmén's rule, as
+    :py:func:`~trivoting.rules.phragmen.sequential_phragmen` does when resolute, for all the maximum sizes of the
+    selections from 1 to `max_size_selection`.
+
+    Alternatives are never removed from the selection by the rule: the selection for a given size is the one obtained
+    when the run for the largest size first reaches that size. The rule is thus run only once.
+
+    Parameters
+    ----------
+    profile : AbstractTrichotomousProfile
+        The trichotomous profile.
+    max_size_selection : int
+        The largest maximum number of alternatives to select.
+    initial_loads : list of Numeric, optional
+        Initial loads for each ballot in the profile. Defaults to zero for all ballots.
+    initial_selection : Selection, optional
+        An initial selection that fixes some alternatives as selected or rejected.
+        If `implicit_reject` is True, no alternatives are fixed to be rejected.
+    tie_breaking : TieBreakingRule, optional
+        Tie-breaking rule used when multiple alternatives tie.
+        Defaults to lexicographic tie-breaking.
+
+    Returns
+    -------
+    dict[int, Selection]
+        Maps each size to the selection.
+    """
+    try:
+        max_size_selection = int(max_size_selection)
+    except ValueError:
+        raise ValueError("max_size_selection must be an integer.")
+
+    if initial_selection is None:
+        initial_selection = Selection(implicit_reject=True)
+    snapshots = dict()
+    final_selection = _sequential_phragmen(
+        profile,
+        max_size_selection,
+        initial_loads,
+        initial_selection.copy(),
+        tie_breaking,
+        True,
+        snapshots=snapshots,
+    )[0]
+    # The sizes are shifted by the size of the initial selection, as in _sequential_phragmen
+    outcomes = dict()
+    for size in range(1, max_size_selection + 1):
+        selection_size = size - len(initial_selection)
+        if selection_size <= len(initial_selection):
+            # No alternative can be selected
+            outcomes[size] = initial_selection.copy()
+        elif selection_size in snapshots:
+            outcomes[size] = snapshots[selection_size]
         else:
-            min_new_maxload = None
-            arg_min_new_maxload = None
-            for alt in alternatives:
-                for considered_voters, veto in (
-                    (supporters[alt], False),
-                    (opponents[alt], True),
-                ):
-                    num_considered_voters = len(considered_voters)
-                    if num_considered_voters > 0:
-                        new_maxload = frac(
-                            sum(voters[i].total_load() for i in considered_voters) + 1,
-                            num_considered_voters,
-                        )
-                        if min_new_maxload is None or new_maxload < min_new_maxload:
-                            min_new_maxload = new_maxload
-                            arg_min_new_maxload = [(alt, veto)]
-                        elif min_new_maxload == new_maxload:
-                            arg_min_new_maxload.append((alt, veto))
-
-            tied_alternatives = tie_breaking.order(
-                profile, arg_min_new_maxload, key=lambda x: x[0]
-            )
-            if resoluteness:
-                selected_alternative, vetoed = tied_alternatives[0]
-                for voter in voters:
-                    if not vetoed and selected_alternative in voter.ballot.approved:
-                        voter.load = min_new_maxload
-                    elif vetoed and selected_alternative in voter.ballot.disapproved:
-                        voter.load = min_new_maxload
+            # The selection never reached that size
+            outcomes[size] = final_selection
+    return outcomes
+
+
+def _sequential_phragmen(
+    profile: AbstractTrichotomousProfile,
+    max_size_selection: int,
+    initial_loads: list[Numeric] | None,
+    initial_selection: Selection | None,
+    tie_breaking: TieBreakingRule | None,
+    resoluteness: bool,
+    branch: int | None = None,
+    snapshots: dict[int, Selection] | None = None,
+) -> tuple[Selection | list[Selection], int]:
+    """
+    Computes the outcome of :py:func:`~trivoting.rules.phragmen.sequential_phragmen`, together with the number of
+    branches at the first tie. If `branch` is not None, only the branch of that index is explored at the first tie,
+    see :py:func:`~trivoting.utils.explore_ties_in_parallel`.
+
+    If `snapshots` is not None and the rule is resolute, a copy of the selection is stored in `snapshots` for each size
+    it reaches.
+    """
+
+    def _tied_choices() -> tuple[Numeric, list[tuple[Alternative, bool]]]:
+        """Returns the minimum new maximum load and the pairs (alternative, veto) achieving it, in tie-breaking
+        order."""
+        min_new_maxload, arg_min_new_maxload = tracker.min_new_maxload(alternatives)
+        if len(arg_min_new_maxload) > 1:
+            # Same order as when iterating over all the alternatives
+            tied = set(arg_min_new_maxload)
+            arg_min_new_maxload = [
+                (alt, veto)
+                for alt in alternatives
+                for veto in (False, True)
+                if (alt, veto) in tied
+            ]
+        return min_new_maxload, tie_breaking.order(
+            profile, arg_min_new_maxload, key=lambda x: x[0]
+        )
+
+    def _choose(alternative: Alternative, vetoed: bool, load: Numeric) -> tuple:
+        record = tracker.choose(alternative, vetoed, load)
+        if not vetoed:
+            selection.add_selected(alternative)
+        alternatives.remove(alternative)
+        return record
+
+    def _explore_ties() -> int:
+        """
+        Explores all the tie-breaking branches depth-first. A single state is maintained and each branch is undone
+        once explored using an undo log, states that have already been visited through another branch are not
+        explored again. Returns the number of branches at the first tie.
+        """
+        num_branches = 0
+        found_selections = set()
+        visited_states = set()
+        undo_log = []
+        # The stack contains the states to visit, together with the choices to make and to undo
+        stack = [(_VISIT,)]
+        while stack:
+            action = stack.pop()
+            if action[0] == _CHOOSE:
+                _, alternative, vetoed, load = action
+                undo_log.append((_choose(alternative, vetoed, load), vetoed))
+            elif action[0] == _UNDO:
+                record, vetoed = undo_log.pop()
+                tracker.undo(record)
                 if not vetoed:
-                    selection.add_selected(selected_alternative)
-                alternatives.remove(selected_alternative)
-                _select_next_alternative(alternatives, voters, selection)
+                    selection.selected.pop()
+                alternatives.add(record[0])
             else:
-                for selected_alternative, vetoed in tied_alternatives:
-                    new_voters = deepcopy(voters)
-                    for voter in new_voters:
-                        if not vetoed and selected_alternative in voter.ballot.approved:
-                            voter.load = min_new_maxload
-                        elif (
-                            vetoed and selected_alternative in voter.ballot.disapproved
-                        ):
-                            voter.load = min_new_maxload
-                    new_selection = deepcopy(selection)
-                    if not vetoed:
-                        new_selection.add_selected(selected_alternative)
-                    new_alternatives = deepcopy(alternatives)
-                    new_alternatives.remove(selected_alternative)
-                    _select_next_alternative(
-                        new_alternatives, new_voters, new_selection
-                    )
+                state = (
+                    frozenset(selection.selected),
+                    frozenset(alternatives),
+                    tuple(voter.load for voter in tracker.voters),
+                )
+                if state in visited_states:
+                    continue
+                visited_states.add(state)
+
+                if len(alternatives) == 0 or len(selection) == max_size_selection:
+                    result = selection.copy()
+                    result.sort()
+                    key = tuple(result.selected)
+                    if key not in found_selections:
+                        found_selections.add(key)
+                        all_selections.append(result)
+                    continue
+                min_new_maxload, tied_alternatives = _tied_choices()
+                if num_branches == 0 and len(tied_alternatives) > 1:
+                    num_branches = len(tied_alternatives)
+                    if branch is not None:
+                        tied_alternatives = (
+                            tied_alternatives[branch : branch + 1]
+                            if branch >= 0
+                            else []
+                        )
+                for alternative, vetoed in reversed(tied_alternatives):
+                    stack.append((_UNDO,))
+                    stack.append((_VISIT,))
+                    stack.append((_CHOOSE, alternative, vetoed, min_new_maxload))
+        return num_branches
 
     try:
         max_size_selection = int(max_size_selection)
@@ -194,10 +543,18 @@ def sequential_phragmen(
                 opponents[alternative] = opps
                 initial_alternatives.add(alternative)
 
+    alternatives = initial_alternatives
+    selection = initial_selection
+    tracker = PhragmenLoadTracker(initial_voters, supporters, opponents)
     all_selections = []
 
-    _select_next_alternative(initial_alternatives, initial_voters, initial_selection)
-
     if resoluteness:
-        return all_selections[0]
-    return all_selections
+        while len(alternatives) > 0 and len(selection) < max_size_selection:
+            min_new_maxload, tied_alternatives = _tied_choices()
+            alternative, vetoed = tied_alternatives[0]
+            _choose(alternative, vetoed, min_new_maxload)
+            if snapshots is not None and not vetoed:
+                snapshots[len(selection)] = selection.copy()
+        return selection, 0
+    num_branches = _explore_ties()
+    return all_selections, num_branches
@@ -7,10 +7,12 @@ alternatives, and (4) the number of disapproved and rejected alternatives.
 from __future__ import annotations
 
 import abc
+import heapq
+import math
 from abc import abstractmethod
-from collections.abc import Iterable
-from copy import deepcopy
+from collections.abc import Callable, Iterable, Iterator
 
+import trivoting.fractions
 from trivoting.election import AbstractTrichotomousProfile, Alternative
 
 from pulp import (
@@ -22,19 +24,52 @@ from pulp import (
 )
 
 from trivoting.election.selection import Selection
-from trivoting.fractions import Numeric
-from trivoting.rules.ilp_schemes import ILPBuilder, ilp_optimiser_rule
+from trivoting.fractions import Numeric, frac_gt, frac_isclose, frac_lt
+from trivoting.rules.ilp_schemes import (
+    ILPBuilder,
+    ILPFormulation,
+    ilp_optimiser_rule,
+    ilp_optimiser_size_sweep,
+)
 from trivoting.tiebreaking import TieBreakingRule, lexico_tie_breaking
-from trivoting.utils import harmonic_sum, classproperty
+from trivoting.utils import explore_ties_in_parallel, harmonic_sum, classproperty
 
 
 class ThieleScore(abc.ABC):
     """Class used to define score function for Thiele methods. Defines the elements that are needed for both the ILP
-    solver approach and the sequential approach."""
+    solver approach and the sequential approach.
+
+    The values of the scoring function are tabulated: :py:meth:`~trivoting.rules.thiele.ThieleScore.score_counts`
+    computes the score of a tuple of counts once and then reads it from a table. The table is reset whenever
+    `max_size_selection` or the fraction mode (see :py:data:`~trivoting.fractions.FRACTION`) changes. The scoring
+    function is thus assumed to only depend on the counts and on `max_size_selection`.
+    """
+
+    submodular = False
+    """Whether the marginal contribution of selecting an alternative can only decrease as more alternatives are
+    selected. Submodular scores allow for the lazy evaluation of the marginal contributions in
+    :py:func:`~trivoting.rules.thiele.sequential_thiele`. Only holds when at most `max_size_selection` alternatives are
+    selected."""
+
+    size_dependent = False
+    """Whether the scoring function depends on `max_size_selection`. The outcomes of the sequential rule for several
+    maximum sizes can only be computed in a single run for scores that do not depend on it, see
+    :py:func:`~trivoting.rules.thiele.sequential_thiele_size_sweep`."""
 
     def __init__(self, max_size_selection: int):
         self.max_size_selection = max_size_selection
 
+    @property
+    def max_size_selection(self) -> int:
+        """Maximum number of alternatives to select."""
+        return self._max_size_selection
+
+    @max_size_selection.setter
+    def max_size_selection(self, value: int):
+        self._max_size_selection = value
+        self._score_table = dict()
+        self._score_table_fraction = trivoting.fractions.FRACTION
+
     @abstractmethod
     def score_function(
         self,
@@ -62,6 +97,65 @@ class ThieleScore(abc.ABC):
                 The number of disapproved and rejected alternatives
         """
 
+    def score_counts(
+        self,
+        num_app_sel: int = 0,
+        num_disapp_sel: int = 0,
+        num_app_rej: int = 0,
+        num_disapp_rej: int = 0,
+    ) -> Numeric:
+        """
+        Returns the value of the scoring function for the given counts, reading it from the table of the scores
+        already computed when possible.
+
+        Parameters
+        ----------
+            num_app_sel: int, optional
+                The number of approved and selected alternatives
+            num_disapp_sel: int, optional
+                The number of disapproved and selected alternatives
+            num_app_rej: int, optional
+                The number of approved and rejected alternatives
+            num_disapp_rej: int, optional
+                The number of disapproved and rejected alternatives
+
+        Returns
+        -------
+            Numeric
+                The score.
+        """
+        if getattr(self, "_score_table_fraction", None) != trivoting.fractions.FRACTION:
+            self._score_table = dict()
+            self._score_table_fraction = trivoting.fractions.FRACTION
+        key = (num_app_sel, num_disapp_sel, num_app_rej, num_disapp_rej)
+        score = self._score_table.get(key)
+        if score is None:
+            score = self.score_function(*key)
+            self._score_table[key] = score
+        return score
+
+    def tabulate(self, max_num_approved: int, max_num_disapproved: int) -> None:
+        """
+        Precomputes the scores of all the tuples of counts that can be reached by a ballot approving of at most
+        `max_num_approved` alternatives and disapproving of at most `max_num_disapproved` alternatives.
+
+        Parameters
+        ----------
+            max_num_approved: int
+                The maximum number of approved alternatives in a ballot.
+            max_num_disapproved: int
+                The maximum number of disapproved alternatives in a ballot.
+        """
+        for num_app_sel in range(max_num_approved + 1):
+            for num_app_rej in range(max_num_approved - num_app_sel + 1):
+                for num_disapp_sel in range(max_num_disapproved + 1):
+                    for num_disapp_rej in range(
+                        max_num_disapproved - num_disapp_sel + 1
+                    ):
+                        self.score_counts(
+                            num_app_sel, num_disapp_sel, num_app_rej, num_disapp_rej
+                        )
+
     def score_selection(
         self,
         profile: AbstractTrichotomousProfile,
@@ -117,7 +211,7 @@ class ThieleScore(abc.ABC):
                     selection.is_selected(a) and a not in extra_reject
                 ) or a in extra_accept:
                     num_disapp_sel += 1
-            ballot_score = self.score_function(
+            ballot_score = self.score_counts(
                 num_app_sel, num_disapp_sel, num_app_rej, num_disapp_rej
             )
             score += ballot_score * profile.multiplicity(ballot)
@@ -139,6 +233,225 @@ class ThieleScore(abc.ABC):
         return builder_cls
 
 
+class ThieleScoreTracker:
+    """
+    Keeps track of the Thiele score of a selection as alternatives are selected and rejected one at a time. For each
+    ballot type, the tracker stores the number of approved and selected, disapproved and selected, approved and
+    rejected, and disapproved and rejected alternatives. Changing the status of an alternative only updates the
+    counters of the ballots that approve or disapprove of it, and the marginal contribution of an alternative is
+    computed from the variations of the scores of these ballots only.
+
+    The counters follow the conventions of :py:meth:`~trivoting.rules.thiele.ThieleScore.score_selection`: an
+    alternative can be selected, rejected, or neither when the selection does not reject implicitly.
+
+    Parameters
+    ----------
+    thiele_score : ThieleScore
+        The Thiele score.
+    profile : AbstractTrichotomousProfile
+        The profile.
+    selection : Selection
+        The initial selection.
+    """
+
+    # Position of the counters in the list of counters of a ballot
+    _APP_SEL, _DISAPP_SEL, _APP_REJ, _DISAPP_REJ = range(4)
+
+    def __init__(
+        self,
+        thiele_score: ThieleScore,
+        profile: AbstractTrichotomousProfile,
+        selection: Selection,
+    ) -> None:
+        self.thiele_score = thiele_score
+        self.multiplicities = []
+        self.touched_ballots = dict()
+        self.status = dict()
+        self.counters = []
+        for i, ballot in enumerate(profile):
+            self.multiplicities.append(profile.multiplicity(ballot))
+            for alt in ballot.approved:
+                self.touched_ballots.setdefault(alt, []).append((i, True))
+            for alt in ballot.disapproved:
+                self.touched_ballots.setdefault(alt, []).append((i, False))
+            self.counters.append([0, 0, 0, 0])
+        for alt, touched_ballots in self.touched_ballots.items():
+            status = (selection.is_selected(alt), selection.is_rejected(alt))
+            self.status[alt] = status
+            for i, approves in touched_ballots:
+                position = self._counter_position(approves, status)
+                if position is not None:
+                    self.counters[i][position] += 1
+        self.ballot_scores = [
+            thiele_score.score_counts(*counters) for counters in self.counters
+        ]
+
+    @classmethod
+    def _counter_position(cls, approves: bool, status: tuple[bool, bool]) -> int | None:
+        is_selected, is_rejected = status
+        if approves:
+            if is_selected:
+                return cls._APP_SEL
+            if is_rejected:
+                return cls._APP_REJ
+        else:
+            if is_rejected:
+                return cls._DISAPP_REJ
+            if is_selected:
+                return cls._DISAPP_SEL
+        return None
+
+    def _new_counters(
+        self, alternative: Alternative, new_status: tuple[bool, bool]
+    ) -> Iterator[tuple[int, list[int]]]:
+        """Yields the ballots affected by the new status of the alternative, together with their new counters."""
+        old_status = self.status.get(alternative)
+        if old_status is None or old_status == new_status:
+            return
+        for i, approves in self.touched_ballots[alternative]:
+            old_position = self._counter_position(approves, old_status)
+            new_position = self._counter_position(approves, new_status)
+            if old_position != new_position:
+                counters = self.counters[i].copy()
+                if old_position is not None:
+                    counters[old_position] -= 1
+                if new_position is not None:
+                    counters[new_position] += 1
+                yield i, counters
+
+    def score_variation(
+        self, alternative: Alternative, is_selected: bool, is_rejected: bool
+    ) -> Numeric:
+        """
+        Returns the variation of the total score if the status of the alternative was changed.
+
+        Parameters
+        ----------
+        alternative : Alternative
+            The alternative.
+        is_selected : bool
+            Whether the alternative would be selected.
+        is_rejected : bool
+            Whether the alternative would be rejected.
+
+        Returns
+        -------
+        Numeric
+            The new total score minus the current one.
+        """
+        variation = 0
+        for i, counters in self._new_counters(alternative, (is_selected, is_rejected)):
+            variation += (
+                self.thiele_score.score_counts(*counters) - self.ballot_scores[i]
+            ) * self.multiplicities[i]
+        return variation
+
+    def marginal_contribution_of_selecting(self, alternative: Alternative) -> Numeric:
+        """Returns the increase in score if the alternative was selected."""
+        return self.score_variation(alternative, True, False)
+
+    def marginal_contribution_of_selected(self, alternative: Alternative) -> Numeric:
+        """Returns the decrease in score if the selected alternative was rejected instead."""
+        return -self.score_variation(alternative, False, True)
+
+    def update(self, alternative: Alternative, selection: Selection) -> None:
+        """
+        Updates the counters after the status of the alternative has changed in the selection.
+
+        Parameters
+        ----------
+        alternative : Alternative
+            The alternative.
+        selection : Selection
+            The selection, already updated.
+        """
+        new_status = (
+            selection.is_selected(alternative),
+            selection.is_rejected(alternative),
+        )
+        for i, counters in list(self._new_counters(alternative, new_status)):
+            self.counters[i] = counters
+            self.ballot_scores[i] = self.thiele_score.score_counts(*counters)
+        if alternative in self.status:
+            self.status[alternative] = new_status
+
+    def total_score(self) -> Numeric:
+        """Returns the total score of the current selection."""
+        return sum(s * m for s, m in zip(self.ballot_scores, self.multiplicities))
+
+    def copy(self) -> ThieleScoreTracker:
+        """Returns a copy of the tracker, sharing the immutable data with the current one."""
+        res = ThieleScoreTracker.__new__(ThieleScoreTracker)
+        res.thiele_score = self.thiele_score
+        res.multiplicities = self.multiplicities
+        res.touched_ballots = self.touched_ballots
+        res.status = self.status.copy()
+        res.counters = [c.copy() for c in self.counters]
+        res.ballot_scores = self.ballot_scores.copy()
+        return res
+
+
+# Actions of the depth-first exploration of the ties in sequential Thiele rules
+_VISIT, _ADD, _UNDO_ADD, _REMOVE, _UNDO_REMOVE = range(5)
+
+
+class _MarginalContributionHeap:
+    """
+    Max-heap of upper bounds on the marginal contributions of the alternatives, used for the lazy evaluation of the
+    marginal contributions with submodular scores. Bounds are initially infinite and are replaced by the actual
+    marginal contributions when these are evaluated. These remain valid upper bounds as long as alternatives are only
+    added to the selection.
+    """
+
+    def __init__(self, alternatives: Iterable[Alternative] = (), heap: list = None):
+        if heap is None:
+            heap = [(-math.inf, i, alt) for i, alt in enumerate(alternatives)]
+        self.heap = heap
+
+    def best_alternatives(
+        self,
+        alternatives: set[Alternative],
+        marginal_contribution: Callable[[Alternative], Numeric],
+    ) -> tuple[Numeric | None, list[Alternative]]:
+        """
+        Returns the maximum marginal contribution among the alternatives, and all the alternatives achieving it.
+        Only the alternatives whose bound is at least the maximum are evaluated.
+
+        Parameters
+        ----------
+        alternatives : set[Alternative]
+            The alternatives that can be selected, the other alternatives in the heap are discarded.
+        marginal_contribution : Callable[[Alternative], Numeric]
+            The function computing the marginal contribution of an alternative.
+
+        Returns
+        -------
+        tuple[Numeric | None, list[Alternative]]
+            The maximum marginal contribution (None if there are no alternatives) and the alternatives achieving it.
+        """
+        heap = self.heap
+        best = None
+        evaluated = []
+        while heap:
+            neg_bound, index, alt = heap[0]
+            if alt not in alternatives:
+                heapq.heappop(heap)
+                continue
+            if best is not None and frac_lt(-neg_bound, best):
+                break
+            heapq.heappop(heap)
+            value = marginal_contribution(alt)
+            evaluated.append((value, index, alt))
+            if best is None or frac_gt(value, best):
+                best = value
+        for value, index, alt in evaluated:
+            heapq.heappush(heap, (-value, index, alt))
+        return best, [alt for value, _, alt in evaluated if frac_isclose(value, best)]
+
+    def copy(self) -> _MarginalContributionHeap:
+        return _MarginalContributionHeap(heap=self.heap.copy())
+
+
 class PAVScoreKraiczy2025(ThieleScore):
     """
     PAV scoring function as defined in Section 3.3 of
@@ -157,23 +470,34 @@ class PAVScoreKraiczy2025(ThieleScore):
         def init_vars(self) -> None:
             super().init_vars()
             self.vars["sat_vars"] = dict()
-            for i, ballot in enumerate(self.profile):
+            for i, (ballot, _) in enumerate(self.ballot_types):
+                if self.formulation == ILPFormulation.COMPACT:
+                    max_satisfaction = self.max_count(ballot.approved) + len(
+                        ballot.disapproved
+                    )
+                else:
+                    max_satisfaction = len(self.profile.alternatives)
                 sat_vars = dict()
-                for k in range(1, len(self.profile.alternatives) + 1):
+                for k in range(1, max_satisfaction + 1):
                     sat_vars[k] = LpVariable(f"s_{i}_{k}", cat=LpBinary)
+                    if self.formulation == ILPFormulation.COMPACT and k > len(
+                        ballot.disapproved
+                    ):
+                        self.size_bounded_vars.append(
+                            (sat_vars[k], k - len(ballot.disapproved))
+                        )
                 self.vars["sat_vars"][i] = sat_vars
 
             # Constraint them to ensure proper counting
-            for i, ballot in enumerate(self.profile):
+            for i, (ballot, _) in enumerate(self.ballot_types):
                 self.model += lpSum(self.vars["sat_vars"][i].values()) == lpSum(
                     self.vars["selection"][alt] for alt in ballot.approved
                 ) + lpSum(1 - self.vars["selection"][alt] for alt in ballot.disapproved)
 
         def objective(self) -> LpAffineExpression:
             return lpSum(
-                lpSum(v / k for k, v in self.vars["sat_vars"][i].items())
-                * self.profile.multiplicity(b)
-                for i, b in enumerate(self.profile)
+                lpSum(v / k for k, v in self.vars["sat_vars"][i].items()) * multiplicity
+                for i, (_, multiplicity) in enumerate(self.ballot_types)
             )
 
 
@@ -196,17 +520,28 @@ class PAVScoreTalmonPaige2021(ThieleScore):
             self.vars["app_sat_vars"] = {}
             self.vars["disapp_dissat_vars"] = {}
 
-            for i, ballot in enumerate(self.profile):
+            for i, (ballot, _) in enumerate(self.ballot_types):
+                if self.formulation == ILPFormulation.COMPACT:
+                    max_satisfaction = self.max_count(ballot.approved)
+                    max_dissatisfaction = self.max_count(ballot.disapproved)
+                else:
+                    max_satisfaction = len(self.profile.alternatives)
+                    max_dissatisfaction = len(self.profile.alternatives)
                 app_vars = {
                     k: LpVariable(f"as_{i}_{k}", cat=LpBinary)
-                    for k in range(1, len(self.profile.alternatives) + 1)
+                    for k in range(1, max_satisfaction + 1)
                 }
                 disapp_vars = {
                     k: LpVariable(f"dd_{i}_{k}", cat=LpBinary)
-                    for k in range(1, len(self.profile.alternatives) + 1)
+                    for k in range(1, max_dissatisfaction + 1)
                 }
                 self.vars["app_sat_vars"][i] = app_vars
                 self.vars["disapp_dissat_vars"][i] = disapp_vars
+                if self.formulation == ILPFormulation.COMPACT:
+                    for k, var in app_vars.items():
+                        self.size_bounded_vars.append((var, k))
+                    for k, var in disapp_vars.items():
+                        self.size_bounded_vars.append((var, k))
 
                 # Constraints
                 self.model += lpSum(app_vars.values()) == lpSum(
@@ -215,17 +550,21 @@ class PAVScoreTalmonPaige2021(ThieleScore):
                 self.model += lpSum(disapp_vars.values()) == lpSum(
                     self.vars["selection"][alt] for alt in ballot.disapproved
                 )
+                # The dissatisfaction is subtracted from the objective, the variables with the largest weights thus
+                # need to be used first
+                for k in range(1, max_dissatisfaction):
+                    self.model += disapp_vars[k] >= disapp_vars[k + 1]
 
         def objective(self) -> LpAffineExpression:
             app_term = lpSum(
                 lpSum(v / k for k, v in self.vars["app_sat_vars"][i].items())
-                * self.profile.multiplicity(ballot)
-                for i, ballot in enumerate(self.profile)
+                * multiplicity
+                for i, (_, multiplicity) in enumerate(self.ballot_types)
             )
             disapp_term = lpSum(
                 lpSum(v / k for k, v in self.vars["disapp_dissat_vars"][i].items())
-                * self.profile.multiplicity(ballot)
-                for i, ballot in enumerate(self.profile)
+                * multiplicity
+                for i, (_, multiplicity) in enumerate(self.ballot_types)
             )
             return app_term - disapp_term
 
@@ -238,6 +577,10 @@ class PAVScoreHervouin2025(ThieleScore):
     disapproved but selected alternatives.
     """
 
+    submodular = True
+
+    size_dependent = True
+
     def score_function(
         self, num_app_sel=0, num_disapp_sel=0, num_app_rej=0, num_disapp_rej=0
     ):
@@ -246,20 +589,48 @@ class PAVScoreHervouin2025(ThieleScore):
         )
 
     class _ILPBuilder(ILPBuilder):
+        # The disapproval term of the objective depends on the maximum size of the selections
+        size_dependent_model = True
+
         def init_vars(self) -> None:
             super().init_vars()
             self.vars["app_sat_vars"] = {}
             self.vars["disapp_dissat_vars"] = {}
 
-            for i, ballot in enumerate(self.profile):
-                app_vars = {
-                    k: LpVariable(f"as_{i}_{k}", cat=LpBinary)
-                    for k in range(1, len(self.profile.alternatives) + 1)
-                }
-                disapp_vars = {
-                    k: LpVariable(f"dd_{i}_{k}", cat=LpBinary)
-                    for k in range(1, len(self.profile.alternatives) + 1)
-                }
+            for i, (ballot, _) in enumerate(self.ballot_types):
+                if self.formulation == ILPFormulation.COMPACT:
+                    app_vars = {
+                        k: LpVariable(f"as_{i}_{k}", cat=LpBinary)
+                        for k in range(1, self.max_count(ballot.approved) + 1)
+                    }
+                    # The disapproval term H(max_size_selection - d) is equal to H(max_size_selection) minus the sum
+                    # of 1/k for k from max_size_selection - d + 1 to max_size_selection. The variables of index k
+                    # are the ones of the terms 1/k that are subtracted.
+                    max_size = int(self.max_size_selection)
+                    disapp_vars = {
+                        k: LpVariable(f"dd_{i}_{k}", cat=LpBinary)
+                        for k in range(
+                            max_size - self.max_count(ballot.disapproved) + 1,
+                            max_size + 1,
+                        )
+                    }
+                    self.model += lpSum(disapp_vars.values()) == lpSum(
+                        self.vars["selection"][alt] for alt in ballot.disapproved
+                    )
+                else:
+                    app_vars = {
+                        k: LpVariable(f"as_{i}_{k}", cat=LpBinary)
+                        for k in range(1, len(self.profile.alternatives) + 1)
+                    }
+                    disapp_vars = {
+                        k: LpVariable(f"dd_{i}_{k}", cat=LpBinary)
+                        for k in range(1, len(self.profile.alternatives) + 1)
+                    }
+                    self.model += lpSum(
+                        disapp_vars.values()
+                    ) == self.max_size_selection - lpSum(
+                        self.vars["selection"][alt] for alt in ballot.disapproved
+                    )
                 self.vars["app_sat_vars"][i] = app_vars
                 self.vars["disapp_dissat_vars"][i] = disapp_vars
 
@@ -267,23 +638,31 @@ class PAVScoreHervouin2025(ThieleScore):
                 self.model += lpSum(app_vars.values()) == lpSum(
                     self.vars["selection"][alt] for alt in ballot.approved
                 )
-                self.model += lpSum(
-                    disapp_vars.values()
-                ) == self.max_size_selection - lpSum(
-                    self.vars["selection"][alt] for alt in ballot.disapproved
-                )
 
         def objective(self) -> LpAffineExpression:
             app_term = lpSum(
                 lpSum(v / k for k, v in self.vars["app_sat_vars"][i].items())
-                * self.profile.multiplicity(ballot)
-                for i, ballot in enumerate(self.profile)
-            )
-            disapp_term = lpSum(
-                lpSum(v / k for k, v in self.vars["disapp_dissat_vars"][i].items())
-                * self.profile.multiplicity(ballot)
-                for i, ballot in enumerate(self.profile)
+                * multiplicity
+                for i, (_, multiplicity) in enumerate(self.ballot_types)
             )
+            if self.formulation == ILPFormulation.COMPACT:
+                max_size_score = float(harmonic_sum(int(self.max_size_selection)))
+                disapp_term = lpSum(
+                    (
+                        max_size_score
+                        - lpSum(
+                            v / k for k, v in self.vars["disapp_dissat_vars"][i].items()
+                        )
+                    )
+                    * multiplicity
+                    for i, (_, multiplicity) in enumerate(self.ballot_types)
+                )
+            else:
+                disapp_term = lpSum(
+                    lpSum(v / k for k, v in self.vars["disapp_dissat_vars"][i].items())
+                    * multiplicity
+                    for i, (_, multiplicity) in enumerate(self.ballot_types)
+                )
             return app_term + disapp_term
 
 
@@ -291,6 +670,8 @@ class ApprovalThieleScore(ThieleScore):
     """Thiele scoring function in which the score of a selection is equal to its approval score: the sum over all
     ballots of the number of approved and selected alternatives."""
 
+    submodular = True
+
     def score_function(
         self, num_app_sel=0, num_disapp_sel=0, num_app_rej=0, num_disapp_rej=0
     ):
@@ -299,9 +680,12 @@ class ApprovalThieleScore(ThieleScore):
     class _ILPBuilder(ILPBuilder):
         def init_vars(self) -> None:
             super().init_vars()
+            if self.formulation == ILPFormulation.COMPACT:
+                # The satisfaction of a ballot is directly expressed from the selection variables
+                return
             self.vars["sat_vars"] = {}
 
-            for i, ballot in enumerate(self.profile):
+            for i, (ballot, _) in enumerate(self.ballot_types):
                 sat_vars = {
                     k: LpVariable(f"s_{i}_{k}", lowBound=-1, upBound=1, cat=LpInteger)
                     for k in range(1, len(self.profile.alternatives) + 1)
@@ -314,10 +698,15 @@ class ApprovalThieleScore(ThieleScore):
                 )
 
         def objective(self) -> LpAffineExpression:
+            if self.formulation == ILPFormulation.COMPACT:
+                return lpSum(
+                    lpSum(self.vars["selection"][alt] for alt in ballot.approved)
+                    * multiplicity
+                    for ballot, multiplicity in self.ballot_types
+                )
             return lpSum(
-                lpSum(v for v in self.vars["sat_vars"][i].values())
-                * self.profile.multiplicity(ballot)
-                for i, ballot in enumerate(self.profile)
+                lpSum(v for v in self.vars["sat_vars"][i].values()) * multiplicity
+                for i, (_, multiplicity) in enumerate(self.ballot_types)
             )
 
 
@@ -326,6 +715,8 @@ class NetSupportThieleScore(ThieleScore):
     ballots of the number of approved and selected alternatives minus the number of disapproved but selected ones.
     """
 
+    submodular = True
+
     def score_function(
         self, num_app_sel=0, num_disapp_sel=0, num_app_rej=0, num_disapp_rej=0
     ):
@@ -334,9 +725,12 @@ class NetSupportThieleScore(ThieleScore):
     class _ILPBuilder(ILPBuilder):
         def init_vars(self) -> None:
             super().init_vars()
+            if self.formulation == ILPFormulation.COMPACT:
+                # The satisfaction of a ballot is directly expressed from the selection variables
+                return
             self.vars["sat_vars"] = {}
 
-            for i, ballot in enumerate(self.profile):
+            for i, (ballot, _) in enumerate(self.ballot_types):
                 sat_vars = {
                     k: LpVariable(f"s_{i}_{k}", lowBound=-1, upBound=1, cat=LpInteger)
                     for k in range(1, len(self.profile.alternatives) + 1)
@@ -350,10 +744,20 @@ class NetSupportThieleScore(ThieleScore):
                 )
 
         def objective(self) -> LpAffineExpression:
+            if self.formulation == ILPFormulation.COMPACT:
+                return lpSum(
+                    (
+                        lpSum(self.vars["selection"][alt] for alt in ballot.approved)
+                        - lpSum(
+                            self.vars["selection"][alt] for alt in ballot.disapproved
+                        )
+                    )
+                    * multiplicity
+                    for ballot, multiplicity in self.ballot_types
+                )
             return lpSum(
-                lpSum(v for v in self.vars["sat_vars"][i].values())
-                * self.profile.multiplicity(ballot)
-                for i, ballot in enumerate(self.profile)
+                lpSum(v for v in self.vars["sat_vars"][i].values()) * multiplicity
+                for i, (_, multiplicity) in enumerate(self.ballot_types)
             )
 
 
@@ -365,11 +769,18 @@ def thiele_method(
     resoluteness: bool = True,
     verbose: bool = False,
     max_seconds: int = 600,
+    warm_start: bool = False,
+    max_num_selections: int = None,
 ) -> Selection | list[Selection]:
     """
     Compute the selections of a Thiele rule described described via a :py:class:`~trivoting.rules.thiele.ThieleScore`
     class. The selections are computed by solving integer linear programs (ILP).
 
+    With `warm_start=True`, the outcome of the corresponding sequential rule (see
+    :py:func:`~trivoting.rules.thiele.sequential_thiele`) is computed first and passed to the solver as a starting
+    solution. The sequential outcome is usually close to optimal and is obtained much faster than the first incumbent
+    of the solver. The outcome of the rule does not depend on the warm start.
+
     Parameters
     ----------
     profile : AbstractTrichotomousProfile
@@ -392,6 +803,12 @@ def thiele_method(
     max_seconds : int, optional
         Time limit in seconds for the ILP solver.
         Defaults to 600.
+    warm_start : bool, optional
+        If True, the solver is started from the outcome of the sequential rule.
+        Defaults to False.
+    max_num_selections : int, optional
+        If irresolute, the maximum number of selections to return. Defaults to None, in which case all the optimal
+        selections are returned.
 
     Returns
     -------
@@ -400,14 +817,96 @@ def thiele_method(
         if irresolute (:code:`resoluteness == False`).
     """
 
+    start_selection = None
+    if warm_start:
+        start_selection = sequential_thiele(
+            profile,
+            max_size_selection,
+            thiele_score_class,
+            initial_selection=(
+                None if initial_selection is None else initial_selection.copy()
+            ),
+            lazy=True,
+        )
     ilp_builder = thiele_score_class.ilp_builder(
         profile,
         max_size_selection,
         initial_selection,
         max_seconds=max_seconds,
         verbose=verbose,
+        warm_start=start_selection,
+    )
+    return ilp_optimiser_rule(
+        ilp_builder,
+        resoluteness=resoluteness,
+        max_num_selections=max_num_selections,
+    )
+
+
+def thiele_method_size_sweep(
+    profile: AbstractTrichotomousProfile,
+    max_size_selection: int,
+    thiele_score_class: type[ThieleScore],
+    initial_selection: Selection | None = None,
+    resoluteness: bool = True,
+    verbose: bool = False,
+    max_seconds: int = 600,
+    max_num_selections: int = None,
+) -> dict[int, Selection | list[Selection]]:
+    """
+    Compute the selections of a Thiele rule, as :py:func:`~trivoting.rules.thiele.thiele_method` does, for all the
+    maximum sizes of the selections from 1 to `max_size_selection`.
+
+    The ILP is built once and only the constraint bounding the size of the selections changes between the sizes, each
+    resolution being warm-started from the optimal selection for the previous size (see
+    :py:func:`~trivoting.rules.ilp_schemes.ilp_optimiser_size_sweep`). For the scores whose ILP depends on the maximum
+    size of the selections in other ways, such as :py:class:`~trivoting.rules.thiele.PAVScoreHervouin2025`, the ILP is
+    rebuilt for each size but the resolutions are still warm-started.
+
+    Parameters
+    ----------
+    profile : AbstractTrichotomousProfile
+        The trichotomous profile.
+    max_size_selection : int
+        The largest maximum number of alternatives to select.
+    thiele_score_class : type[ThieleScore]
+        The Thiele score class used to define the Thiele rule.
+    initial_selection : Selection, optional
+        An initial partial selection fixing some alternatives as selected or rejected.
+        If `implicit_reject` is True in the initial selection, no alternatives are fixed to be rejected.
+        Defaults to None.
+    resoluteness : bool, optional
+        If True, returns a single optimal selection (resolute) for each size.
+        If False, returns all tied optimal selections (irresolute) for each size.
+        Defaults to True.
+    verbose : bool, optional
+        If True, enables ILP solver output.
+        Defaults to False.
+    max_seconds : int, optional
+        Time limit in seconds for each resolution of the ILP solver.
+        Defaults to 600.
+    max_num_selections : int, optional
+        If irresolute, the maximum number of selections to return for each size. Defaults to None, in which case all
+        the optimal selections are returned.
+
+    Returns
+    -------
+    dict[int, Selection | list[Selection]]
+        Maps each size to the selection if resolute (:code:`resoluteness == True`), or to the list of selections if
+        irresolute (:code:`resoluteness == False`).
+    """
+    ilp_builder = thiele_score_class.ilp_builder(
+        profile,
+        max_size_selection,
+        initial_selection,
+        max_seconds=max_seconds,
+        verbose=verbose,
+    )
+    return ilp_optimiser_size_sweep(
+        ilp_builder,
+        resoluteness=resoluteness,
+        max_num_selections=max_num_selections,
     )
-    return ilp_optimiser_rule(ilp_builder, resoluteness=resoluteness)
 
 
 def sequential_thiele(
@@ -417,6 +916,8 @@ def sequential_thiele(
     initial_selection: Selection | None = None,
     tie_breaking: TieBreakingRule | None = None,
     resoluteness: bool = True,
+    lazy: bool = False,
+    n_jobs: int | None = None,
 ) -> Selection | list[Selection]:
     """
     Compute the selections of a sequential Thiele rule described via a :py:class:`~trivoting.rules.thiele.ThieleScore`
@@ -426,6 +927,17 @@ def sequential_thiele(
     lead to the best improve in score. Alternatives from the current selection that have a negative marginal contribution
     to the score are removed.
 
+    With `lazy=True` and a submodular score (see :py:attr:`~trivoting.rules.thiele.ThieleScore.submodular`), the
+    marginal contributions are evaluated lazily: the alternatives are kept in a max-heap of the marginal contributions
+    computed at earlier steps, which upper bound the current ones, and only the alternatives whose bound is at least
+    the best current marginal contribution are evaluated again. The outcome is the same as with `lazy=False`. Lazy
+    evaluation is not used for scores that are not submodular, or when the initial selection already selects some
+    alternatives.
+
+    When irresolute, the branches of the first tie can be explored in parallel by a pool of `n_jobs` processes (see
+    :py:func:`~trivoting.utils.explore_ties_in_parallel`). The outcome does not depend on the number of processes. All
+    the arguments, including the tie-breaking rule, then need to be picklable.
+
     Parameters
     ----------
     profile : AbstractTrichotomousProfile
@@ -444,6 +956,12 @@ def sequential_thiele(
         If True, returns a single selection (resolute).
         If False, returns all tied optimal selections (irresolute).
         Defaults to True.
+    lazy : bool, optional
+        If True, the marginal contributions are evaluated lazily for submodular scores.
+        Defaults to False.
+    n_jobs : int, optional
+        Number of processes used to explore the ties when irresolute, a negative value meaning one per processor.
+        Defaults to None, in which case everything is run in the current process.
 
     Returns
     -------
@@ -452,100 +970,275 @@ def sequential_thiele(
         if irresolute (:code:`resoluteness == False`).
     """
 
-    def _select_next_alternative(
-        alternatives: set[Alternative], selection: Selection, skip_remove_phase=False
-    ):
-        something_changed = False
-        branched = False
-
-        # Remove alternatives that have negative marginal contributions
-        if not skip_remove_phase:
-            min_marginal_contribution = None
-            argmin_marginal_contribution = None
-            for alternative in selection.selected:
-                marginal_contribution = thiele_score.score_selection(
-                    profile, selection
-                ) - thiele_score.score_selection(
-                    profile, selection, extra_reject=[alternative]
-                )
-                if (
-                    min_marginal_contribution is None
-                    or marginal_contribution < min_marginal_contribution
-                ):
-                    min_marginal_contribution = marginal_contribution
-                    argmin_marginal_contribution = [alternative]
-                elif min_marginal_contribution == marginal_contribution:
-                    argmin_marginal_contribution.append(alternative)
-            if min_marginal_contribution is not None and min_marginal_contribution < 0:
-                tied_alternatives = tie_breaking.order(
-                    profile, argmin_marginal_contribution
-                )
-                # print(f"Removing one of {tied_alternatives} ({min_marginal_contribution})")
-                if resoluteness:
-                    alt_to_remove = tied_alternatives[0]
-                    selection.remove_selected(alt_to_remove)
-                    alternatives.add(alt_to_remove)
-                    something_changed = True
-                else:
-                    for alt_to_remove in tied_alternatives:
-                        new_selection = deepcopy(selection)
-                        new_selection.remove_selected(alt_to_remove)
-                        new_alternatives = deepcopy(alternatives)
-                        new_alternatives.add(alt_to_remove)
-                        _select_next_alternative(
-                            new_alternatives, new_selection, skip_remove_phase=True
-                        )
-                        branched = True
+    if not resoluteness and n_jobs is not None and n_jobs != 1:
+        return explore_ties_in_parallel(
+            _sequential_thiele,
+            (
+                profile,
+                max_size_selection,
+                thiele_score_class,
+                initial_selection,
+                tie_breaking,
+                resoluteness,
+                lazy,
+            ),
+            n_jobs,
+        )
+    return _sequential_thiele(
+        profile,
+        max_size_selection,
+        thiele_score_class,
+        initial_selection,
+        tie_breaking,
+        resoluteness,
+        lazy,
+    )[0]
+
+
+def sequential_thiele_size_sweep(
+    profile: AbstractTrichotomousProfile,
+    max_size_selection: int,
+    thiele_score_class: type[ThieleScore],
+    initial_selection: Selection | None = None,
+    tie_breaking: TieBreakingRule | None = None,
+    lazy: bool = False,
+) -> dict[int, Selection]:
+    """
+    Compute the selection of a sequential Thiele rule, as :py:func:`~trivoting.rules.thiele.sequential_thiele` does
+    when resolute, for all the maximum sizes of the selections from 1 to `max_size_selection`.
+
+    The rule is run once, for the largest size, and the selection is recorded the first time it reaches each size: up
+    to that point, the run is the same as the one for that size. The recorded selection is the outcome for that size
+    unless some of its alternatives have a negative marginal contribution, in which case the run for that size would
+    go on removing alternatives, and it is run separately. Scores that depend on the maximum size of the selections
+    (see :py:attr:`~trivoting.rules.thiele.ThieleScore.size_dependent`) are run separately for each size.
+
+    Parameters
+    ----------
+    profile : AbstractTrichotomousProfile
+        The trichotomous profile.
+    max_size_selection : int
+        The largest maximum number of alternatives to select.
+    thiele_score_class : type[ThieleScore]
+        The Thiele score class used to define the Thiele rule.
+    initial_selection : Selection, optional
+        An initial selection that fixes some alternatives as selected or rejected.
+        If `implicit_reject` is True, no alternatives are fixed to be rejected.
+    tie_breaking : TieBreakingRule, optional
+        Tie-breaking rule used when multiple alternatives tie.
+        Defaults to lexicographic tie-breaking.
+    lazy : bool, optional
+        If True, the marginal contributions are evaluated lazily for submodular scores.
+        Defaults to False.
+
+    Returns
+    -------
+    dict[int, Selection]
+        Maps each size to the selection.
+    """
+
+    def _run(size: int, snapshots: dict | None = None) -> Selection:
+        return _sequential_thiele(
+            profile,
+            size,
+            thiele_score_class,
+            None if initial_selection is None else initial_selection.copy(),
+            tie_breaking,
+            True,
+            lazy,
+            snapshots=snapshots,
+        )[0]
+
+    try:
+        max_size_selection = int(max_size_selection)
+    except ValueError:
+        raise ValueError("max_size_selection must be an integer.")
+
+    sizes = range(1, max_size_selection + 1)
+    if thiele_score_class.size_dependent:
+        return {size: _run(size) for size in sizes}
+
+    snapshots = dict()
+    final_selection = _run(max_size_selection, snapshots)
+    # The sizes are shifted by the size of the initial selection, as in _sequential_thiele
+    len_initial_selection = 0 if initial_selection is None else len(initial_selection)
+    outcomes = dict()
+    for size in sizes:
+        selection_size = size - len_initial_selection
+        if selection_size <= len_initial_selection:
+            # No alternative can be added, the run only removes alternatives
+            outcomes[size] = _run(size)
+        elif selection_size in snapshots:
+            selection, stable = snapshots[selection_size]
+            outcomes[size] = selection if stable else _run(size)
         else:
-            something_changed = True
+            # The selection never reached that size
+            outcomes[size] = final_selection
+    return outcomes
 
-        # Add alternative with maximum marginal contribution
-        if len(selection) < max_size_selection:
+
+def _sequential_thiele(
+    profile: AbstractTrichotomousProfile,
+    max_size_selection: int,
+    thiele_score_class: type[ThieleScore],
+    initial_selection: Selection | None,
+    tie_breaking: TieBreakingRule | None,
+    resoluteness: bool,
+    lazy: bool,
+    branch: int | None = None,
+    snapshots: dict[int, tuple[Selection, bool]] | None = None,
+) -> tuple[Selection | list[Selection], int]:
+    """
+    Computes the outcome of :py:func:`~trivoting.rules.thiele.sequential_thiele`, together with the number of branches
+    at the first tie. If `branch` is not None, only the branch of that index is explored at the first tie, see
+    :py:func:`~trivoting.utils.explore_ties_in_parallel`.
+
+    If `snapshots` is not None and the rule is resolute, the first time the selection reaches a given size, a copy of
+    it is stored in `snapshots` for that size, together with whether no selected alternative is to be removed at that
+    point.
+    """
+
+    def _alternatives_to_remove() -> list[Alternative]:
+        """Returns the selected alternatives with the most negative marginal contribution, in tie-breaking order."""
+        min_marginal_contribution = None
+        argmin_marginal_contribution = None
+        for alternative in selection.selected:
+            marginal_contribution = tracker.marginal_contribution_of_selected(
+                alternative
+            )
+            if min_marginal_contribution is None or frac_lt(
+                marginal_contribution, min_marginal_contribution
+            ):
+                min_marginal_contribution = marginal_contribution
+                argmin_marginal_contribution = [alternative]
+            elif frac_isclose(min_marginal_contribution, marginal_contribution):
+                argmin_marginal_contribution.append(alternative)
+        if min_marginal_contribution is not None and frac_lt(
+            min_marginal_contribution, 0
+        ):
+            return tie_breaking.order(profile, argmin_marginal_contribution)
+        return []
+
+    def _alternatives_to_add(
+        heap: _MarginalContributionHeap | None,
+    ) -> tuple[list[Alternative], _MarginalContributionHeap | None]:
+        """Returns the alternatives with the maximum positive marginal contribution, in tie-breaking order, together
+        with the heap of the lazy evaluation."""
+        if len(selection) >= max_size_selection:
+            return [], heap
+        if use_lazy:
+            if heap is None:
+                heap = _MarginalContributionHeap(alternatives)
+            max_marginal_contribution, argmax_marginal_contribution = (
+                heap.best_alternatives(
+                    alternatives, tracker.marginal_contribution_of_selecting
+                )
+            )
+            if len(argmax_marginal_contribution) > 1:
+                # Same order as when iterating over all the alternatives
+                tied = set(argmax_marginal_contribution)
+                argmax_marginal_contribution = [a for a in alternatives if a in tied]
+        else:
             max_marginal_contribution = None
             argmax_marginal_contribution = None
             for alternative in alternatives:
-                marginal_contribution = thiele_score.score_selection(
-                    profile, selection, extra_accept=[alternative]
-                ) - thiele_score.score_selection(profile, selection)
-                # print(alternative, thiele_score.score_selection(profile, selection, extra_accept=[alternative]), thiele_score.score_selection(profile, selection))
-                if (
-                    max_marginal_contribution is None
-                    or marginal_contribution > max_marginal_contribution
+                marginal_contribution = tracker.marginal_contribution_of_selecting(
+                    alternative
+                )
+                if max_marginal_contribution is None or frac_gt(
+                    marginal_contribution, max_marginal_contribution
                 ):
                     max_marginal_contribution = marginal_contribution
                     argmax_marginal_contribution = [alternative]
-                elif max_marginal_contribution == marginal_contribution:
+                elif frac_isclose(max_marginal_contribution, marginal_contribution):
                     argmax_marginal_contribution.append(alternative)
-            if max_marginal_contribution is not None and max_marginal_contribution > 0:
-                tied_alternatives = tie_breaking.order(
-                    profile, argmax_marginal_contribution
-                )
-                # print(f"Adding one of {tied_alternatives} ({max_marginal_contribution})")
-                if resoluteness:
-                    alt_to_add = tied_alternatives[0]
-                    selection.add_selected(alt_to_add)
-                    alternatives.remove(alt_to_add)
-                    something_changed = True
-                else:
-                    for alt_to_add in tied_alternatives:
-                        new_selection = deepcopy(selection)
-                        new_selection.add_selected(alt_to_add)
-                        new_alternatives = deepcopy(alternatives)
-                        new_alternatives.remove(alt_to_add)
-                        _select_next_alternative(new_alternatives, new_selection)
-                        branched = True
-
-        # If nothing has changed, selection is stable and we stop (only if a recursive call has not been launched)
-        if not something_changed:
-            if not branched:
-                if not resoluteness:
-                    selection.sort()
-                    if selection not in all_selections:
-                        all_selections.append(selection)
-                else:
-                    all_selections.append(selection)
+        if max_marginal_contribution is not None and frac_gt(
+            max_marginal_contribution, 0
+        ):
+            return tie_breaking.order(profile, argmax_marginal_contribution), heap
+        return [], heap
+
+    def _add(alternative: Alternative) -> None:
+        selection.add_selected(alternative)
+        tracker.update(alternative, selection)
+        alternatives.remove(alternative)
+
+    def _remove(alternative: Alternative, position: int | None = None) -> None:
+        """Removes the alternative from the selection, or inserts it back at the given position."""
+        if position is None:
+            selection.remove_selected(alternative)
+            alternatives.add(alternative)
         else:
-            _select_next_alternative(alternatives, selection)
+            selection.selected.insert(position, alternative)
+            alternatives.remove(alternative)
+        tracker.update(alternative, selection)
+
+    def _explore_ties() -> int:
+        """
+        Explores all the tie-breaking branches depth-first. A single state is maintained and each branch is undone
+        once explored, states that have already been visited through another branch are not explored again. Returns
+        the number of branches at the first tie.
+        """
+        num_branches = 0
+        found_selections = set()
+        visited_states = set()
+        # The stack contains the states to visit, together with the moves to apply and to undo
+        stack = [(_VISIT, None, False)]
+        while stack:
+            action, alternative, arg = stack.pop()
+            if action == _ADD:
+                _add(alternative)
+            elif action == _UNDO_ADD:
+                selection.remove_selected(alternative)
+                alternatives.add(alternative)
+                tracker.update(alternative, selection)
+            elif action == _REMOVE:
+                _remove(alternative)
+            elif action == _UNDO_REMOVE:
+                _remove(alternative, arg)
+            else:
+                heap, skip_remove_phase = alternative, arg
+                state = (frozenset(selection.selected), skip_remove_phase)
+                if state in visited_states:
+                    continue
+                visited_states.add(state)
+
+                moves = []
+                if not skip_remove_phase:
+                    for alt in _alternatives_to_remove():
+                        moves.append(
+                            (
+                                (_REMOVE, alt, None),
+                                (_VISIT, None, True),
+                                (_UNDO_REMOVE, alt, selection.selected.index(alt)),
+                            )
+                        )
+                to_add, heap = _alternatives_to_add(heap)
+                for alt in to_add:
+                    moves.append(
+                        (
+                            (_ADD, alt, None),
+                            (_VISIT, None if heap is None else heap.copy(), False),
+                            (_UNDO_ADD, alt, None),
+                        )
+                    )
+                if skip_remove_phase:
+                    moves.append(((_VISIT, heap, False),))
+                elif not moves:
+                    # The selection is stable
+                    result = selection.copy()
+                    result.sort()
+                    key = (tuple(result.selected), tuple(result.rejected))
+                    if key not in found_selections:
+                        found_selections.add(key)
+                        all_selections.append(result)
+                if num_branches == 0 and len(moves) > 1:
+                    num_branches = len(moves)
+                    if branch is not None:
+                        moves = moves[branch : branch + 1] if branch >= 0 else []
+                for move in reversed(moves):
+                    stack.extend(reversed(move))
+        return num_branches
 
     try:
         max_size_selection = int(max_size_selection)
@@ -560,14 +1253,35 @@ def sequential_thiele(
     else:
         initial_selection = Selection(implicit_reject=True)
 
-    initial_alternatives = {
-        a for a in profile.alternatives if a not in initial_selection
-    }
+    alternatives = {a for a in profile.alternatives if a not in initial_selection}
+    selection = initial_selection
     all_selections = []
     thiele_score = thiele_score_class(max_size_selection)
-
-    _select_next_alternative(initial_alternatives, initial_selection)
+    tracker = ThieleScoreTracker(thiele_score, profile, selection)
+    use_lazy = lazy and thiele_score.submodular and len(initial_selection) == 0
 
     if resoluteness:
-        return all_selections[0]
-    return all_selections
+        heap = None
+        something_changed = True
+        while something_changed:
+            something_changed = False
+            # Remove alternative with negative marginal contribution
+            to_remove = _alternatives_to_remove()
+            if to_remove:
+                _remove(to_remove[0])
+                # Removing an alternative can increase the marginal contributions
+                heap = None
+                something_changed = True
+            # Add alternative with maximum marginal contribution
+            to_add, heap = _alternatives_to_add(heap)
+            if to_add:
+                _add(to_add[0])
+                something_changed = True
+                if snapshots is not None and len(selection) not in snapshots:
+                    snapshots[len(selection)] = (
+                        selection.copy(),
+                        not _alternatives_to_remove(),
+                    )
+        return selection, 0
+    num_branches = _explore_ties()
+    return all_selections, num_branches
@@ -106,28 +106,44 @@ class TieBreakingRule:
         return self.order(profile, alternatives, key)[0]
 
 
-lexico_tie_breaking = TieBreakingRule(lambda prof, alt: alt.name)
+# The functions of the tie-breaking rules are defined at the module level so that the rules can be pickled, and
+# thus sent to other processes.
+
+
+def _name_key(profile, alternative):
+    return alternative.name
+
+
+def _support_key(profile, alternative):
+    return -profile.support(alternative)
+
+
+def _approval_score_key(profile, alternative):
+    return -profile.approval_score(alternative)
+
+
+lexico_tie_breaking = TieBreakingRule(_name_key)
 """
 Implements lexicographic tie breaking, i.e., tie-breaking based on the name of the alternatives.
 """
 
-support_tie_breaking = TieBreakingRule(lambda prof, alt: -prof.support(alt))
+support_tie_breaking = TieBreakingRule(_support_key)
 """
 Implements tie breaking based on the support where the projects with the highest support in the profile is selected.
 """
 
-app_score_tie_breaking = TieBreakingRule(lambda prof, alt: -prof.approval_score(alt))
+app_score_tie_breaking = TieBreakingRule(_approval_score_key)
 """
 Implements tie breaking based on the approval score where the projects with the highest approval score in the profile
  is selected.
 """
 
 
-def refuse_tie_breaking(profile, alternative):
+def _refuse_key(profile, alternative):
     raise TieBreakingException("A tie occurred, but no tie-breaking rule was provided.")
 
 
-refuse_tie_breaking = TieBreakingRule(refuse_tie_breaking)
+refuse_tie_breaking = TieBreakingRule(_refuse_key)
 """
 Special tie-breaking function that simply raises an error when a tie needs to be broken.
 """
@@ -1,7 +1,9 @@
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations
 
-from trivoting.fractions import frac
+import trivoting.fractions
+from trivoting.fractions import frac, Numeric
 
 
 def generate_subsets(
@@ -72,8 +74,107 @@ def generate_two_list_partitions(
                     yield list(part1), part2
 
 
-def harmonic_sum(k: int):
-    return sum(frac(1, i) for i in range(1, k + 1))
+def popcount(mask: int) -> int:
+    """
+    Returns the number of bits set to 1 in the binary representation of a non-negative integer.
+
+    Parameters
+    ----------
+    mask : int
+        The integer.
+
+    Returns
+    -------
+    int
+        The number of bits set to 1.
+    """
+    return bin(mask).count("1")
+
+
+_HARMONIC_NUMBERS = dict()
+"""Tables of the harmonic numbers computed so far, one per value of :py:data:`~trivoting.fractions.FRACTION`."""
+
+
+def harmonic_sum(k: int) -> Numeric:
+    """
+    Returns the `k`-th harmonic number, i.e., the sum of `1/i` for `i` from 1 to `k`, and 0 for non-positive `k`.
+    Harmonic numbers are stored in a table, shared across calls, that is extended as needed. A separate table is kept
+    for each fraction mode (see :py:data:`~trivoting.fractions.FRACTION`).
+
+    Parameters
+    ----------
+    k : int
+        The index of the harmonic number.
+
+    Returns
+    -------
+    Numeric
+        The harmonic number.
+    """
+    if k <= 0:
+        return 0
+    table = _HARMONIC_NUMBERS.get(trivoting.fractions.FRACTION)
+    if table is None:
+        table = [0]
+        _HARMONIC_NUMBERS[trivoting.fractions.FRACTION] = table
+    while len(table) <= k:
+        table.append(table[-1] + frac(1, len(table)))
+    return table[k]
+
+
+def _explore_branch(search: Callable, args: tuple, branch: int, fraction: str) -> list:
+    """Explores a single branch of a search in a worker process, using the fraction mode of the parent process."""
+    trivoting.fractions.FRACTION = fraction
+    return search(*args, branch=branch)[0]
+
+
+def explore_ties_in_parallel(search: Callable, args: tuple, n_jobs: int) -> list:
+    """
+    Runs an irresolute search, distributing the branches of its first tie over a pool of processes. The search is
+    first run up to its first tie, then each of the tied branches is explored in a separate task. The outcomes of the
+    branches are merged in the order of the branches and deduplicated, so that the output does not depend on the
+    number of processes and is the same as the one of the sequential search.
+
+    The search function is called as :code:`search(*args, branch=branch)` and must return a tuple consisting of the
+    list of the selections found and of the number of branches at the first tie. If `branch` is a non-negative integer, only
+    the branch of that index is explored at the first tie, if it is negative, none of them is. The search function and
+    its arguments must be picklable.
+
+    Parameters
+    ----------
+    search : Callable
+        The search function.
+    args : tuple
+        The positional arguments of the search function.
+    n_jobs : int
+        The number of processes to use, a negative value meaning as many processes as there are processors.
+
+    Returns
+    -------
+    list[Selection]
+        The selections found by the search.
+    """
+    outcomes, num_branches = search(*args, branch=-1)
+    if num_branches <= 1:
+        # The search never branched and has been fully run
+        return outcomes
+    with ProcessPoolExecutor(max_workers=n_jobs if n_jobs > 0 else None) as executor:
+        branch_outcomes = executor.map(
+            _explore_branch,
+            [search] * num_branches,
+            [args] * num_branches,
+            range(num_branches),
+            [trivoting.fractions.FRACTION] * num_branches,
+        )
+        merged_outcomes = []
+        seen_outcomes = set()
+        for outcomes in branch_outcomes:
+            for outcome in outcomes:
+                key = (tuple(outcome.selected), tuple(outcome.rejected))
+                if key not in seen_outcomes:
+                    seen_outcomes.add(key)
+                    merged_outcomes.append(outcome)
+    return merged_outcomes
 
 
 class classproperty(property):